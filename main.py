@@ -15,19 +15,23 @@ from src.dependencies import check_user_status, user_auth
 from src.middleware import (
     AssertPermissionMiddleware,
     HTTPLoggerMiddleware,
+    JSONCompressionMiddleware,
 )
 
 # Route
 from src.routes import root_router
 
 # Logger
-from src.util import LOGGING_CONFIG
+from src.util import LOGGING_CONFIG, close_img_url_client
 
 logging.config.dictConfig(LOGGING_CONFIG)
 
 # RabbitMQ
 from src.amqp import mq_client
 from src.core import logger
+from src.db import AsyncDBSessionFactory
+from src.dependencies import BotHTTPClientFactory
+from src.storage import image_variant_worker
 
 
 # Lifespan
@@ -46,9 +50,16 @@ async def lifespan(app: FastAPI):
             logger.error("Startup Failed: RabbitMQ is required but could not connect.")
             raise
 
+    # open the shared bot HTTP client up front so the first request does not pay for it
+    BotHTTPClientFactory().get_client()
+
     yield
 
     await mq_client.close()
+    await BotHTTPClientFactory().teardown()
+    await close_img_url_client()
+    await image_variant_worker.shutdown()
+    await AsyncDBSessionFactory().teardown()
 
 
 app = FastAPI(
@@ -71,8 +82,11 @@ if get_settings().cors_all_accept:
 
 # Custom middleware follows
 # NOTE: Starlette executes middlewares in reverse order of addition.
-# Request flow (outer -> inner): HTTPLogger -> AssertPermission
+# Request flow (outer -> inner): HTTPLogger -> JSONCompression -> AssertPermission
 app.add_middleware(AssertPermissionMiddleware)
+app.add_middleware(
+    JSONCompressionMiddleware, minimum_size=get_settings().json_compression_min_size
+)
 app.add_middleware(HTTPLoggerMiddleware)
 
 app.include_router(root_router)
@@ -0,0 +1,116 @@
+"""
+Publish throughput and RPC head-of-line latency with one vs. several AMQP channels.
+
+Runs `BackgroundPublisher` and `ChannelPool` against an in-process broker stand-in:
+each fake channel confirms its publishes one at a time after `--confirm-ms`, like a
+broker that acks in order per channel. A burst of `--messages` fire-and-forget
+publishes is queued, and while it drains a single RPC-style publish is timed, as
+`send_discord_bot_request` would be.
+
+The fire-and-forget messages share a routing key, so they stay on one pinned channel
+and must arrive in the order they were published; the extra channels keep the RPC
+from waiting behind them.
+
+Usage:
+    python script/benchmarks/amqp_channel_pool.py --messages 2000 --confirm-ms 2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.amqp.channel_pool import ChannelPool  # noqa: E402
+from src.amqp.outbox import MessageOutbox  # noqa: E402
+from src.amqp.publisher import BackgroundPublisher  # noqa: E402
+
+
+class _FakeExchange:
+    def __init__(self, channel: "_FakeChannel"):
+        self._channel = channel
+
+    async def publish(self, message, routing_key: str) -> None:
+        # frames are written in call order; confirms follow one after another
+        self._channel.received.append(message.body if message else None)
+        async with self._channel.lock:
+            await asyncio.sleep(self._channel.confirm_seconds)
+            self._channel.confirmed += 1
+
+
+class _FakeChannel:
+    def __init__(self, confirm_seconds: float):
+        self.confirm_seconds = confirm_seconds
+        self.lock = asyncio.Lock()
+        self.confirmed = 0
+        self.received: list[bytes | None] = []
+        self.is_closed = False
+        self.default_exchange = _FakeExchange(self)
+
+    async def close(self) -> None:
+        self.is_closed = True
+
+
+class _FakeConnection:
+    def __init__(self, confirm_seconds: float):
+        self.confirm_seconds = confirm_seconds
+        self.channels: list[_FakeChannel] = []
+
+    async def channel(self) -> _FakeChannel:
+        channel = _FakeChannel(self.confirm_seconds)
+        self.channels.append(channel)
+        return channel
+
+
+async def _run(pool_size: int, messages: int, confirm_seconds: float) -> None:
+    connection = _FakeConnection(confirm_seconds)
+    pool = ChannelPool(pool_size)
+    await pool.open(connection)  # type: ignore[arg-type]
+    outbox = MessageOutbox(os.path.join(tempfile.mkdtemp(), "outbox.sqlite3"))
+    publisher = BackgroundPublisher(outbox, maxsize=messages, confirm_timeout=60)
+    publisher.start(pool)
+
+    start = time.perf_counter()
+    for i in range(messages):
+        await publisher.publish("bench", str(i).encode())
+    while not sum(pool.in_flight):  # let the first batch reach the channels
+        await asyncio.sleep(0.001)
+
+    rpc_start = time.perf_counter()
+    async with pool.acquire() as channel:
+        await channel.default_exchange.publish(None, routing_key="bench")
+    rpc_latency = time.perf_counter() - rpc_start
+    peak_in_flight = sum(pool.in_flight)
+
+    while sum(c.confirmed for c in connection.channels) < messages + 1:
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - start
+    await publisher.stop()
+    await pool.close()
+
+    assert outbox.count() == 0, "no message may fall back to the outbox"
+    received = [body for c in connection.channels for body in c.received if body]
+    assert received == [str(i).encode() for i in range(messages)], "out of order"
+    print(
+        f"channels={pool_size} throughput={messages / elapsed:8.0f} msg/s "
+        f"rpc_latency={rpc_latency * 1e3:7.1f} ms in_flight_after_rpc={peak_in_flight}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--confirm-ms", type=float, default=2)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    for size in args.pool_sizes:
+        asyncio.run(_run(size, args.messages, args.confirm_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Concurrent-request latency: sync `SessionDep` vs async `AsyncSessionDep`.
+
+Simulates `--concurrency` route handlers running on one event loop, each issuing a
+query that takes `--query-ms` on the database side (`pg_sleep`). With the sync
+session every query blocks the loop, so latencies pile up; with the async session
+the queries overlap.
+
+Usage (inside the backend container, where `.env` points at the database):
+    python script/benchmarks/async_session.py --concurrency 50 --query-ms 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text  # noqa: E402
+
+from src.db import AsyncDBSessionFactory, DBSessionFactory  # noqa: E402
+
+
+def _query(query_ms: int):
+    return text("SELECT pg_sleep(:seconds)").bindparams(seconds=query_ms / 1000)
+
+
+async def _sync_handler(query_ms: int) -> float:
+    start = time.perf_counter()
+    session = DBSessionFactory().make_session()
+    try:
+        session.execute(_query(query_ms))
+    finally:
+        session.close()
+    return time.perf_counter() - start
+
+
+async def _async_handler(query_ms: int) -> float:
+    start = time.perf_counter()
+    async with AsyncDBSessionFactory().make_session() as session:
+        await session.execute(_query(query_ms))
+    return time.perf_counter() - start
+
+
+async def _run(name: str, handler, concurrency: int, query_ms: int) -> None:
+    # warm up the connection pool so connection setup is not measured
+    await asyncio.gather(*(handler(0) for _ in range(concurrency)))
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(handler(query_ms) for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p95 = latencies_ms[max(0, int(len(latencies_ms) * 0.95) - 1)]
+    print(
+        f"{name:<6} wall={wall * 1000:8.1f}ms  "
+        f"p50={statistics.median(latencies_ms):8.1f}ms  "
+        f"p95={p95:8.1f}ms  max={latencies_ms[-1]:8.1f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--query-ms", type=int, default=20)
+    args = parser.parse_args()
+
+    await _run("sync", _sync_handler, args.concurrency, args.query_ms)
+    await _run("async", _async_handler, args.concurrency, args.query_ms)
+
+    DBSessionFactory().teardown()
+    await AsyncDBSessionFactory().teardown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""
+Latency of bot HTTP calls: a new `httpx.AsyncClient` per request vs. the shared,
+keep-alive client from `BotHTTPClientFactory`.
+
+Starts a local stub of the bot's `/status` endpoint and calls it `--requests` times
+with each strategy, `--concurrency` calls at a time. A per-request client has to
+resolve the host and open a new TCP connection each time; the shared one reuses
+pooled connections.
+
+Usage:
+    python script/benchmarks/bot_http_client.py --requests 500 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import httpx  # noqa: E402
+
+from src.dependencies.http_client import (  # noqa: E402
+    BOT_HTTP_TIMEOUT,
+    BotHTTPClientFactory,
+)
+
+_BODY = b'{"logged_in": true}'
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+    b"Content-Length: %d\r\n\r\n%s" % (len(_BODY), _BODY)
+)
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # a minimal keep-alive HTTP/1.1 server that answers every GET with _RESPONSE
+    try:
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _per_request(url: str) -> float:
+    start = time.perf_counter()
+    async with httpx.AsyncClient(timeout=BOT_HTTP_TIMEOUT) as client:
+        (await client.get(url)).raise_for_status()
+    return time.perf_counter() - start
+
+
+async def _shared(url: str) -> float:
+    start = time.perf_counter()
+    (await BotHTTPClientFactory().get_client().get(url)).raise_for_status()
+    return time.perf_counter() - start
+
+
+async def _measure(handler, url: str, requests: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> float:
+        async with semaphore:
+            return await handler(url)
+
+    return await asyncio.gather(*(one() for _ in range(requests)))
+
+
+async def _main(requests: int, concurrency: int) -> None:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    # use a host name, like http://bot:8081, so the per-request client also resolves it
+    url = f"http://localhost:{port}/status"
+
+    async with server:
+        for name, handler in (("per-request", _per_request), ("shared", _shared)):
+            await _measure(handler, url, concurrency, concurrency)  # warm up
+            start = time.perf_counter()
+            latencies = await _measure(handler, url, requests, concurrency)
+            elapsed = time.perf_counter() - start
+            latencies.sort()
+            print(
+                f"{name:<12} mean={statistics.mean(latencies) * 1e3:6.2f} ms "
+                f"p95={latencies[int(len(latencies) * 0.95) - 1] * 1e3:6.2f} ms "
+                f"throughput={requests / elapsed:7.0f} req/s"
+            )
+        await BotHTTPClientFactory().teardown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(_main(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Blacklist lookup cost: per-request SQL LIKE query vs the in-memory `LikePatternMatcher`.
+
+Loads `--rules` random rules (a mix of literal paths and `%`/`_` patterns) into an
+in-memory SQLite table, then checks `--requests` random (method, path) pairs with
+both approaches and verifies that they agree.
+
+Usage:
+    python script/benchmarks/check_user_status_rule.py --rules 300 --requests 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine, literal, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.model import CheckUserStatusRule, HTTPMethod  # noqa: E402
+from src.util import LikePatternMatcher  # noqa: E402
+
+SEGMENTS = ["api", "sig", "pig", "article", "board", "user", "file", "comment", "w"]
+
+
+def _random_path(rng: random.Random) -> str:
+    depth = rng.randint(2, 4)
+    parts = [rng.choice(SEGMENTS) for _ in range(depth)]
+    if rng.random() < 0.5:
+        parts.append(str(rng.randint(1, 50)))
+    return "/" + "/".join(parts)
+
+
+def _random_rule(rng: random.Random) -> tuple[HTTPMethod, str]:
+    method = rng.choice(list(HTTPMethod))
+    path = _random_path(rng)
+    roll = rng.random()
+    if roll < 0.4:
+        path = path.rsplit("/", 1)[0] + "/%"
+    elif roll < 0.5:
+        path = path[:-1] + "_"
+    return method, path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rules", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rules = {_random_rule(rng) for _ in range(args.rules)}
+    requests = [
+        (rng.choice(list(HTTPMethod)).value, _random_path(rng))
+        for _ in range(args.requests)
+    ]
+
+    engine = create_engine("sqlite://")
+    CheckUserStatusRule.__table__.create(engine)
+    with Session(engine) as session:
+        session.add_all(CheckUserStatusRule(method=m, path=p) for m, p in rules)
+        session.commit()
+
+        start = time.perf_counter()
+        sql_results = []
+        for method, path in requests:
+            stmt = select(CheckUserStatusRule.id).where(
+                CheckUserStatusRule.method == HTTPMethod(method),
+                literal(path).like(CheckUserStatusRule.path),
+            )
+            sql_results.append(session.scalars(stmt).first() is not None)
+        sql_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = LikePatternMatcher(
+            (r.method.value, r.path)
+            for r in session.scalars(select(CheckUserStatusRule))
+        )
+        build_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher_results = [matcher.matches(method, path) for method, path in requests]
+    matcher_elapsed = time.perf_counter() - start
+
+    assert sql_results == matcher_results, "matcher disagrees with SQL LIKE"
+    n = len(requests)
+    print(f"rules={len(rules)} requests={n} blacklisted={sum(matcher_results)}")
+    print(f"sql like : {sql_elapsed * 1e6 / n:8.1f} us/request")
+    print(
+        f"matcher  : {matcher_elapsed * 1e6 / n:8.1f} us/request (build {build_elapsed * 1e3:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
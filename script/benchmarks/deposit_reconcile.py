@@ -0,0 +1,151 @@
+"""
+Latency and query count of reconciling a bank deposit export.
+
+Seeds users, unchecked standby requests and past enrollments on an in-memory SQLite
+database, then runs `DepositReconciler` over a synthetic export: half of the rows
+name a standby request ("name+last 2 phone digits"), the other half only name a
+user. Lookups are preloaded in a fixed number of statements, so the read query
+count must not grow with the number of rows. Enrollments are inserted for the whole
+batch at once; standby requests and users are still flushed row by row so that a
+failing record does not take the rest of the export down with it. Role levels are read through the
+application engine, so it is pointed at a temporary SQLite file.
+
+Usage:
+    python script/benchmarks/deposit_reconcile.py --rows 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+os.environ.setdefault(
+    "SQLITE_FILENAME", str(Path(tempfile.mkdtemp()) / "deposit_reconcile.sqlite3")
+)
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.core import get_settings, logger  # noqa: E402
+from src.db import DBSessionFactory  # noqa: E402
+from src.db.engine import Transaction  # noqa: E402
+from src.model import (  # noqa: E402
+    Enrollment,
+    SCSCGlobalStatus,
+    SCSCStatus,
+    StandbyReqTbl,
+    User,
+    UserRole,
+)
+from src.repositories.user import (  # noqa: E402
+    EnrollmentRepository,
+    StandbyReqTblRepository,
+    UserRepository,
+)
+from src.services.user import DepositReconciler  # noqa: E402
+from src.util import DepositDTO  # noqa: E402
+
+YEAR, SEMESTER = 2025, 1
+
+
+def _name(i: int) -> str:
+    return f"사용자{chr(0xAC00 + i)}"
+
+
+def _seed(engine, rows: int) -> list[DepositDTO]:
+    for model in (UserRole, User, StandbyReqTbl, Enrollment):
+        model.__table__.create(engine)
+    deposits = []
+    with Session(engine) as session:
+        for level, name in ((100, "dormant"), (200, "newcomer"), (300, "member")):
+            session.add(UserRole(level=level, name=name, kor_name=name))
+        for i in range(rows):
+            user = User(
+                id=f"user-{i}",
+                email=f"{i}@example.com",
+                name=_name(i),
+                phone=f"010{i:08d}",
+                student_id=f"2020{i:05d}",
+                role=100,
+                major_id=1,
+            )
+            session.add(user)
+            if i % 3 == 0:
+                session.add(Enrollment(year=2024, semester=2, user_id=user.id))
+            if i % 2 == 0:
+                session.add(
+                    StandbyReqTbl(
+                        standby_user_id=user.id,
+                        user_name=user.name,
+                        deposit_name=f"{user.name}{user.phone[-2:]}",
+                    )
+                )
+                deposit_name = f"{user.name}{user.phone[-2:]}"
+            else:
+                deposit_name = user.name
+            deposits.append(
+                DepositDTO(
+                    amount=get_settings().enrollment_fee,
+                    deposit_time=datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc),
+                    deposit_name=deposit_name,
+                )
+            )
+        session.commit()
+    return deposits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    engine = DBSessionFactory().get_engine()
+    deposits = _seed(engine, args.rows)
+
+    selects = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, *_):
+        nonlocal selects
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects += 1
+
+    status = SCSCGlobalStatus(
+        id=1, status=SCSCStatus.active, year=YEAR, semester=SEMESTER
+    )
+    with Session(engine) as session:
+        transaction = Transaction(session)
+        reconciler = DepositReconciler(
+            StandbyReqTblRepository(session, transaction),
+            UserRepository(session, transaction),
+            EnrollmentRepository(session, transaction),
+            status,
+            lambda: (YEAR, SEMESTER),
+        )
+        start = time.perf_counter()
+        reconciler.preload(deposits)
+        preload_selects = selects
+        results = [reconciler.reconcile(deposit) for deposit in deposits]
+        reconciler.flush_enrollments()
+        session.commit()
+        elapsed = time.perf_counter() - start
+
+    succeeded = sum(result.result_code == 200 for result in results)
+    print(
+        f"rows={args.rows} succeeded={succeeded} "
+        f"selects(preload)={preload_selects} selects(total)={selects} "
+        f"elapsed={elapsed * 1e3:.1f} ms"
+    )
+    assert succeeded == args.rows, {r.result_code for r in results}
+    # role levels are looked up once per reconciler, not once per row
+    assert selects - preload_selects <= 3, "matching must not query per row"
+
+
+if __name__ == "__main__":
+    main()
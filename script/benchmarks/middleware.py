@@ -0,0 +1,128 @@
+"""
+Requests/sec through the full app: pure ASGI middlewares vs `BaseHTTPMiddleware`.
+
+Runs `--requests` requests with `--concurrency` in-flight clients against `main.app`
+over `httpx.ASGITransport` (no network), once with the current pure ASGI
+`HTTPLoggerMiddleware`/`AssertPermissionMiddleware` and once with the previous
+`BaseHTTPMiddleware` implementations swapped in.
+
+Usage (inside the backend container, where `.env` points at the database):
+    python script/benchmarks/middleware.py --board-id 1 --requests 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import httpx  # noqa: E402
+from fastapi import Request  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from main import app  # noqa: E402
+from src.db import DBSessionFactory, get_user_role_level  # noqa: E402
+from src.dependencies import resolve_request_user  # noqa: E402
+from src.middleware import (  # noqa: E402
+    AssertPermissionMiddleware,
+    HTTPLoggerMiddleware,
+)
+from src.util import request_id_var  # noqa: E402
+
+
+class LegacyHTTPLoggerMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request_id_var.set("benchmark")
+        start_time = time.time()
+        logging.getLogger("http_access").info(
+            f"Request: {request.method} {request.url.path}"
+        )
+        response = await call_next(request)
+        logging.getLogger("http_access").info(
+            f"Response: status_code={response.status_code} "
+            f"duration={(time.time() - start_time) * 1000:.2f}ms"
+        )
+        return response
+
+
+class LegacyAssertPermissionMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path.startswith("/api/executive") and request.method in (
+            "GET",
+            "POST",
+        ):
+            session = DBSessionFactory().make_session()
+            try:
+                user = resolve_request_user(request, session)
+            finally:
+                session.close()
+            request.state.user = user
+            if user is None or user.role < get_user_role_level("executive"):
+                return JSONResponse(status_code=403, content={"detail": "denied"})
+        return await call_next(request)
+
+
+LEGACY = {
+    HTTPLoggerMiddleware: LegacyHTTPLoggerMiddleware,
+    AssertPermissionMiddleware: LegacyAssertPermissionMiddleware,
+}
+
+
+def _use_middlewares(legacy: bool) -> None:
+    original = [
+        m
+        for m in app.user_middleware
+        if m.cls not in LEGACY.values() and m.cls not in LEGACY
+    ]
+    stack = [
+        Middleware(cls) for cls in (HTTPLoggerMiddleware, AssertPermissionMiddleware)
+    ]
+    if legacy:
+        stack = [Middleware(LEGACY[m.cls]) for m in stack]
+    app.user_middleware = original + stack
+    app.middleware_stack = None
+
+
+async def _run(path: str, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.get(path)
+        remaining = requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get(path)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--board-id", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.getLogger("http_access").setLevel(logging.WARNING)
+    for path in ("/health", f"/api/articles/{args.board_id}"):
+        for legacy in (True, False):
+            _use_middlewares(legacy)
+            rps = asyncio.run(_run(path, args.requests, args.concurrency))
+            label = "BaseHTTPMiddleware" if legacy else "pure ASGI"
+            print(f"{path:<24} {label:<20} {rps:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Queries and latency of `GET /api/sig/{id}/members`-style member listings.
+
+Compares the previous per-member `UserRepository.get_by_id` loop with the joined
+`SigMemberRepository.get_members_with_users_by_sig_id` query on an in-memory
+SQLite database, counting SQL statements per request. The joined path must issue
+exactly one statement regardless of the member count.
+
+Usage:
+    python script/benchmarks/sigpig_members.py --members 60 --repeat 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from src.model import SIGMember, User  # noqa: E402
+from src.repositories.sig import SigMemberRepository  # noqa: E402
+from src.repositories.user import UserRepository  # noqa: E402
+from src.schemas import SigMemberResponse, UserResponse  # noqa: E402
+
+
+def _seed(engine, members: int) -> None:
+    User.__table__.create(engine)
+    SIGMember.__table__.create(engine)
+    with Session(engine) as session:
+        for i in range(members):
+            session.add(
+                User(
+                    id=f"user-{i}",
+                    email=f"{i}@example.com",
+                    name=f"User-{i}",
+                    phone=f"010{i:08d}",
+                    student_id=f"2020{i:05d}",
+                    role=300,
+                    major_id=1,
+                )
+            )
+            session.add(SIGMember(ig_id=1, user_id=f"user-{i}"))
+        session.commit()
+
+
+def _per_member(session: Session) -> list[SigMemberResponse]:
+    members = SigMemberRepository(session, None).get_members_by_sig_id(1)  # type: ignore[arg-type]
+    users = UserRepository(session, None)  # type: ignore[arg-type]
+    res = []
+    for member in members:
+        user = users.get_by_id(member.user_id)
+        res.append(
+            SigMemberResponse(
+                id=member.id,
+                ig_id=member.ig_id,
+                user_id=member.user_id,
+                created_at=member.created_at,
+                user=UserResponse.model_validate(user) if user else None,
+            )
+        )
+    return res
+
+
+def _joined(session: Session) -> list[SigMemberResponse]:
+    rows = SigMemberRepository(session, None).get_members_with_users_by_sig_id(1)  # type: ignore[arg-type]
+    return [
+        SigMemberResponse(
+            id=member.id,
+            ig_id=member.ig_id,
+            user_id=member.user_id,
+            created_at=member.created_at,
+            user=UserResponse.model_validate(user) if user else None,
+        )
+        for member, user in rows
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    _seed(engine, args.members)
+
+    statements = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(*_):
+        nonlocal statements
+        statements += 1
+
+    for name, handler in (("per-member", _per_member), ("joined", _joined)):
+        statements = 0
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            # a fresh session per request, like SessionDep
+            with Session(engine) as session:
+                result = handler(session)
+        elapsed = time.perf_counter() - start
+        per_request = statements / args.repeat
+        assert len(result) == args.members and all(r.user for r in result)
+        print(
+            f"{name:<10} queries/request={per_request:5.1f} "
+            f"latency={elapsed * 1e3 / args.repeat:7.2f} ms"
+        )
+        if name == "joined":
+            assert per_request == 1, "joined member listing must issue one query"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+-- Backs keyset pagination of /api/articles/{board_id}/page,
+-- ordered by (created_at DESC, id DESC) within a board.
+CREATE INDEX idx_article_board_created_at_id ON public.article USING btree (board_id, created_at DESC, id DESC);
@@ -0,0 +1,4 @@
+-- Plain-text preview and word count computed when an article is written.
+-- NULL for articles written before this migration; readers fall back to the body.
+ALTER TABLE public.article ADD COLUMN excerpt text;
+ALTER TABLE public.article ADD COLUMN word_count bigint;
@@ -0,0 +1,5 @@
+-- Article bodies move to a content-addressed blob store (ARTICLE_BLOB_DIR).
+-- content_hash is the SHA-256 hex digest of the body; NULL means the body is still
+-- in the legacy ARTICLE_DIR/{id}.md file.
+ALTER TABLE public.article ADD COLUMN content_hash text;
+CREATE INDEX idx_article_content_hash ON public.article USING btree (content_hash);
@@ -0,0 +1,27 @@
+-- Full-text search over articles and comments.
+-- Article bodies live in the blob store, so a searchable copy of title and body is
+-- kept in article_search by the application; rows missing here (articles written
+-- before this migration) are filled by POST /api/executive/article/search/reindex.
+-- The 'simple' configuration is used because Korean has no built-in stemmer.
+
+CREATE TABLE public.article_search (
+    article_id bigint NOT NULL,
+    title text NOT NULL,
+    body text NOT NULL,
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')
+    ) STORED,
+    CONSTRAINT article_search_pkey PRIMARY KEY (article_id),
+    CONSTRAINT article_search_article_id_fkey FOREIGN KEY (article_id) REFERENCES public.article(id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_article_search_vector ON public.article_search USING gin (search_vector);
+
+INSERT INTO public.article_search (article_id, title, body)
+SELECT id, title, '' FROM public.article;
+
+ALTER TABLE public.comment ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    to_tsvector('simple', content)
+) STORED;
+
+CREATE INDEX idx_comment_search_vector ON public.comment USING gin (search_vector);
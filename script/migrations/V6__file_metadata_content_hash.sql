@@ -0,0 +1,7 @@
+-- Uploaded files are deduplicated by content.
+-- content_hash is the SHA-256 hex digest of the file. storage_name is the name of the
+-- file on disk under FILE_DIR or IMAGE_DIR, shared by every row with the same content.
+-- NULL in both means a file uploaded before deduplication, stored as {id}.{ext}.
+ALTER TABLE public.file_metadata ADD COLUMN content_hash text;
+ALTER TABLE public.file_metadata ADD COLUMN storage_name text;
+CREATE INDEX idx_file_metadata_content_hash ON public.file_metadata USING btree (content_hash);
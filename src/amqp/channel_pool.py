@@ -0,0 +1,80 @@
+import asyncio
+import zlib
+from contextlib import asynccontextmanager
+from itertools import count
+from typing import AsyncIterator
+
+from aio_pika.abc import AbstractChannel, AbstractConnection
+
+
+class ChannelPool:
+    """
+    A fixed set of channels on one connection, handed out least-busy first.
+
+    Every publish holds a channel only while it waits for its publisher confirm, so
+    a slow confirm on one channel no longer blocks the publishes and RPCs queued
+    behind it. Ties are broken round-robin so that idle channels share the load.
+
+    Publishes that must keep their order pass a `key` instead and always get the
+    same channel for it: the broker only keeps the order of messages published on
+    one channel. The channels are publish-only, so no QoS is set on them.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("channel pool size must be at least 1")
+        self.size = size
+        self._channels: list[AbstractChannel] = []
+        self._in_flight: list[int] = []
+        self._turn = count()
+
+    async def open(self, connection: AbstractConnection) -> None:
+        channels = await asyncio.gather(
+            *(connection.channel() for _ in range(self.size))
+        )
+        self._channels = list(channels)
+        self._in_flight = [0] * self.size
+
+    async def close(self) -> None:
+        channels, self._channels = self._channels, []
+        self._in_flight = []
+        for channel in channels:
+            if not channel.is_closed:
+                await channel.close()
+
+    @property
+    def is_closed(self) -> bool:
+        return not self._channels or all(c.is_closed for c in self._channels)
+
+    @property
+    def in_flight(self) -> list[int]:
+        """Number of publishes currently waiting on each channel."""
+        return list(self._in_flight)
+
+    def _select(self, key: str | None) -> int:
+        if key is not None and self._channels:
+            i = zlib.crc32(key.encode()) % len(self._channels)
+            if self._channels[i].is_closed:
+                raise RuntimeError("RabbitMQ channel for the key is closed.")
+            return i
+        turn = next(self._turn)
+        candidates = [
+            (busy, (i - turn) % len(self._channels), i)
+            for i, (busy, channel) in enumerate(zip(self._in_flight, self._channels))
+            if not channel.is_closed
+        ]
+        if not candidates:
+            raise RuntimeError("RabbitMQ client is not connected.")
+        return min(candidates)[2]
+
+    @asynccontextmanager
+    async def acquire(self, key: str | None = None) -> AsyncIterator[AbstractChannel]:
+        i = self._select(key)
+        channel = self._channels[i]
+        self._in_flight[i] += 1
+        try:
+            yield channel
+        finally:
+            # the pool may have been closed while the publish was pending
+            if i < len(self._channels) and self._channels[i] is channel:
+                self._in_flight[i] -= 1
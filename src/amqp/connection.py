@@ -6,6 +6,13 @@ from typing import Any
 import aio_pika
 
 from src.core import get_settings, logger
+from src.util import TTLCache
+
+from .channel_pool import ChannelPool
+from .outbox import MessageOutbox
+from .publisher import BackgroundPublisher
+
+RPC_CACHE_MAX_TTL = 3600
 
 
 class RabbitMQClient:
@@ -15,10 +22,23 @@ class RabbitMQClient:
         self.callback_queue = None
         self.consumer_tag = None
         self.futures: dict[str, asyncio.Future[Any]] = {}
+        # single-flight and reply cache for RPCs, keyed by (action_code, body json)
+        self._rpc_in_flight: dict[tuple[int, str], asyncio.Future[Any]] = {}
+        self._rpc_cache: TTLCache[tuple[int, str], tuple[Any]] = TTLCache(
+            maxsize=256, ttl=RPC_CACHE_MAX_TTL
+        )
         self._lock = asyncio.Lock()
+        self.channel_pool = ChannelPool(get_settings().amqp_channel_pool_size)
+        self.publisher = BackgroundPublisher(
+            MessageOutbox(get_settings().amqp_outbox_path),
+            maxsize=get_settings().amqp_publish_queue_size,
+        )
 
     async def connect(self, retries: int = 5, delay: int = 5):
-        """Initializes connection, channel, and the callback consumer."""
+        """
+        Initializes connection, the callback consumer channel, and the channel pool
+        used for publishing.
+        """
         async with self._lock:
             if self.connection and not self.connection.is_closed:
                 return
@@ -38,6 +58,11 @@ class RabbitMQClient:
                         self.on_response, no_ack=True
                     )
 
+                    await self.channel_pool.open(self.connection)
+                    self.publisher.start(self.channel_pool)
+                    # replay the local outbox whenever the robust connection recovers
+                    self.connection.reconnect_callbacks.add(self._on_reconnect)
+
                     logger.info(
                         f"Connected to RabbitMQ on attempt {attempt + 1}. RPC Queue: {self.callback_queue.name}"
                     )
@@ -72,6 +97,9 @@ class RabbitMQClient:
                         )
                 self.futures.clear()
 
+            await self.publisher.stop()
+            await self.channel_pool.close()
+
             if self.channel and not self.channel.is_closed:
                 await self.channel.close()
 
@@ -84,6 +112,23 @@ class RabbitMQClient:
             self.consumer_tag = None
             logger.info("RabbitMQ connection closed.")
 
+    def metrics(self) -> dict[str, Any]:
+        in_flight = self.channel_pool.in_flight
+        return {
+            "connected": bool(self.connection and not self.connection.is_closed),
+            "channels": len(in_flight),
+            "in_flight_publishes": sum(in_flight),
+            "in_flight_per_channel": in_flight,
+            "pending_rpc_futures": len(self.futures),
+            "coalesced_rpcs_in_flight": len(self._rpc_in_flight),
+            "cached_rpc_replies": len(self._rpc_cache),
+            "publish_queue_size": self.publisher.queue_size,
+        }
+
+    def _on_reconnect(self, *_: Any) -> None:
+        logger.info("Reconnected to RabbitMQ; replaying the local outbox.")
+        self.publisher.schedule_replay()
+
     async def on_response(self, message: aio_pika.abc.AbstractIncomingMessage):
         """
         Background listener. When a message comes back:
@@ -118,12 +163,47 @@ class RabbitMQClient:
         """
         RPC: Sends request to bot server through rabbitmq, returns reply from bot server.
         Raises TimeoutError if bot fails to respond in time.
+
+        For action codes listed in `AMQP_RPC_CACHE_TTL`, concurrent identical
+        `(action_code, body)` requests share one in-flight request, and successful
+        replies are served from a cache for the configured number of seconds
+        (0 coalesces without caching).
         """
+        ttl = get_settings().amqp_rpc_cache_ttl.get(action_code)
+        if ttl is None:
+            return await self._send_rpc(action_code, body, timeout)
+
+        key = (action_code, json.dumps(body or {}, sort_keys=True))
+        cached = self._rpc_cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        shared = self._rpc_in_flight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._send_rpc(action_code, body, timeout))
+            self._rpc_in_flight[key] = shared
+            shared.add_done_callback(
+                lambda done: self._on_rpc_done(key, done, ttl)  # type: ignore[arg-type]
+            )
+        # shield: one caller giving up must not cancel the request for the others
+        return await asyncio.shield(shared)
+
+    def _on_rpc_done(
+        self, key: tuple[int, str], done: asyncio.Future[Any], ttl: float
+    ) -> None:
+        self._rpc_in_flight.pop(key, None)
+        if done.cancelled() or done.exception() is not None:
+            return
+        if ttl > 0:
+            self._rpc_cache.set(key, (done.result(),), ttl)
+
+    async def _send_rpc(self, action_code: int, body: dict | None, timeout: int) -> Any:
         if (
             not self.connection
             or self.connection.is_closed
             or not self.channel
             or not self.callback_queue
+            or self.channel_pool.is_closed
         ):
             raise RuntimeError(
                 "Connection not established with bot server. Call connect() first."
@@ -148,9 +228,10 @@ class RabbitMQClient:
             correlation_id=correlation_id,
         )
 
-        await self.channel.default_exchange.publish(
-            message, routing_key=get_settings().discord_receive_queue
-        )
+        async with self.channel_pool.acquire() as channel:
+            await channel.default_exchange.publish(
+                message, routing_key=get_settings().discord_receive_queue
+            )
 
         try:
             response = await asyncio.wait_for(future, timeout=timeout)
@@ -166,17 +247,12 @@ class RabbitMQClient:
         """
         Fire-and-Forget: Sends request to bot server through rabbitmq.
         Handles requests that do not expect a response from the bot server.
-        No return value.
+        No return value. The message is handed to the background publisher, so this
+        returns without waiting for the broker; see `BackgroundPublisher`.
         """
-        if not self.channel:
-            raise RuntimeError("RabbitMQ client is not connected.")
-
-        message = aio_pika.Message(
-            body=json.dumps({"action_code": action_code, "body": body or {}}).encode()
-        )
-
-        await self.channel.default_exchange.publish(
-            message, routing_key=get_settings().discord_receive_queue
+        await self.publisher.publish(
+            get_settings().discord_receive_queue,
+            json.dumps({"action_code": action_code, "body": body or {}}).encode(),
         )
 
 
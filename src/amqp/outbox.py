@@ -0,0 +1,82 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Sequence
+
+OutboxMessage = tuple[str, bytes]  # (routing_key, body)
+
+
+class MessageOutbox:
+    """
+    Durable local store for messages that could not be published to RabbitMQ.
+
+    Backed by a SQLite file so that messages survive a restart of the backend;
+    `RabbitMQClient` replays them once the broker is reachable again. All methods
+    are blocking and thread-safe, so they can be called through `asyncio.to_thread`.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS outbox ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "routing_key TEXT NOT NULL, "
+                "body BLOB NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def put_many(self, messages: Sequence[OutboxMessage]) -> None:
+        if not messages:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO outbox (routing_key, body, created_at) VALUES (?, ?, ?)",
+                    [(routing_key, body, now) for routing_key, body in messages],
+                )
+
+    def peek(self, limit: int) -> list[tuple[int, OutboxMessage]]:
+        """Returns up to `limit` of the oldest messages with their ids."""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT id, routing_key, body FROM outbox ORDER BY id LIMIT ?",
+                    (limit,),
+                )
+                .fetchall()
+            )
+        return [(id, (routing_key, bytes(body))) for id, routing_key, body in rows]
+
+    def delete(self, ids: Sequence[int]) -> None:
+        if not ids:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
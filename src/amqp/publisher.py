@@ -0,0 +1,225 @@
+import asyncio
+from contextlib import suppress
+from typing import Sequence
+
+import aio_pika
+
+from src.core import logger
+
+from .channel_pool import ChannelPool
+from .outbox import MessageOutbox, OutboxMessage
+
+
+class BackgroundPublisher:
+    """
+    Publishes fire-and-forget messages from a background task, in order.
+
+    `publish` only puts the message on a bounded asyncio queue, so request handlers
+    never wait on the broker. The background task drains the queue in batches and
+    publishes each batch in queue order on the channel pinned to the routing key,
+    awaiting the publisher confirms together; the next batch starts once the
+    previous one is confirmed.
+
+    Messages that cannot be confirmed within `confirm_timeout` seconds, or that do
+    not fit in the queue (together with the queue ahead of them), are written to
+    the local `MessageOutbox`. While the outbox holds messages, the same task
+    replays it before publishing anything new, and new messages are appended
+    behind it if the broker is still unavailable, so the bot receives messages in
+    the order they were published. The replay is retried after a reconnect or every
+    `retry_interval` seconds. Delivery is at-least-once: a message whose confirm
+    timed out may still have been routed.
+    """
+
+    def __init__(
+        self,
+        outbox: MessageOutbox,
+        maxsize: int = 1000,
+        batch_size: int = 100,
+        confirm_timeout: float = 5,
+        retry_interval: float = 30,
+    ):
+        self.outbox = outbox
+        self._maxsize = maxsize
+        self._batch_size = batch_size
+        self._confirm_timeout = confirm_timeout
+        self._retry_interval = retry_interval
+        self._pool: ChannelPool | None = None
+        self._queue: asyncio.Queue[OutboxMessage] | None = None
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        # messages that did not fit in the queue, waiting to be written to the outbox
+        self._overflow: list[OutboxMessage] = []
+        # set when the outbox may hold messages that were not replayed yet
+        self._outbox_pending = True
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self, pool: ChannelPool) -> None:
+        if self.running:
+            return
+        self._pool = pool
+        self._queue = asyncio.Queue(self._maxsize)
+        # messages left in the outbox by a previous run go out first
+        self._outbox_pending = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the background task and moves unsent messages to the outbox."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+        remaining: list[OutboxMessage] = []
+        while self._queue is not None and not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        remaining += self._overflow
+        self._overflow = []
+        if remaining:
+            logger.warning(
+                f"Moving {len(remaining)} unsent AMQP messages to the local outbox."
+            )
+            self.outbox.put_many(remaining)
+        self._queue = None
+        self._pool = None
+
+    async def publish(self, routing_key: str, body: bytes) -> None:
+        if not self.running or self._queue is None:
+            raise RuntimeError("RabbitMQ client is not connected.")
+        if self._overflow:
+            # keep the order behind messages that already overflowed
+            self._overflow.append((routing_key, body))
+            return
+        try:
+            self._queue.put_nowait((routing_key, body))
+        except asyncio.QueueFull:
+            logger.warning("AMQP publish queue is full; writing to the local outbox.")
+            # the background task moves the queue and then these to the outbox
+            self._overflow.append((routing_key, body))
+            self._wakeup.set()
+
+    def schedule_replay(self) -> None:
+        """Makes the background task replay the outbox before its next batch."""
+        self._outbox_pending = True
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            self._wakeup.clear()
+            if self._overflow:
+                await self._spill_queue()
+            if self._outbox_pending and not await self._replay():
+                # the broker is still unavailable; keep new messages behind the
+                # ones already in the outbox until the next retry
+                batch = await self._next_batch(timeout=self._retry_interval)
+                await asyncio.to_thread(self.outbox.put_many, batch)
+                continue
+
+            batch = await self._next_batch()
+            if not batch:
+                continue  # woken up to replay the outbox or spill the overflow
+            try:
+                sent = await self._publish_batch(batch)
+            except asyncio.CancelledError:
+                # shutting down mid-batch; keep the messages (at-least-once)
+                self.outbox.put_many(batch)
+                raise
+            if sent < len(batch):
+                await asyncio.to_thread(self.outbox.put_many, batch[sent:])
+                self._outbox_pending = True
+
+    async def _spill_queue(self) -> None:
+        """Moves the queued and then the overflowed messages to the outbox."""
+        assert self._queue is not None
+        messages: list[OutboxMessage] = []
+        while not self._queue.empty():
+            messages.append(self._queue.get_nowait())
+        messages += self._overflow
+        self._overflow = []
+        await asyncio.to_thread(self.outbox.put_many, messages)
+        self._outbox_pending = True
+
+    async def _next_batch(self, timeout: float | None = None) -> list[OutboxMessage]:
+        """
+        Waits for the next message, a replay request or `timeout`, and returns the
+        queued messages up to the batch size; empty if no message arrived.
+        """
+        assert self._queue is not None
+        batch: list[OutboxMessage] = []
+        if self._queue.empty():
+            get = asyncio.ensure_future(self._queue.get())
+            wakeup = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                await asyncio.wait(
+                    (get, wakeup), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                wakeup.cancel()
+                if not get.done():
+                    get.cancel()
+            if not get.done() or get.cancelled():
+                return batch
+            batch.append(get.result())
+        while len(batch) < self._batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _replay(self) -> bool:
+        """Publishes the outbox oldest first; True once it is empty."""
+        while True:
+            rows = await asyncio.to_thread(self.outbox.peek, self._batch_size)
+            if not rows:
+                self._outbox_pending = False
+                return True
+            sent = await self._publish_batch([message for _, message in rows])
+            await asyncio.to_thread(
+                self.outbox.delete, [row_id for row_id, _ in rows[:sent]]
+            )
+            if sent < len(rows):
+                return False
+            logger.info(f"Replayed {sent} AMQP messages from the local outbox.")
+
+    async def _publish_batch(self, batch: Sequence[OutboxMessage]) -> int:
+        """
+        Publishes a batch in order and returns how many messages, counted from the
+        start, were confirmed. Messages after the first failure are reported as
+        unsent, so that retrying them keeps the order.
+
+        Each message goes to the pool channel pinned to its routing key, and the
+        publishes are started in batch order without waiting for each other: a
+        channel writes their frames first-come first-served and the broker keeps the
+        order of one channel's messages in a queue, so only the confirms overlap.
+        """
+        pool = self._pool
+        if pool is None or pool.is_closed:
+            return 0
+        results = await asyncio.gather(
+            *(self._publish_one(pool, message) for message in batch),
+            return_exceptions=True,
+        )
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"err_type=amqp_publish ; unsent={len(batch) - i}/{len(batch)} ; msg={result!r}"
+                )
+                return i
+        return len(batch)
+
+    async def _publish_one(self, pool: ChannelPool, message: OutboxMessage) -> None:
+        routing_key, body = message
+        # the channels use publisher confirms, so this waits for the broker's ack
+        async with pool.acquire(routing_key) as channel:
+            await asyncio.wait_for(
+                channel.default_exchange.publish(
+                    aio_pika.Message(body=body), routing_key=routing_key
+                ),
+                timeout=self._confirm_timeout,
+            )
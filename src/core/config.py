@@ -8,16 +8,32 @@ class Settings(BaseSettings):
     jwt_secret: str
     jwt_valid_seconds: int
     image_dir: str = "static/image/photo/"
+    image_variant_workers: int = 2
     file_dir: str = "static/download/"
     file_max_size: int = 10000000
+    file_gc_grace_seconds: int = 3600
     article_dir: str = "static/article/"
+    article_blob_dir: str = "static/article_blob/"
+    article_blob_gc_grace_seconds: int = 3600
+    article_cache_max_bytes: int = 32000000
     user_check: bool = True
     enrollment_fee: int = 25000
     cors_all_accept: bool = False
+    json_compression_min_size: int = 1024
     rabbitmq_host: str = "rabbitmq"
     bot_host: str = "bot"
+    bot_http_max_connections: int = 20
+    bot_http_max_keepalive_connections: int = 10
+    bot_http2: bool = False
     discord_receive_queue: str = "discord_bot_queue"
     rabbitmq_required: bool = True
+    amqp_outbox_path: str = "outbox/amqp_outbox.sqlite3"
+    amqp_publish_queue_size: int = 1000
+    amqp_channel_pool_size: int = 4
+    # action_code -> seconds to cache the bot's reply; 0 only coalesces concurrent
+    # identical requests. 1001 (invite) is left out on purpose: each caller must
+    # get the invite the bot creates for it.
+    amqp_rpc_cache_ttl: dict[int, float] = {3005: 0}
     enable_test_routes: bool = False
     notice_channel_id: int
     grant_channel_id: int
@@ -25,6 +41,7 @@ class Settings(BaseSettings):
     db_name: str = "main_db"
     db_user: str
     db_password: str
+    sqlite_filename: str | None = None
 
     model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
 
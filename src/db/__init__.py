@@ -1,3 +1,21 @@
+from .after_commit import call_after_commit
 from .db_backup import backup_db_before_status_change
-from .engine import DBSessionFactory, SessionDep, TransactionDep, get_session
+from .engine import (
+    AsyncDBSessionFactory,
+    AsyncSessionDep,
+    AsyncTransactionDep,
+    DBSessionFactory,
+    SessionDep,
+    TransactionDep,
+    get_async_session,
+    get_session,
+)
 from .get_from_db import get_user_role_level
+from .user_cache import (
+    cache_user,
+    clear_user_cache,
+    clear_user_cache_after_commit,
+    get_cached_user,
+    invalidate_cached_user,
+    invalidate_cached_user_after_commit,
+)
@@ -0,0 +1,38 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core import logger
+
+# Session.info key for the callbacks that wait for the session's commit
+_AFTER_COMMIT = "after_commit_callbacks"
+
+
+def call_after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Calls `callback` once `session` commits, or never if it rolls back. Use it for
+    side effects outside the database (removing files, clearing caches) that must
+    not happen when the change they follow is not committed.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT, ()):
+        try:
+            callback()
+        except Exception:
+            # the transaction is already committed; do not fail the request for it
+            logger.error(
+                f"err_type=after_commit ; callback failed ; {callback=}", exc_info=True
+            )
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_commit(session: Session, previous_transaction) -> None:
+    # unlike after_rollback, this also fires when nothing had been flushed yet;
+    # a rolled back savepoint leaves the outer transaction to be committed
+    if not previous_transaction.nested:
+        session.info.pop(_AFTER_COMMIT, None)
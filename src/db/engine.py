@@ -1,22 +1,43 @@
 import urllib.parse
-from typing import Annotated, Iterator
+from typing import Annotated, AsyncIterator, Iterator
 
 import sqlalchemy
 from fastapi import Depends
 from sqlalchemy import orm
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm.session import Session
 
 from src.core import get_settings
 from src.util import SingletonMeta
 
 
+def _database_url(*, is_async: bool) -> str:
+    """
+    Builds the database URL from settings. PostgreSQL is used by default
+    (psycopg2 for the sync engine, asyncpg for the async engine); when
+    `SQLITE_FILENAME` is set, as it is in the test suite, the same file is used by
+    both engines through sqlite/aiosqlite.
+    """
+    settings = get_settings()
+    if settings.sqlite_filename:
+        driver = "sqlite+aiosqlite" if is_async else "sqlite"
+        return f"{driver}:///{settings.sqlite_filename}"
+
+    driver = "postgresql+asyncpg" if is_async else "postgresql"
+    return (
+        f"{driver}://{urllib.parse.quote_plus(settings.db_user)}:{urllib.parse.quote_plus(settings.db_password)}@"
+        f"db/{urllib.parse.quote_plus(settings.db_name)}"
+    )
+
+
 class DBSessionFactory(metaclass=SingletonMeta):
     def __init__(self):
-        settings = get_settings()
-        self._psql_url = (
-            f"postgresql://{urllib.parse.quote_plus(settings.db_user)}:{urllib.parse.quote_plus(settings.db_password)}@"
-            f"db/{urllib.parse.quote_plus(settings.db_name)}"
-        )
+        self._psql_url = _database_url(is_async=False)
 
         self._engine: sqlalchemy.Engine = sqlalchemy.create_engine(
             self._psql_url,
@@ -41,6 +62,45 @@ class DBSessionFactory(metaclass=SingletonMeta):
         self._engine.dispose()
 
 
+class AsyncDBSessionFactory(metaclass=SingletonMeta):
+    """
+    Async counterpart of `DBSessionFactory`. Queries issued through its sessions
+    are awaited instead of blocking the event loop while the database answers.
+    Both factories share the same database, so services can be migrated to
+    `AsyncSessionDep` one at a time. The engine is created on first use, so a
+    process that never opens an async session needs no async driver.
+    """
+
+    def __init__(self):
+        self._engine: AsyncEngine | None = None
+        self._session_maker: async_sessionmaker[AsyncSession] | None = None
+
+    def get_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(
+                _database_url(is_async=True),
+                pool_size=20,
+                max_overflow=40,
+                pool_timeout=30,
+                pool_recycle=600,
+                pool_pre_ping=True,
+            )
+        return self._engine
+
+    def make_session(self) -> AsyncSession:
+        if self._session_maker is None:
+            self._session_maker = async_sessionmaker(
+                bind=self.get_engine(), expire_on_commit=False
+            )
+        return self._session_maker()
+
+    async def teardown(self):
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_maker = None
+
+
 engine = DBSessionFactory().get_engine()
 
 
@@ -59,6 +119,21 @@ def get_session() -> Iterator[Session]:
 SessionDep = Annotated[Session, Depends(get_session)]
 
 
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    session = AsyncDBSessionFactory().make_session()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+
+
 class Transaction:
     """
     A context manager class for flushing changes to the database without committing
@@ -84,3 +159,28 @@ class Transaction:
 
 
 TransactionDep = Annotated[Transaction, Depends()]
+
+
+class AsyncTransaction:
+    """
+    Async version of `Transaction`, used as `async with`. Changes are flushed on
+    exit and committed when the request scope finishes. See `get_async_session`.
+    """
+
+    def __init__(self, session: AsyncSessionDep):
+        self._session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if exc_type is not None:
+            # rollback and let the exception propagate
+            await self._session.rollback()
+            return False
+
+        await self._session.flush()
+        return True
+
+
+AsyncTransactionDep = Annotated[AsyncTransaction, Depends()]
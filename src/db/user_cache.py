@@ -0,0 +1,60 @@
+import time
+from functools import partial
+from typing import Any, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from src.model import User
+from src.util import TTLCache
+
+from .after_commit import call_after_commit
+
+USER_CACHE_TTL_SECONDS = 30
+
+# encoded jwt -> column values of the user it resolved to
+_user_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=4096, ttl=USER_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_user(encoded_jwt: str) -> Optional[User]:
+    """
+    Returns a transient copy of the user the token resolved to within the last
+    `USER_CACHE_TTL_SECONDS` seconds, or None on a cache miss. The copy is not
+    attached to any session; repositories persist changes to it with `merge`.
+    """
+    snapshot = _user_cache.get(encoded_jwt)
+    if snapshot is None:
+        return None
+    return User(**snapshot)
+
+
+def cache_user(encoded_jwt: str, user: User, token_exp: float) -> None:
+    """Caches `user` for `encoded_jwt`, never beyond the token's `exp` claim."""
+    snapshot = {
+        attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+    }
+    _user_cache.set(encoded_jwt, snapshot, ttl=token_exp - time.time())
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    _user_cache.pop_where(lambda _, snapshot: snapshot["id"] == user_id)
+
+
+def clear_user_cache() -> None:
+    _user_cache.clear()
+
+
+def invalidate_cached_user_after_commit(session: Session, user_id: str) -> None:
+    """
+    Drops the cached copies of the user once `session` commits. Dropping them when
+    the change is only flushed would let a concurrent request read the old row and
+    cache it again until the TTL expires.
+    """
+    call_after_commit(session, partial(invalidate_cached_user, user_id))
+
+
+def clear_user_cache_after_commit(session: Session) -> None:
+    """Clears the whole cache once `session` commits, e.g. after a bulk UPDATE."""
+    call_after_commit(session, clear_user_cache)
@@ -1,6 +1,7 @@
 from .api_secret import api_secret
 from .check_user_status import check_user_status
 from .get_scsc_global_status import SCSCGlobalStatusDep
+from .http_client import BotHTTPClientDep, BotHTTPClientFactory
 from .user_auth import (
     NullableUserDep,
     UserDep,
@@ -17,11 +17,9 @@ async def check_user_status(
     if current_user and current_user.is_active and not current_user.is_banned:
         return
 
-    blacklist_rules = check_user_status_rule_repository.get_blacklist_rules_by_request(
-        request
-    )
-
-    if blacklist_rules:
+    if check_user_status_rule_repository.is_blacklisted(
+        request.method, request.url.path
+    ):
         if current_user is None:
             raise HTTPException(status_code=401, detail="Not authenticated")
 
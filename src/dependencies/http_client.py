@@ -0,0 +1,55 @@
+from typing import Annotated
+
+import httpx
+from fastapi import Depends
+
+from src.core import get_settings, logger
+from src.util import SingletonMeta
+
+BOT_HTTP_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
+
+class BotHTTPClientFactory(metaclass=SingletonMeta):
+    """
+    Owns the `httpx.AsyncClient` shared by every request to the bot's HTTP server,
+    so that connections are kept alive and reused instead of being opened (with a
+    DNS lookup and pool setup) on every call. The client is created on first use
+    and closed by the app lifespan through `teardown`.
+    """
+
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def teardown(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _create_client() -> httpx.AsyncClient:
+        settings = get_settings()
+        limits = httpx.Limits(
+            max_connections=settings.bot_http_max_connections,
+            max_keepalive_connections=settings.bot_http_max_keepalive_connections,
+            keepalive_expiry=30,
+        )
+        try:
+            return httpx.AsyncClient(
+                timeout=BOT_HTTP_TIMEOUT, limits=limits, http2=settings.bot_http2
+            )
+        except ImportError:
+            # http2=True needs the optional `h2` package (httpx[http2])
+            logger.warning("BOT_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+            return httpx.AsyncClient(timeout=BOT_HTTP_TIMEOUT, limits=limits)
+
+
+def _get_bot_http_client() -> httpx.AsyncClient:
+    return BotHTTPClientFactory().get_client()
+
+
+BotHTTPClientDep = Annotated[httpx.AsyncClient, Depends(_get_bot_http_client)]
@@ -5,7 +5,7 @@ from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from src.core import get_settings
-from src.db import SessionDep
+from src.db import SessionDep, cache_user, get_cached_user
 from src.model import User
 
 
@@ -27,6 +27,10 @@ def resolve_request_user(request: Request, session: Session) -> Optional[User]:
     if encoded_jwt is None:
         return None
 
+    cached_user = get_cached_user(encoded_jwt)
+    if cached_user is not None:
+        return cached_user
+
     try:
         decoded_jwt = jwt.decode(
             encoded_jwt,
@@ -43,7 +47,10 @@ def resolve_request_user(request: Request, session: Session) -> Optional[User]:
     except jwt.exceptions.InvalidTokenError:
         return None
 
-    return session.get(User, decoded_jwt["user_id"])
+    user = session.get(User, decoded_jwt["user_id"])
+    if user is not None:
+        cache_user(encoded_jwt, user, decoded_jwt["exp"])
+    return user
 
 
 def get_user(request: Request) -> User:
@@ -1,2 +1,3 @@
 from .assert_permission import AssertPermissionMiddleware
 from .http_logger import HTTPLoggerMiddleware
+from .json_compression import JSONCompressionMiddleware
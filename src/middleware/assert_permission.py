@@ -1,20 +1,27 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.db import DBSessionFactory, get_user_role_level
 from src.dependencies import resolve_request_user
 
 
-class AssertPermissionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if not request.url.path.startswith("/api") or request.method not in (
-            "GET",
-            "POST",
-        ):
-            return await call_next(request)
+class AssertPermissionMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        if request.url.path.startswith("/api/executive"):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        if not path.startswith("/api") or scope["method"] not in ("GET", "POST"):
+            await self.app(scope, receive, send)
+            return
+
+        if path.startswith("/api/executive"):
+            request = Request(scope)
             session = DBSessionFactory().make_session()
             try:
                 user = self._resolve_user(request, session)
@@ -22,18 +29,22 @@ class AssertPermissionMiddleware(BaseHTTPMiddleware):
                 session.close()
             request.state.user = user
             if user is None:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=401, content={"detail": "Not authenticated"}
                 )
+                await response(scope, receive, send)
+                return
             if user.role < get_user_role_level("executive"):
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=403,
                     content={
                         "detail": "Permission denied: at least executive role required"
                     },
                 )
+                await response(scope, receive, send)
+                return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     def _resolve_user(self, request: Request, session):
         return resolve_request_user(request, session)
@@ -2,30 +2,42 @@ import logging
 import time
 import uuid
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.util import request_id_var
 
 http_logger = logging.getLogger("http_access")
 
 
-class HTTPLoggerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class HTTPLoggerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         request_id = str(uuid.uuid4())
         request_id_var.set(request_id)
 
         start_time = time.time()
 
-        http_logger.info(f"Request: {request.method} {request.url.path}")
+        http_logger.info(f"Request: {scope['method']} {scope['path']}")
+
+        status_code = 500
 
-        response = await call_next(request)
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
         process_time = (time.time() - start_time) * 1000
         formatted_process_time = "{0:.2f}".format(process_time)
 
         http_logger.info(
-            f"Response: status_code={response.status_code} duration={formatted_process_time}ms"
+            f"Response: status_code={status_code} duration={formatted_process_time}ms"
         )
-
-        return response
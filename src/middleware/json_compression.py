@@ -0,0 +1,73 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.util import choose_encoding, compress
+
+
+class JSONCompressionMiddleware:
+    """
+    Compresses JSON responses of at least `minimum_size` bytes with brotli or gzip,
+    whichever the client's Accept-Encoding prefers. Smaller bodies are not worth the
+    CPU and the extra header bytes.
+
+    Only `application/json` is touched: files and images are mostly compressed
+    formats already, and W pages are served from precompressed copies. Responses
+    that already have a Content-Encoding or stream their body in several messages
+    are passed through.
+
+    A strong ETag is weakened on a compressed response: strong validators must
+    differ per byte representation (RFC 9110 8.8.3), and If-None-Match compares
+    weakly, so revalidation keeps working.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        start_message: Message | None = None
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if (
+                    not headers.get("content-type", "").startswith("application/json")
+                    or "content-encoding" in headers
+                ):
+                    await send(message)
+                    return
+                headers.add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    await send(message)
+                    return
+                # hold the headers back until the body shows whether to compress
+                start_message = message
+                return
+
+            if message["type"] == "http.response.body" and start_message is not None:
+                start, start_message = start_message, None
+                body = message.get("body", b"")
+                if message.get("more_body", False) or len(body) < self.minimum_size:
+                    await send(start)
+                    await send(message)
+                    return
+                compressed = compress(body, encoding)
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                etag = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                await send(start)
+                await send({"type": "http.response.body", "body": compressed})
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -8,6 +8,7 @@ from .key_value import KeyValue
 from .major import Major
 from .pig import PIG, PIGMember, PIGWebsite
 from .scsc_global_status import SCSCGlobalStatus, SCSCStatus
+from .search import ArticleSearch
 from .sig import SIG, SIGMember
 from .user import Enrollment, OldboyApplicant, StandbyReqTbl, User, UserRole
 from .w_html_metadata import WHTMLMetadata
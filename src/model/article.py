@@ -79,3 +79,21 @@ class Article(Base):
         nullable=True,
         default=None,
     )
+
+    excerpt: Mapped[str | None] = mapped_column(
+        String,
+        nullable=True,
+        default=None,
+    )
+
+    word_count: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        default=None,
+    )
+
+    content_hash: Mapped[str | None] = mapped_column(
+        String,
+        nullable=True,
+        default=None,
+    )
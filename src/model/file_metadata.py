@@ -21,6 +21,14 @@ class FileMetadata(Base):
         String, ForeignKey("user.id"), nullable=True
     )
 
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String, nullable=True, default=None
+    )
+    # shared by every row with the same content; None for files stored as {id}.{ext}
+    storage_name: Mapped[Optional[str]] = mapped_column(
+        String, nullable=True, default=None
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=False), default_factory=utcnow
     )
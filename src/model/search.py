@@ -0,0 +1,59 @@
+from sqlalchemy import DDL, ForeignKey, Integer, String, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .comment import Comment
+
+
+class ArticleSearch(Base):
+    """
+    Searchable copy of an article's title and body (bodies live in the blob store).
+
+    On PostgreSQL the `search_vector` tsvector column and its GIN index are created
+    by the migrations and are not mapped here. On SQLite (tests, local runs) an FTS5
+    table kept in sync by triggers is created alongside this table instead.
+    """
+
+    __tablename__ = "article_search"
+
+    article_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("article.id", ondelete="CASCADE"), primary_key=True
+    )
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    body: Mapped[str] = mapped_column(String, nullable=False)
+
+
+def _sqlite_fts_ddl(table: str, fts: str, rowid: str, columns: list[str]) -> list[DDL]:
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.{rowid}, {new_values});"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.{rowid}, {old_values});"
+    )
+    return [
+        DDL(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, "
+            f"content='{table}', content_rowid='{rowid}')"
+        ),
+        DDL(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END"),
+        DDL(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END"),
+        DDL(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        ),
+    ]
+
+
+for _table, _fts, _rowid, _columns in (
+    (ArticleSearch.__table__, "article_search_fts", "article_id", ["title", "body"]),
+    (Comment.__table__, "comment_fts", "id", ["content"]),
+):
+    for _ddl in _sqlite_fts_ddl(_table.name, _fts, _rowid, _columns):
+        event.listen(_table, "after_create", _ddl.execute_if(dialect="sqlite"))
+    event.listen(
+        _table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {_fts}").execute_if(dialect="sqlite"),
+    )
@@ -1,13 +1,17 @@
 ﻿from .article import ArticleRepositoryDep
 from .attachment import AttachmentRepositoryDep
 from .board import BoardRepositoryDep
-from .check_user_status_rule import CheckUserStatusRuleRepositoryDep
+from .check_user_status_rule import (
+    CheckUserStatusRuleRepositoryDep,
+    invalidate_blacklist_rule_cache,
+)
 from .comment import CommentRepositoryDep
 from .file_metadata import FileMetadataRepositoryDep
 from .key_value import KeyValueRepositoryDep
-from .major import MajorRepositoryDep
+from .major import AsyncMajorRepositoryDep, MajorRepositoryDep
 from .pig import PigMemberRepositoryDep, PigRepositoryDep, PigWebsiteRepositoryDep
 from .scsc import SCSCGlobalStatusRepositoryDep
+from .search import SearchRepositoryDep
 from .sig import SigMemberRepositoryDep, SigRepositoryDep
 from .user import (
     EnrollmentRepositoryDep,
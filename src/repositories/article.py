@@ -1,7 +1,8 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Optional, Sequence
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 
 from src.model import Article
 
@@ -17,5 +18,19 @@ class ArticleRepository(CRUDRepository[Article, int]):
         stmt = select(Article).where(Article.board_id == board_id)
         return self.session.scalars(stmt).all()
 
+    def get_content_hashes(self) -> set[str]:
+        stmt = select(Article.content_hash).where(Article.content_hash.is_not(None))
+        return set(self.session.scalars(stmt).all())
+
+    def get_articles_page_by_board_id(
+        self, board_id: int, limit: int, after: Optional[tuple[datetime, int]]
+    ) -> Sequence[Article]:
+        """Newest first, keyset-paginated on `(created_at, id)` strictly after `after`."""
+        stmt = select(Article).where(Article.board_id == board_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(Article.created_at, Article.id) < tuple_(*after))
+        stmt = stmt.order_by(Article.created_at.desc(), Article.id.desc()).limit(limit)
+        return self.session.scalars(stmt).all()
+
 
 ArticleRepositoryDep = Annotated[ArticleRepository, Depends()]
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Generic, Optional, Sequence, TypeVar
+
+from sqlalchemy import delete, select
+
+from src.db import AsyncSessionDep, AsyncTransactionDep
+
+ModelT = TypeVar("ModelT")
+IdT = TypeVar("IdT")
+
+
+class AsyncCRUDRepository(Generic[ModelT, IdT], ABC):
+    """Async counterpart of `CRUDRepository`, backed by `AsyncSessionDep`."""
+
+    def __init__(self, session: AsyncSessionDep, transaction: AsyncTransactionDep):
+        self.session = session
+        self.transaction = transaction
+
+    @property
+    @abstractmethod
+    def model(self) -> type[ModelT]:
+        """Return the SQLAlchemy ORM model class managed by this DAO."""
+        raise NotImplementedError
+
+    async def get_by_id(self, id: IdT) -> Optional[ModelT]:
+        return await self.session.get(self.model, id)
+
+    async def list_all(self) -> Sequence[ModelT]:
+        stmt = select(self.model)
+        return (await self.session.scalars(stmt)).all()
+
+    async def create(self, obj: ModelT) -> ModelT:
+        async with self.transaction:
+            self.session.add(obj)
+        return obj
+
+    async def delete(self, obj: ModelT) -> None:
+        async with self.transaction:
+            await self.session.delete(obj)
+
+    async def update(self, obj: ModelT) -> ModelT:
+        async with self.transaction:
+            await self.session.merge(obj)
+        return obj
+
+    async def delete_all(self) -> None:
+        async with self.transaction:
+            await self.session.execute(delete(self.model))
+
+    async def delete_all_except(self, excluded_ids: list[IdT]) -> None:
+        if not excluded_ids:
+            raise ValueError("예외 없이 모든 유저 삭제 불가")
+        stmt = delete(self.model).where(~self.model.id.in_(excluded_ids))
+        async with self.transaction:
+            await self.session.execute(stmt)
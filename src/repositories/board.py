@@ -1,6 +1,8 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Optional
 
 from fastapi import Depends
+from sqlalchemy import func, select
 
 from src.model import Board
 
@@ -12,5 +14,11 @@ class BoardRepository(CRUDRepository[Board, int]):
     def model(self) -> type[Board]:
         return Board
 
+    def get_list_version(self) -> tuple[int, Optional[datetime]]:
+        """(count, latest updated_at): changes whenever a board is created, updated or deleted."""
+        stmt = select(func.count(), func.max(Board.updated_at)).select_from(Board)
+        count, updated_at = self.session.execute(stmt).one()
+        return count, updated_at
+
 
 BoardRepositoryDep = Annotated[BoardRepository, Depends()]
@@ -1,24 +1,61 @@
 from typing import Annotated
 
-from fastapi import Depends, Request
-from sqlalchemy import literal, select
+from fastapi import Depends
 
+from src.db import call_after_commit
 from src.model import CheckUserStatusRule
+from src.util import LikePatternMatcher, TTLCache
 
 from .crud_repository import CRUDRepository
 
+# rules are edited rarely (and sometimes directly in SQL), so the compiled matcher
+# is rebuilt at most this often; changes made through the repository apply once
+# they are committed, so a concurrent request cannot rebuild it from the old rows
+BLACKLIST_RULE_CACHE_TTL_SECONDS = 60
+
+_blacklist_matcher_cache: TTLCache[str, LikePatternMatcher] = TTLCache(
+    maxsize=1, ttl=BLACKLIST_RULE_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_blacklist_rule_cache() -> None:
+    _blacklist_matcher_cache.clear()
+
 
 class CheckUserStatusRuleRepository(CRUDRepository[CheckUserStatusRule, int]):
     @property
     def model(self) -> type[CheckUserStatusRule]:
         return CheckUserStatusRule
 
-    def get_blacklist_rules_by_request(self, request: Request):
-        stmt = select(CheckUserStatusRule).where(
-            CheckUserStatusRule.method == request.method,
-            literal(request.url.path).like(CheckUserStatusRule.path),
-        )
-        return self.session.scalars(stmt).all()
+    def get_blacklist_matcher(self) -> LikePatternMatcher:
+        matcher = _blacklist_matcher_cache.get("rules")
+        if matcher is None:
+            matcher = LikePatternMatcher(
+                (rule.method.value, rule.path) for rule in self.list_all()
+            )
+            _blacklist_matcher_cache.set("rules", matcher)
+        return matcher
+
+    def is_blacklisted(self, method: str, path: str) -> bool:
+        return self.get_blacklist_matcher().matches(method, path)
+
+    def create(self, obj: CheckUserStatusRule) -> CheckUserStatusRule:
+        obj = super().create(obj)
+        call_after_commit(self.session, invalidate_blacklist_rule_cache)
+        return obj
+
+    def update(self, obj: CheckUserStatusRule) -> CheckUserStatusRule:
+        obj = super().update(obj)
+        call_after_commit(self.session, invalidate_blacklist_rule_cache)
+        return obj
+
+    def delete(self, obj: CheckUserStatusRule) -> None:
+        super().delete(obj)
+        call_after_commit(self.session, invalidate_blacklist_rule_cache)
+
+    def delete_all(self) -> None:
+        super().delete_all()
+        call_after_commit(self.session, invalidate_blacklist_rule_cache)
 
 
 CheckUserStatusRuleRepositoryDep = Annotated[CheckUserStatusRuleRepository, Depends()]
@@ -1,4 +1,4 @@
-from typing import Annotated, Sequence
+from typing import Annotated, Iterable, Optional, Sequence
 
 from fastapi import Depends
 from sqlalchemy import select
@@ -19,5 +19,26 @@ class FileMetadataRepository(CRUDRepository[FileMetadata, str]):
         stmt = select(FileMetadata).where(FileMetadata.id.in_(ids))
         return self.session.scalars(stmt).all()
 
+    def get_by_content_hash(
+        self, content_hash: str, *, image: bool
+    ) -> Optional[FileMetadata]:
+        """The oldest image (or document) with this content."""
+        is_image = FileMetadata.mime_type.startswith("image/")
+        stmt = (
+            select(FileMetadata)
+            .where(
+                FileMetadata.content_hash == content_hash,
+                is_image if image else ~is_image,
+            )
+            .order_by(FileMetadata.created_at)
+            .limit(1)
+        )
+        return self.session.scalars(stmt).first()
+
+    def update_many(self, objs: Iterable[FileMetadata]) -> None:
+        with self.transaction:
+            for obj in objs:
+                self.session.merge(obj)
+
 
 FileMetadataRepositoryDep = Annotated[FileMetadataRepository, Depends()]
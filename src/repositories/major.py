@@ -4,6 +4,7 @@ from fastapi import Depends
 
 from src.model import Major
 
+from .async_crud_repository import AsyncCRUDRepository
 from .crud_repository import CRUDRepository
 
 
@@ -13,4 +14,11 @@ class MajorRepository(CRUDRepository[Major, int]):
         return Major
 
 
+class AsyncMajorRepository(AsyncCRUDRepository[Major, int]):
+    @property
+    def model(self) -> type[Major]:
+        return Major
+
+
 MajorRepositoryDep = Annotated[MajorRepository, Depends()]
+AsyncMajorRepositoryDep = Annotated[AsyncMajorRepository, Depends()]
@@ -5,7 +5,7 @@ from typing import Annotated, Any, Optional, Sequence
 from fastapi import Depends
 from sqlalchemy import delete, select
 
-from src.model import PIG, PIGMember, PIGWebsite, SCSCStatus
+from src.model import PIG, PIGMember, PIGWebsite, SCSCStatus, User
 
 from .crud_repository import CRUDRepository
 
@@ -51,6 +51,16 @@ class PigMemberRepository(CRUDRepository[PIGMember, int]):
         stmt = select(PIGMember).where(PIGMember.ig_id == pig_id)
         return self.session.scalars(stmt).all()
 
+    def get_members_with_users_by_pig_id(
+        self, pig_id: int
+    ) -> Sequence[tuple[PIGMember, Optional[User]]]:
+        stmt = (
+            select(PIGMember, User)
+            .outerjoin(User, User.id == PIGMember.user_id)
+            .where(PIGMember.ig_id == pig_id)
+        )
+        return [(member, user) for member, user in self.session.execute(stmt).all()]
+
 
 class PigWebsiteRepository(CRUDRepository[PIGWebsite, int]):
     @property
@@ -0,0 +1,106 @@
+import re
+from typing import Annotated, Iterable, Sequence
+
+from fastapi import Depends
+from sqlalchemy import Select, column, func, literal_column, select, table
+
+from src.model import Article, ArticleSearch, Board, Comment
+
+from .crud_repository import CRUDRepository
+
+
+def _search_terms(query: str) -> list[str]:
+    """Splits a user query into word terms; anything else is dropped."""
+    return re.findall(r"\w+", query)
+
+
+class SearchRepository(CRUDRepository[ArticleSearch, int]):
+    """
+    Ranked full-text search. Every term must match as a word prefix.
+    Uses the `search_vector` tsvector columns on PostgreSQL and FTS5 tables on SQLite.
+    """
+
+    @property
+    def model(self) -> type[ArticleSearch]:
+        return ArticleSearch
+
+    @property
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def upsert(self, article_id: int, title: str, body: str) -> None:
+        self.upsert_many([(article_id, title, body)])
+
+    def upsert_many(self, rows: Iterable[tuple[int, str, str]]) -> None:
+        with self.transaction:
+            for article_id, title, body in rows:
+                self.session.merge(
+                    ArticleSearch(article_id=article_id, title=title, body=body)
+                )
+
+    def _match(self, terms: list[str], fts_table: str, vector_column: str):
+        """Returns (where clause, rank expression, FTS5 table to join or None)."""
+        if self._is_postgres:
+            query = func.to_tsquery("simple", " & ".join(f"{t}:*" for t in terms))
+            vector = literal_column(vector_column)
+            return vector.op("@@")(query), func.ts_rank_cd(vector, query), None
+        fts = table(fts_table, column("rowid"))
+        match = " ".join(f'"{t}"*' for t in terms)
+        # bm25() is lower-is-better; negate so both dialects sort by rank DESC
+        rank = -func.bm25(literal_column(fts_table))
+        return literal_column(fts_table).op("MATCH")(match), rank, fts
+
+    def search_articles(
+        self, query: str, reader_role: int, limit: int, offset: int
+    ) -> Sequence[tuple[Article, float]]:
+        terms = _search_terms(query)
+        if not terms:
+            return []
+        where, rank, fts = self._match(
+            terms, "article_search_fts", "article_search.search_vector"
+        )
+        stmt: Select = select(Article, rank.label("rank")).join(
+            ArticleSearch, ArticleSearch.article_id == Article.id
+        )
+        if fts is not None:
+            stmt = stmt.join(fts, fts.c.rowid == ArticleSearch.article_id)
+        stmt = (
+            stmt.join(Board, Board.id == Article.board_id)
+            .where(
+                where,
+                Article.is_deleted.is_(False),
+                Board.reading_permission_level <= reader_role,
+            )
+            .order_by(rank.desc(), Article.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return [(row[0], row[1]) for row in self.session.execute(stmt).all()]
+
+    def search_comments(
+        self, query: str, reader_role: int, limit: int, offset: int
+    ) -> Sequence[tuple[Comment, float]]:
+        terms = _search_terms(query)
+        if not terms:
+            return []
+        where, rank, fts = self._match(terms, "comment_fts", "comment.search_vector")
+        stmt: Select = select(Comment, rank.label("rank"))
+        if fts is not None:
+            stmt = stmt.join(fts, fts.c.rowid == Comment.id)
+        stmt = (
+            stmt.join(Article, Article.id == Comment.article_id)
+            .join(Board, Board.id == Article.board_id)
+            .where(
+                where,
+                Comment.is_deleted.is_(False),
+                Article.is_deleted.is_(False),
+                Board.reading_permission_level <= reader_role,
+            )
+            .order_by(rank.desc(), Comment.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return [(row[0], row[1]) for row in self.session.execute(stmt).all()]
+
+
+SearchRepositoryDep = Annotated[SearchRepository, Depends()]
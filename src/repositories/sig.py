@@ -3,7 +3,7 @@ from typing import Annotated, Any, Optional, Sequence
 from fastapi import Depends
 from sqlalchemy import select
 
-from src.model import SIG, SCSCStatus, SIGMember
+from src.model import SIG, SCSCStatus, SIGMember, User
 
 from .crud_repository import CRUDRepository
 
@@ -49,6 +49,16 @@ class SigMemberRepository(CRUDRepository[SIGMember, int]):
         stmt = select(SIGMember).where(SIGMember.ig_id == SIG_id)
         return self.session.scalars(stmt).all()
 
+    def get_members_with_users_by_sig_id(
+        self, SIG_id: int
+    ) -> Sequence[tuple[SIGMember, Optional[User]]]:
+        stmt = (
+            select(SIGMember, User)
+            .outerjoin(User, User.id == SIGMember.user_id)
+            .where(SIGMember.ig_id == SIG_id)
+        )
+        return [(member, user) for member, user in self.session.execute(stmt).all()]
+
 
 SigRepositoryDep = Annotated[SigRepository, Depends()]
 SigMemberRepositoryDep = Annotated[SigMemberRepository, Depends()]
@@ -1,10 +1,17 @@
-from typing import Annotated, Any, Optional, Sequence
+from typing import Annotated, Any, Iterable, Optional, Sequence
 
 from fastapi import Depends
-from sqlalchemy import delete, desc, exists, func, select
+from sqlalchemy import delete, desc, exists, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import aliased
 
-from src.db import get_user_role_level
+from src.db import (
+    clear_user_cache_after_commit,
+    get_user_role_level,
+    invalidate_cached_user_after_commit,
+)
 from src.model import Enrollment, OldboyApplicant, StandbyReqTbl, User, UserRole
+from src.util import utcnow
 
 from .crud_repository import CRUDRepository
 
@@ -14,6 +21,15 @@ class UserRepository(CRUDRepository[User, str]):
     def model(self) -> type[User]:
         return User
 
+    def update(self, obj: User) -> User:
+        obj = super().update(obj)
+        invalidate_cached_user_after_commit(self.session, obj.id)
+        return obj
+
+    def delete(self, obj: User) -> None:
+        super().delete(obj)
+        invalidate_cached_user_after_commit(self.session, obj.id)
+
     def get_by_status_and_role(
         self, role: int, is_active: bool, is_banned: bool
     ) -> Sequence[User]:
@@ -49,6 +65,18 @@ class UserRepository(CRUDRepository[User, str]):
     def get_by_name(self, name: str) -> Sequence[User]:
         return self.session.scalars(select(User).where(User.name == name)).all()
 
+    def get_by_ids(self, ids: Iterable[str]) -> Sequence[User]:
+        ids = set(ids)
+        if not ids:
+            return []
+        return self.session.scalars(select(User).where(User.id.in_(ids))).all()
+
+    def get_by_names(self, names: Iterable[str]) -> Sequence[User]:
+        names = set(names)
+        if not names:
+            return []
+        return self.session.scalars(select(User).where(User.name.in_(names))).all()
+
     def get_executives(self) -> Sequence[User]:
         return self.session.scalars(
             select(User).where(User.role >= get_user_role_level("executive"))
@@ -64,6 +92,7 @@ class UserRepository(CRUDRepository[User, str]):
 
         with self.transaction:
             self.session.execute(stmt)
+        clear_user_cache_after_commit(self.session)
 
 
 class UserRoleRepository(CRUDRepository[UserRole, int]):
@@ -102,6 +131,22 @@ class StandbyReqTblRepository(CRUDRepository[StandbyReqTbl, str]):
             )
         ).all()
 
+    def get_unchecked_by_names(
+        self, deposit_names: Iterable[str], user_names: Iterable[str]
+    ) -> Sequence[StandbyReqTbl]:
+        deposit_names, user_names = set(deposit_names), set(user_names)
+        if not deposit_names and not user_names:
+            return []
+        return self.session.scalars(
+            select(StandbyReqTbl).where(
+                StandbyReqTbl.is_checked == False,
+                or_(
+                    StandbyReqTbl.deposit_name.in_(deposit_names),
+                    StandbyReqTbl.user_name.in_(user_names),
+                ),
+            )
+        ).all()
+
     def get_by_user_id(self, user_id: str) -> Optional[StandbyReqTbl]:
         return self.session.scalars(
             select(StandbyReqTbl)
@@ -120,6 +165,10 @@ class OldboyApplicantRepository(CRUDRepository[OldboyApplicant, str]):
         return self.session.scalars(stmt).all()
 
 
+# 4 bind parameters per row; stays under the 999-parameter limit of older SQLite builds
+ENROLLMENT_INSERT_CHUNK = 200
+
+
 class EnrollmentRepository(CRUDRepository[Enrollment, int]):
     @property
     def model(self) -> type[Enrollment]:
@@ -140,6 +189,65 @@ class EnrollmentRepository(CRUDRepository[Enrollment, int]):
             .limit(1)
         )
 
+    def create_many(self, rows: Iterable[tuple[int, int, str]]) -> int:
+        """
+        (year, semester, user_id) 목록을 여러 행 INSERT로 추가합니다. 이미 등록된
+        학기는 ON CONFLICT DO NOTHING으로 건너뛰며, 추가된 행 수를 반환합니다.
+        """
+        created_at = utcnow()
+        values = [
+            {
+                "year": year,
+                "semester": semester,
+                "user_id": user_id,
+                "created_at": created_at,
+            }
+            for year, semester, user_id in rows
+        ]
+        dialect_insert = (
+            postgresql.insert
+            if self.session.get_bind().dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        inserted = 0
+        with self.transaction:
+            for i in range(0, len(values), ENROLLMENT_INSERT_CHUNK):
+                stmt = (
+                    dialect_insert(Enrollment)
+                    .values(values[i : i + ENROLLMENT_INSERT_CHUNK])
+                    .on_conflict_do_nothing(
+                        index_elements=["year", "semester", "user_id"]
+                    )
+                )
+                inserted += self.session.execute(stmt).rowcount
+        return inserted
+
+    def get_last_by_user_ids(self, user_ids: Iterable[str]) -> dict[str, Enrollment]:
+        user_ids = set(user_ids)
+        if not user_ids:
+            return {}
+        # 사용자별 최신 학기 한 행만 읽도록 row_number()로 순위를 매깁니다
+        ranked = (
+            select(
+                Enrollment,
+                func.row_number()
+                .over(
+                    partition_by=Enrollment.user_id,
+                    order_by=(desc(Enrollment.year), desc(Enrollment.semester)),
+                )
+                .label("rank"),
+            )
+            .where(Enrollment.user_id.in_(user_ids))
+            .subquery()
+        )
+        last = aliased(Enrollment, ranked)
+        return {
+            enrollment.user_id: enrollment
+            for enrollment in self.session.scalars(
+                select(last).where(ranked.c.rank == 1)
+            )
+        }
+
 
 UserRepositoryDep = Annotated[UserRepository, Depends()]
 UserRoleRepositoryDep = Annotated[UserRoleRepository, Depends()]
@@ -11,6 +11,7 @@ from .key_value import kv_router
 from .major import major_router
 from .pig import pig_router
 from .scsc import scsc_router
+from .search import search_router
 from .sig import sig_router
 from .test_utils import test_router
 from .user import user_router
@@ -30,5 +31,6 @@ root_router.include_router(scsc_router, prefix="/api")
 root_router.include_router(bot_router, prefix="/api")
 root_router.include_router(w_router, prefix="/api")
 root_router.include_router(kv_router, prefix="/api")
+root_router.include_router(search_router, prefix="/api")
 if get_settings().enable_test_routes:
     root_router.include_router(test_router, prefix="/api/test")
@@ -1,7 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
 
 from src.dependencies import NullableUserDep, UserDep
-from src.schemas import ArticleResponse, ArticleWithAttachmentResponse
+from src.schemas import (
+    ArticleContentMode,
+    ArticlePageResponse,
+    ArticleResponse,
+    ArticleWithAttachmentResponse,
+)
 from src.services import ArticleServiceDep, BodyCreateArticle, BodyUpdateArticle
 
 article_router = APIRouter(tags=["article"])
@@ -27,16 +32,35 @@ async def get_article_list_by_board(
     article_service: ArticleServiceDep,
     current_user: NullableUserDep,
 ) -> list[ArticleResponse]:
-    return article_service.get_article_list_by_board(board_id, current_user)
+    return await article_service.get_article_list_by_board(board_id, current_user)
 
 
-@article_general_router.get("/{id}")
+# "api/articles/{board_id}/page": newest first, paginated with an opaque cursor
+@article_general_router.get("s/{board_id}/page")
+async def get_article_page_by_board(
+    board_id: int,
+    article_service: ArticleServiceDep,
+    current_user: NullableUserDep,
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    content: ArticleContentMode = "full",
+) -> ArticlePageResponse:
+    return await article_service.get_article_page_by_board(
+        board_id, current_user, cursor, limit, content
+    )
+
+
+@article_general_router.get("/{id}", response_model=ArticleWithAttachmentResponse)
 async def get_article_by_id(
     id: int,
     article_service: ArticleServiceDep,
     current_user: NullableUserDep,
-) -> ArticleWithAttachmentResponse:
-    return article_service.get_article_by_id(id, current_user)
+    request: Request,
+    response: Response,
+) -> ArticleWithAttachmentResponse | Response:
+    return await article_service.get_article_by_id(
+        id, current_user, request.headers, response
+    )
 
 
 @article_general_router.post("/update/{id}", status_code=204)
@@ -77,5 +101,21 @@ async def delete_article_by_executive(
     article_service.delete_article_by_executive(id, current_user)
 
 
+@article_executive_router.post("/content/gc")
+async def collect_unreferenced_article_content(
+    article_service: ArticleServiceDep,
+    current_user: UserDep,
+) -> dict:
+    return await article_service.collect_unreferenced_content(current_user)
+
+
+@article_executive_router.post("/search/reindex")
+async def reindex_article_search(
+    article_service: ArticleServiceDep,
+    current_user: UserDep,
+) -> dict:
+    return await article_service.reindex_search(current_user)
+
+
 article_router.include_router(article_general_router)
 article_router.include_router(article_executive_router)
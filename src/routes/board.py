@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from src.dependencies import UserDep
 from src.schemas import BoardResponse
@@ -25,9 +25,15 @@ async def get_board_by_id(id: int, board_service: BoardServiceDep) -> BoardRespo
     return BoardResponse.model_validate(board)
 
 
-@board_router.get("/boards")
-async def get_board_list(board_service: BoardServiceDep) -> Sequence[BoardResponse]:
-    board_list = board_service.get_board_list()
+@board_router.get("/boards", response_model=Sequence[BoardResponse])
+async def get_board_list(
+    board_service: BoardServiceDep,
+    request: Request,
+    response: Response,
+) -> Sequence[BoardResponse] | Response:
+    board_list = board_service.get_board_list(request.headers, response)
+    if isinstance(board_list, Response):
+        return board_list
     return BoardResponse.model_validate_list(board_list)
 
 
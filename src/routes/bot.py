@@ -23,3 +23,8 @@ async def get_status(bot_service: BotServiceDep):
 @bot_router.post("/bot/discord/login", status_code=204)
 async def login_without_permission(bot_service: BotServiceDep):
     await bot_service.login_without_permission()
+
+
+@bot_router.get("/executive/bot/amqp/metrics")
+async def get_amqp_metrics(bot_service: BotServiceDep):
+    return bot_service.get_amqp_metrics()
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Query, UploadFile
+from fastapi import APIRouter, Query, Request, Response, UploadFile
 from fastapi.responses import FileResponse
 
 from src.dependencies import UserDep
@@ -20,9 +20,11 @@ async def upload_file(
     return FileMetadataResponse.model_validate(file_meta)
 
 
-@file_router.get("/file/docs/download/{id}")
-async def get_docs_by_id(id: str, file_service: FileServiceDep) -> FileResponse:
-    return file_service.get_docs_by_id(id=id)
+@file_router.get("/file/docs/download/{id}", response_class=FileResponse)
+async def get_docs_by_id(
+    id: str, file_service: FileServiceDep, request: Request
+) -> Response:
+    return file_service.get_docs_by_id(id=id, request_headers=request.headers)
 
 
 @file_router.post("/file/image/upload", status_code=201)
@@ -35,9 +37,17 @@ async def upload_image(
     return FileMetadataResponse.model_validate(image_meta)
 
 
-@file_router.get("/file/image/download/{id}")
-async def get_image_by_id(id: str, file_service: FileServiceDep) -> FileResponse:
-    return file_service.get_image_by_id(id=id)
+@file_router.get("/file/image/download/{id}", response_class=FileResponse)
+async def get_image_by_id(
+    id: str,
+    file_service: FileServiceDep,
+    request: Request,
+    w: Optional[int] = Query(None, ge=1, le=4096, description="Desired width in px"),
+    format: Optional[Literal["webp", "avif"]] = Query(None),
+) -> Response:
+    return file_service.get_image_by_id(
+        id=id, request_headers=request.headers, width=w, fmt=format
+    )
 
 
 @file_router.get("/file/metadata")
@@ -47,3 +57,8 @@ async def get_file_metadata(
 ) -> list[FileMetadataResponse]:
     files = file_service.get_metadata_by_ids(ids or [])
     return FileMetadataResponse.model_validate_list(files)
+
+
+@file_router.post("/executive/file/compact")
+async def compact_files(file_service: FileServiceDep, current_user: UserDep) -> dict:
+    return await file_service.compact(current_user)
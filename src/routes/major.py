@@ -13,7 +13,7 @@ async def create_major(
     body: BodyCreateMajor,
     major_service: MajorServiceDep,
 ) -> MajorResponse:
-    major = major_service.create_major(body)
+    major = await major_service.create_major(body)
     return MajorResponse.model_validate(major)
 
 
@@ -21,7 +21,7 @@ async def create_major(
 async def get_all_majors(
     major_service: MajorServiceDep,
 ) -> Sequence[MajorResponse]:
-    major_list = major_service.get_all_majors()
+    major_list = await major_service.get_all_majors()
     return MajorResponse.model_validate_list(major_list)
 
 
@@ -30,7 +30,7 @@ async def get_major_by_id(
     id: int,
     major_service: MajorServiceDep,
 ) -> MajorResponse:
-    major = major_service.get_major_by_id(id)
+    major = await major_service.get_major_by_id(id)
     return MajorResponse.model_validate(major)
 
 
@@ -40,7 +40,7 @@ async def update_major(
     body: BodyCreateMajor,
     major_service: MajorServiceDep,
 ) -> None:
-    major_service.update_major(id, body)
+    await major_service.update_major(id, body)
 
 
 @major_router.post("/executive/major/delete/{id}", status_code=204)
@@ -48,4 +48,4 @@ async def delete_major(
     id: int,
     major_service: MajorServiceDep,
 ) -> None:
-    major_service.delete_major(id)
+    await major_service.delete_major(id)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Query
+
+from src.dependencies import NullableUserDep
+from src.schemas import ArticleSearchResponse, CommentSearchResponse
+from src.services import SearchServiceDep
+
+search_router = APIRouter(prefix="/search", tags=["search"])
+
+
+@search_router.get("/articles")
+async def search_articles(
+    search_service: SearchServiceDep,
+    current_user: NullableUserDep,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+) -> ArticleSearchResponse:
+    return search_service.search_articles(current_user, q, limit, offset)
+
+
+@search_router.get("/comments")
+async def search_comments(
+    search_service: SearchServiceDep,
+    current_user: NullableUserDep,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+) -> CommentSearchResponse:
+    return search_service.search_comments(current_user, q, limit, offset)
@@ -1,6 +1,6 @@
 from typing import Sequence
 
-from fastapi import APIRouter, UploadFile
+from fastapi import APIRouter, Request, Response, UploadFile
 from fastapi.responses import FileResponse
 
 from src.dependencies import UserDep
@@ -21,9 +21,11 @@ async def upload_file(
     return WHTMLMetadataResponse.model_validate(w_meta)
 
 
-@w_router.get("/w/{name}")
-async def get_w_by_name(name: str, w_service: WServiceDep) -> FileResponse:
-    return w_service.get_w_by_name(name)
+@w_router.get("/w/{name}", response_class=FileResponse)
+async def get_w_by_name(
+    name: str, w_service: WServiceDep, request: Request
+) -> Response:
+    return w_service.get_w_by_name(name, request.headers)
 
 
 @w_router.get("/executive/ws")
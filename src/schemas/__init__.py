@@ -1,4 +1,9 @@
-﻿from .article import ArticleResponse, ArticleWithAttachmentResponse
+﻿from .article import (
+    ArticleContentMode,
+    ArticlePageResponse,
+    ArticleResponse,
+    ArticleWithAttachmentResponse,
+)
 from .board import BoardResponse
 from .comment import CommentResponse
 from .file_metadata import FileMetadataResponse
@@ -6,6 +11,12 @@ from .key_value import KvResponse
 from .major import MajorResponse
 from .pig import PigMemberResponse, PigResponse, PigWebsiteResponse
 from .scsc_global_status import SCSCGlobalStatusResponse
+from .search import (
+    ArticleSearchHit,
+    ArticleSearchResponse,
+    CommentSearchHit,
+    CommentSearchResponse,
+)
 from .sig import SigMemberResponse, SigResponse
 from .user import (
     OldboyApplicantResponse,
@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Literal
 
 from .base import BaseResponse
 
+ArticleContentMode = Literal["full", "excerpt", "none"]
+
 
 class ArticleResponse(BaseResponse):
     id: int
@@ -12,8 +15,14 @@ class ArticleResponse(BaseResponse):
     created_at: datetime
     updated_at: datetime
     deleted_at: datetime | None = None
+    word_count: int | None = None
     content: str | None = None
 
 
 class ArticleWithAttachmentResponse(ArticleResponse):
     attachments: list[str]
+
+
+class ArticlePageResponse(BaseResponse):
+    items: list[ArticleResponse]
+    next_cursor: str | None = None
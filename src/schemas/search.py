@@ -0,0 +1,21 @@
+from .article import ArticleResponse
+from .base import BaseResponse
+from .comment import CommentResponse
+
+
+class ArticleSearchHit(ArticleResponse):
+    rank: float
+
+
+class CommentSearchHit(CommentResponse):
+    rank: float
+
+
+class ArticleSearchResponse(BaseResponse):
+    items: list[ArticleSearchHit]
+    next_offset: int | None = None
+
+
+class CommentSearchResponse(BaseResponse):
+    items: list[CommentSearchHit]
+    next_offset: int | None = None
@@ -23,6 +23,7 @@ from .scsc import (
     ctrl_status_available,
     map_semester_name,
 )
+from .search import SearchServiceDep
 from .sig import (
     BodyCreateSIG,
     BodyExecutiveJoinSIG,
@@ -1,11 +1,10 @@
-import os
-from os import path
+import asyncio
 from typing import Annotated, Optional
 
-import aiofiles
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Response
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
+from starlette.datastructures import Headers
 
 from src.amqp import mq_client
 from src.core import get_settings, logger
@@ -14,9 +13,33 @@ from src.repositories import (
     ArticleRepositoryDep,
     AttachmentRepositoryDep,
     BoardRepositoryDep,
+    SearchRepositoryDep,
+)
+from src.schemas import (
+    ArticleContentMode,
+    ArticlePageResponse,
+    ArticleResponse,
+    ArticleWithAttachmentResponse,
+)
+from src.storage import (
+    CONTENT_READ_ERROR,
+    CONTENT_UNAVAILABLE,
+    article_content_store,
+)
+from src.util import (
+    DELETED,
+    REVALIDATE,
+    decode_cursor,
+    encode_cursor,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    summarize_markdown,
+    utcnow,
+    validator_headers,
 )
-from src.schemas import ArticleResponse, ArticleWithAttachmentResponse
-from src.util import DELETED, utcnow
+
+ARTICLE_EXCERPT_LENGTH = 200
 
 
 class BodyCreateArticle(BaseModel):
@@ -39,10 +62,12 @@ class ArticleService:
         article_repository: ArticleRepositoryDep,
         attachment_repository: AttachmentRepositoryDep,
         board_repository: BoardRepositoryDep,
+        search_repository: SearchRepositoryDep,
     ) -> None:
         self.article_repository = article_repository
         self.attachment_repository = attachment_repository
         self.board_repository = board_repository
+        self.search_repository = search_repository
 
     async def create_article(
         self, body: BodyCreateArticle, user_id: str, user_role: int
@@ -58,22 +83,24 @@ class ArticleService:
                 detail="You are not allowed to write this article",
             )
 
-        article = Article(title=body.title, author_id=user_id, board_id=body.board_id)
+        # written before the row, so a failed write leaves the database untouched
+        content_hash = await article_content_store.write(body.content)
+        excerpt, word_count = summarize_markdown(body.content, ARTICLE_EXCERPT_LENGTH)
+        article = Article(
+            title=body.title,
+            author_id=user_id,
+            board_id=body.board_id,
+            excerpt=excerpt,
+            word_count=word_count,
+            content_hash=content_hash,
+        )
         try:
             article = self.article_repository.create(article)
         except IntegrityError as exc:
             raise HTTPException(
                 status_code=409, detail="unique field already exists"
             ) from exc
-        try:
-            file_path = path.join(get_settings().article_dir, f"{article.id}.md")
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as fp:
-                await fp.write(body.content)
-        except Exception:
-            logger.error(
-                f"err_type=create_article_ctrl ; failed to write file ; {article.id=}",
-                exc_info=True,
-            )
+        self.search_repository.upsert(article.id, article.title, body.content)
         attach_inserted = self.attachment_repository.insert_or_ignore_list(
             article.id, body.attachments
         )
@@ -113,45 +140,95 @@ class ArticleService:
 
         return article_response
 
-    def get_article_list_by_board(
+    async def get_article_list_by_board(
         self, board_id: int, current_user: Optional[User]
     ) -> list[ArticleResponse]:
-        board = self.board_repository.get_by_id(board_id)
-        if board is None:
-            raise HTTPException(404, detail="Board not found")
-
-        if board.reading_permission_level > 0:
-            if current_user is None:
-                raise HTTPException(status_code=401, detail="Not authenticated")
-            if current_user.role < board.reading_permission_level:
-                raise HTTPException(
-                    403, detail="You are not allowed to read this board"
-                )
+        self._check_board_readable(board_id, current_user)
 
         articles = self.article_repository.get_articles_by_board_id(board_id)
+        contents = await article_content_store.read_many(
+            article for article in articles if not article.is_deleted
+        )
+        remaining_contents = iter(contents)
         result: list[ArticleResponse] = []
         for article in articles:
-            if article.is_deleted:
-                result.append(
-                    ArticleResponse.model_validate(article).model_copy(
-                        update={"content": DELETED}
-                    )
-                )
-            else:
-                content = self._read_file(
-                    path.join(get_settings().article_dir, f"{article.id}.md")
-                )
-                result.append(
-                    ArticleResponse.model_validate(article).model_copy(
-                        update={"content": content}
-                    )
+            content = DELETED if article.is_deleted else next(remaining_contents)
+            result.append(
+                ArticleResponse.model_validate(article).model_copy(
+                    update={"content": content}
                 )
+            )
 
         return result
 
-    def get_article_by_id(
-        self, id: int, current_user: Optional[User]
-    ) -> ArticleWithAttachmentResponse:
+    async def get_article_page_by_board(
+        self,
+        board_id: int,
+        current_user: Optional[User],
+        cursor: Optional[str],
+        limit: int,
+        content_mode: ArticleContentMode,
+    ) -> ArticlePageResponse:
+        self._check_board_readable(board_id, current_user)
+
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as exc:
+            raise HTTPException(400, detail="invalid cursor") from exc
+
+        articles = self.article_repository.get_articles_page_by_board_id(
+            board_id, limit + 1, after
+        )
+        has_next = len(articles) > limit
+        articles = articles[:limit]
+
+        # excerpts are precomputed on write; only articles written before that
+        # (excerpt is NULL) need their body read in excerpt mode
+        to_read = [
+            article
+            for article in articles
+            if not article.is_deleted
+            and (
+                content_mode == "full"
+                or (content_mode == "excerpt" and article.excerpt is None)
+            )
+        ]
+        bodies = dict(
+            zip(
+                (article.id for article in to_read),
+                await article_content_store.read_many(to_read),
+            )
+        )
+
+        items: list[ArticleResponse] = []
+        for article in articles:
+            update: dict = {"content": None}
+            if article.is_deleted:
+                update["content"] = DELETED
+            elif content_mode == "full":
+                update["content"] = bodies[article.id]
+            elif content_mode == "excerpt" and article.excerpt is not None:
+                update["content"] = article.excerpt
+            elif content_mode == "excerpt":
+                update["content"], update["word_count"] = summarize_markdown(
+                    bodies[article.id], ARTICLE_EXCERPT_LENGTH
+                )
+            items.append(
+                ArticleResponse.model_validate(article).model_copy(update=update)
+            )
+
+        next_cursor = None
+        if has_next:
+            next_cursor = encode_cursor(articles[-1].created_at, articles[-1].id)
+        return ArticlePageResponse(items=items, next_cursor=next_cursor)
+
+    async def get_article_by_id(
+        self,
+        id: int,
+        current_user: Optional[User],
+        request_headers: Headers,
+        response: Response,
+    ) -> ArticleWithAttachmentResponse | Response:
         article = self.article_repository.get_by_id(id)
         if not article:
             raise HTTPException(404, detail="Article not found")
@@ -167,14 +244,27 @@ class ArticleService:
                     403, detail="You are not allowed to read this article"
                 )
 
+        # checked after the permission checks so a 304 never leaks existence
+        etag = make_etag(
+            article.id, article.updated_at, article.content_hash, article.is_deleted
+        )
+        cache_control = (
+            f"private, {REVALIDATE}"
+            if board.reading_permission_level > 0
+            else REVALIDATE
+        )
+        if is_not_modified(request_headers, etag, article.updated_at):
+            return not_modified_response(etag, article.updated_at, cache_control)
+        response.headers.update(
+            validator_headers(etag, article.updated_at, cache_control)
+        )
+
         if article.is_deleted:
             return ArticleWithAttachmentResponse.model_validate(
                 {**article.__dict__, "content": DELETED, "attachments": []}
             )
 
-        content = self._read_file(
-            path.join(get_settings().article_dir, f"{article.id}.md")
-        )
+        content = await article_content_store.read(article)
         attachments = self.attachment_repository.select_by_article_id(article.id)
         return ArticleWithAttachmentResponse.model_validate(
             {
@@ -184,24 +274,52 @@ class ArticleService:
             }
         )
 
-    @staticmethod
-    def _read_file(file_path: str) -> str:
-        if os.path.exists(file_path):
-            try:
-                with open(
-                    file_path,
-                    "r",
-                    encoding="utf-8",
-                ) as fp:
-                    return fp.read()
-            except OSError:
-                logger.error(
-                    f"err_type=get_article_by_id ; error occurred during reading a file ; {file_path=}",
-                    exc_info=True,
+    async def collect_unreferenced_content(self, current_user: User) -> dict:
+        referenced = self.article_repository.get_content_hashes()
+        removed = await asyncio.to_thread(
+            article_content_store.blob_store.collect_garbage,
+            referenced,
+            get_settings().article_blob_gc_grace_seconds,
+        )
+        logger.info(
+            f"info_type=article_content_gc ; removed={removed} ; referenced={len(referenced)} ; executor={current_user.id}"
+        )
+        return {"removed": removed}
+
+    async def reindex_search(self, current_user: User) -> dict:
+        articles = [
+            article
+            for article in self.article_repository.list_all()
+            if not article.is_deleted
+        ]
+        bodies = await article_content_store.read_many(articles)
+        self.search_repository.upsert_many(
+            (
+                article.id,
+                article.title,
+                "" if body in (CONTENT_UNAVAILABLE, CONTENT_READ_ERROR) else body,
+            )
+            for article, body in zip(articles, bodies)
+        )
+        logger.info(
+            f"info_type=article_search_reindexed ; count={len(articles)} ; executor={current_user.id}"
+        )
+        return {"indexed": len(articles)}
+
+    def _check_board_readable(
+        self, board_id: int, current_user: Optional[User]
+    ) -> None:
+        board = self.board_repository.get_by_id(board_id)
+        if board is None:
+            raise HTTPException(404, detail="Board not found")
+
+        if board.reading_permission_level > 0:
+            if current_user is None:
+                raise HTTPException(status_code=401, detail="Not authenticated")
+            if current_user.role < board.reading_permission_level:
+                raise HTTPException(
+                    403, detail="You are not allowed to read this board"
                 )
-                return "Error reading content."
-        logger.warning(f"Article file missing: {file_path=}")
-        return "Content currently unavailable."
 
     async def _update_article(
         self, article: Article, body: BodyUpdateArticle, current_user: User
@@ -214,8 +332,13 @@ class ArticleService:
                 403, detail="You are not allowed to write to this board"
             )
 
+        # written before the row, so a failed write leaves the database untouched
+        article.content_hash = await article_content_store.write(body.content)
         article.title = body.title
         article.board_id = body.board_id
+        article.excerpt, article.word_count = summarize_markdown(
+            body.content, ARTICLE_EXCERPT_LENGTH
+        )
         article.updated_at = utcnow()
         try:
             article = self.article_repository.update(article)
@@ -226,15 +349,7 @@ class ArticleService:
         logger.info(
             f"info_type=article_updated ; article_id={article.id} ; title={body.title} ; revisioner_id={current_user.id} ; board_id={body.board_id}"
         )
-        try:
-            file_path = path.join(get_settings().article_dir, f"{article.id}.md")
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as fp:
-                await fp.write(body.content)
-        except Exception:
-            logger.error(
-                f"err_type=update_article_by_author ; failed to write file ; {article.id=}",
-                exc_info=True,
-            )
+        self.search_repository.upsert(article.id, article.title, body.content)
         self.attachment_repository.delete_by_article_id(article.id)
         self.attachment_repository.insert_or_ignore_list(article.id, body.attachments)
 
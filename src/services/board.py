@@ -1,13 +1,21 @@
 from typing import Annotated, Optional, Sequence
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Response
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
+from starlette.datastructures import Headers
 
 from src.core import logger
 from src.model import Board, User
 from src.repositories import BoardRepositoryDep
-from src.util import utcnow
+from src.util import (
+    REVALIDATE,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    utcnow,
+    validator_headers,
+)
 
 
 class BodyCreateBoard(BaseModel):
@@ -61,8 +69,14 @@ class BoardService:
         return board
 
     def get_board_list(
-        self,
-    ) -> Sequence[Board]:
+        self, request_headers: Headers, response: Response
+    ) -> Sequence[Board] | Response:
+        count, updated_at = self.board_repository.get_list_version()
+        etag = make_etag("boards", count, updated_at)
+        # no Last-Modified: deleting a board does not move the latest updated_at
+        if is_not_modified(request_headers, etag):
+            return not_modified_response(etag, None, REVALIDATE)
+        response.headers.update(validator_headers(etag, None, REVALIDATE))
         return self.board_repository.list_all()
 
     def update_board(self, id: int, current_user: User, body: BodyUpdateBoard) -> None:
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 
 from src.amqp import mq_client
 from src.core import get_settings, logger
+from src.dependencies import BotHTTPClientDep
 
 
 class BodySendMessageToID(BaseModel):
@@ -16,7 +17,9 @@ class BodySendMessageToID(BaseModel):
 class BotService:
     def __init__(
         self,
-    ) -> None: ...
+        http_client: BotHTTPClientDep,
+    ) -> None:
+        self.http_client = http_client
 
     async def get_discord_invite(self):
         try:
@@ -36,12 +39,14 @@ class BotService:
             action_code=1002, body=body.model_dump()
         )
 
+    def get_amqp_metrics(self) -> dict:
+        return mq_client.metrics()
+
     async def get_status(self):
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(5.0, connect=2.0)
-            ) as client:
-                res = await client.get(f"http://{get_settings().bot_host}:8081/status")
+            res = await self.http_client.get(
+                f"http://{get_settings().bot_host}:8081/status"
+            )
         except httpx.TimeoutException:
             logger.error("err_type=bot_discord_status ; err_code=504 ; msg=timeout")
             raise HTTPException(504, "Bot did not respond")
@@ -59,10 +64,9 @@ class BotService:
 
     async def login_without_permission(self):
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(5.0, connect=2.0)
-            ) as client:
-                res = await client.post(f"http://{get_settings().bot_host}:8081/login")
+            res = await self.http_client.post(
+                f"http://{get_settings().bot_host}:8081/login"
+            )
         except httpx.TimeoutException:
             logger.error("err_type=bot_discord_login ; err_code=504 ; msg=timeout")
             raise HTTPException(504, "Bot did not respond")
@@ -1,14 +1,61 @@
+import asyncio
 import os
 from os import path
-from typing import Annotated, Sequence
+from typing import Annotated, Optional, Sequence
 
-from fastapi import Depends, File, HTTPException, UploadFile
+from fastapi import Depends, File, HTTPException, Response, UploadFile
 from fastapi.responses import FileResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import Message, Receive, Scope, Send
 
 from src.core import get_settings, logger
 from src.model import FileMetadata, User
 from src.repositories import FileMetadataRepositoryDep
-from src.util import create_uuid, split_filename, validate_and_read_file
+from src.storage import (
+    IMAGE_VARIANT_FORMATS,
+    collect_unreferenced_uploads,
+    hash_file,
+    image_variant_worker,
+    remove_stale_temp_files,
+    stage_upload,
+)
+from src.util import (
+    REVALIDATE,
+    create_uuid,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    split_filename,
+    validate_upload_file,
+    validator_headers,
+)
+
+from .user import PFP_DIR
+
+IMAGE_CACHE_CONTROL = "public, max-age=86400"
+
+
+class DownloadFileResponse(FileResponse):
+    """
+    A `FileResponse` read in 1 MiB chunks instead of 64 KiB, so a 10 MB document
+    takes ten worker-thread reads rather than 160. Range requests (206) are handled
+    by `FileResponse`, and on ASGI servers with the `http.response.pathsend`
+    extension the file is handed to the server to send without copying.
+    """
+
+    chunk_size = 1024 * 1024
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 416:
+                # Starlette omits the range unit (RFC 9110 14.4: `bytes */{size}`)
+                headers = MutableHeaders(scope=message)
+                content_range = headers.get("content-range", "")
+                if content_range.startswith("*/"):
+                    headers["Content-Range"] = f"bytes {content_range}"
+            await send(message)
+
+        await super().__call__(scope, receive, send_wrapper)
 
 
 class FileService:
@@ -21,84 +68,158 @@ class FileService:
     async def upload_file(
         self, current_user: User, file: UploadFile = File(...)
     ) -> FileMetadata:
-        content, basename, ext, mime_type = await validate_and_read_file(
+        basename, ext, mime_type = validate_upload_file(
             file, valid_ext=frozenset({"pdf", "docx", "pptx"})
         )
-        uuid = create_uuid()
-        with open(path.join(get_settings().file_dir, f"{uuid}.{ext}"), "wb") as fp:
-            fp.write(content)
-
-        file_meta = FileMetadata(
-            id=uuid,
-            original_filename=f"{basename}.{ext}",
-            size=len(content),
-            mime_type=mime_type,
-            owner=current_user.id,
+        file_meta, _ = await self._store(
+            current_user, file, basename, ext, mime_type, get_settings().file_dir
         )
-
-        try:
-            file_meta = self.file_metadata_repository.create(file_meta)
-        except Exception:
-            try:
-                os.remove(path.join(get_settings().file_dir, f"{uuid}.{ext}"))
-            except OSError:
-                logger.warning(
-                    "warn_type=file_upload_cleanup_failed ; %s",
-                    f"{uuid}.{ext}",
-                    exc_info=True,
-                )
-            raise
-
         return file_meta
 
-    def get_docs_by_id(self, id: str) -> FileResponse:
+    def get_docs_by_id(
+        self, id: str, request_headers: Headers
+    ) -> FileResponse | Response:
         file_meta = self.file_metadata_repository.get_by_id(id)
         if not file_meta:
             raise HTTPException(404, detail="file not found")
-        _, ext = split_filename(file_meta.original_filename)
-        return FileResponse(path.join(get_settings().file_dir, f"{file_meta.id}.{ext}"))
+        # a file id always refers to the same bytes; the validators also answer If-Range
+        etag = make_etag(file_meta.id, file_meta.size)
+        if is_not_modified(request_headers, etag, file_meta.created_at):
+            return not_modified_response(etag, file_meta.created_at, REVALIDATE)
+        return DownloadFileResponse(
+            self._storage_path(file_meta),
+            media_type=file_meta.mime_type,
+            filename=file_meta.original_filename,
+            headers=validator_headers(etag, file_meta.created_at, REVALIDATE),
+        )
 
     async def upload_image(
         self, current_user: User, file: UploadFile = File(...)
     ) -> FileMetadata:
-        content, basename, ext, mime_type = await validate_and_read_file(
+        basename, ext, mime_type = validate_upload_file(
             file,
             valid_mime_type="image/",
             valid_ext=frozenset({"jpg", "jpeg", "png", "svg", "gif", "webp"}),
         )
+        image, written = await self._store(
+            current_user, file, basename, ext, mime_type, get_settings().image_dir
+        )
+        if written:
+            image_variant_worker.schedule(self._storage_path(image))
+        return image
 
+    async def _store(
+        self,
+        current_user: User,
+        file: UploadFile,
+        basename: str,
+        ext: str,
+        mime_type: str,
+        directory: str,
+    ) -> tuple[FileMetadata, bool]:
+        """
+        Stages the upload and creates its row. If a file with the same content is
+        already stored, the row points at that file and the upload is discarded;
+        otherwise it is moved to `{id}.{ext}`. Returns the row and whether a new
+        file was written.
+        """
+        staged = await stage_upload(file, directory)
         uuid = create_uuid()
-        with open(path.join(get_settings().image_dir, f"{uuid}.{ext}"), "wb") as fp:
-            fp.write(content)
+        existing = self.file_metadata_repository.get_by_content_hash(
+            staged.sha256, image=mime_type.startswith("image/")
+        )
+        if existing is not None and path.exists(self._storage_path(existing)):
+            await staged.discard()
+            storage_name, written = self._storage_name(existing), False
+        else:
+            storage_name, written = f"{uuid}.{ext}", True
+            await staged.commit(path.join(directory, storage_name))
 
-        image = FileMetadata(
+        file_meta = FileMetadata(
             id=uuid,
             original_filename=f"{basename}.{ext}",
-            size=len(content),
+            size=staged.size,
             mime_type=mime_type,
             owner=current_user.id,
+            content_hash=staged.sha256,
+            storage_name=storage_name,
         )
         try:
-            image = self.file_metadata_repository.create(image)
+            file_meta = self.file_metadata_repository.create(file_meta)
         except Exception:
-            try:
-                os.remove(path.join(get_settings().image_dir, f"{uuid}.{ext}"))
-            except OSError:
-                logger.warning(
-                    "warn_type=image_upload_cleanup_failed ; %s",
-                    f"{uuid}.{ext}",
-                    exc_info=True,
-                )
+            if written:
+                try:
+                    os.remove(path.join(directory, storage_name))
+                except OSError:
+                    logger.warning(
+                        "warn_type=file_upload_cleanup_failed ; %s",
+                        storage_name,
+                        exc_info=True,
+                    )
             raise
 
-        return image
+        if not written:
+            logger.info(
+                f"info_type=file_upload_deduplicated ; id={uuid} ; {storage_name=} ; executer_id={current_user.id}"
+            )
+        return file_meta, written
+
+    @staticmethod
+    def _storage_name(file_meta: FileMetadata) -> str:
+        if file_meta.storage_name:
+            return file_meta.storage_name
+        _, ext = split_filename(file_meta.original_filename)
+        return f"{file_meta.id}.{ext}"
 
-    def get_image_by_id(self, id: str) -> FileResponse:
+    @classmethod
+    def _storage_path(cls, file_meta: FileMetadata) -> str:
+        directory = (
+            get_settings().image_dir
+            if file_meta.mime_type.startswith("image/")
+            else get_settings().file_dir
+        )
+        return path.join(directory, cls._storage_name(file_meta))
+
+    def get_image_by_id(
+        self,
+        id: str,
+        request_headers: Headers,
+        width: Optional[int] = None,
+        fmt: Optional[str] = None,
+    ) -> FileResponse | Response:
+        """
+        Serves the image as uploaded or, if `width` or `fmt` is given, its closest
+        pre-generated variant. Until the variants are generated, and for images
+        without variants (SVG, GIF), the original is served instead. Anything but
+        the requested bucket is sent with `no-cache`, so clients pick up the right
+        variant once it exists.
+        """
         image = self.file_metadata_repository.get_by_id(id)
         if not image:
             raise HTTPException(404, detail="image not found")
-        _, ext = split_filename(image.original_filename)
-        return FileResponse(path.join(get_settings().image_dir, f"{image.id}.{ext}"))
+        file_path = self._storage_path(image)
+        media_type = None
+        # an image id always refers to the same bytes
+        etag = make_etag(image.id, image.size)
+        cache_control = IMAGE_CACHE_CONTROL
+
+        if width is not None or fmt is not None:
+            variant, pending = image_variant_worker.find(file_path, width, fmt)
+            if variant is not None:
+                file_path = variant
+                media_type = IMAGE_VARIANT_FORMATS[split_filename(variant)[1]]
+                etag = make_etag(image.id, image.size, path.basename(variant))
+            if pending:
+                # the requested bucket may exist soon; do not let clients keep this
+                cache_control = REVALIDATE
+
+        if is_not_modified(request_headers, etag, image.created_at):
+            return not_modified_response(etag, image.created_at, cache_control)
+        return FileResponse(
+            file_path,
+            media_type=media_type,
+            headers=validator_headers(etag, image.created_at, cache_control),
+        )
 
     def get_metadata_by_ids(self, ids: Sequence[str]) -> list[FileMetadata]:
         if not ids:
@@ -110,5 +231,82 @@ class FileService:
         record_map = {record.id: record for record in records}
         return [record_map[i] for i in normalized if i in record_map]
 
+    async def compact(self, current_user: User) -> dict:
+        """
+        Deduplicates stored files:
+        1. Removes files that no row refers to any more, e.g. duplicates released by
+           an earlier run, once they are older than `FILE_GC_GRACE_SECONDS`, and
+           temporary files left by interrupted uploads in every upload directory.
+        2. Hashes files uploaded before deduplication.
+        3. Points every row at the oldest stored file with the same content.
+
+        Files released in step 3 are only removed by the next run, after this
+        transaction has been committed.
+        """
+        settings = get_settings()
+        rows = list(self.file_metadata_repository.list_all())
+        referenced = {split_filename(self._storage_name(row))[0] for row in rows}
+        removed = 0
+        for directory in (settings.file_dir, settings.image_dir):
+            removed += await asyncio.to_thread(
+                collect_unreferenced_uploads,
+                directory,
+                referenced,
+                settings.file_gc_grace_seconds,
+            )
+        for directory in (
+            settings.file_dir,
+            settings.image_dir,
+            settings.w_html_dir,
+            PFP_DIR,
+        ):
+            removed += await asyncio.to_thread(
+                remove_stale_temp_files, directory, settings.file_gc_grace_seconds
+            )
+
+        changed: dict[str, FileMetadata] = {}
+        hashed = 0
+        unhashed = [row for row in rows if row.content_hash is None]
+        hashes = await asyncio.gather(
+            *(
+                asyncio.to_thread(hash_file, self._storage_path(row))
+                for row in unhashed
+            ),
+            return_exceptions=True,
+        )
+        for row, content_hash in zip(unhashed, hashes):
+            if isinstance(content_hash, BaseException):
+                logger.warning(
+                    f"warn_type=file_compact_hash_failed ; id={row.id} ; msg={content_hash!r}"
+                )
+                continue
+            row.content_hash = content_hash
+            row.storage_name = self._storage_name(row)
+            changed[row.id] = row
+            hashed += 1
+
+        groups: dict[tuple[bool, str], list[FileMetadata]] = {}
+        for row in rows:
+            if row.content_hash is not None:
+                key = (row.mime_type.startswith("image/"), row.content_hash)
+                groups.setdefault(key, []).append(row)
+        repointed = 0
+        for group in groups.values():
+            group.sort(key=lambda row: row.created_at)
+            keep = next((r for r in group if path.exists(self._storage_path(r))), None)
+            if keep is None:
+                continue
+            for row in group:
+                if row.storage_name != keep.storage_name:
+                    row.storage_name = keep.storage_name
+                    changed[row.id] = row
+                    repointed += 1
+
+        self.file_metadata_repository.update_many(changed.values())
+        logger.info(
+            f"info_type=file_compact ; {removed=} ; {hashed=} ; {repointed=} ; executor={current_user.id}"
+        )
+        return {"removed": removed, "hashed": hashed, "repointed": repointed}
+
 
 FileServiceDep = Annotated[FileService, Depends()]
@@ -6,7 +6,7 @@ from sqlalchemy.exc import IntegrityError
 
 from src.core import logger
 from src.model import Major
-from src.repositories import MajorRepositoryDep
+from src.repositories import AsyncMajorRepositoryDep
 
 
 class BodyCreateMajor(BaseModel):
@@ -15,30 +15,32 @@ class BodyCreateMajor(BaseModel):
 
 
 class MajorService:
-    def __init__(self, major_repository: MajorRepositoryDep):
+    """Served from `AsyncSessionDep`, so its queries never block the event loop."""
+
+    def __init__(self, major_repository: AsyncMajorRepositoryDep):
         self.major_repository = major_repository
 
-    def create_major(self, body: BodyCreateMajor) -> Major:
+    async def create_major(self, body: BodyCreateMajor) -> Major:
         major = Major(college=body.college, major_name=body.major_name)
         try:
-            major = self.major_repository.create(major)
+            major = await self.major_repository.create(major)
         except IntegrityError:
             raise HTTPException(409, detail="major already exists")
 
         logger.info(f"info_type=major_created ; major_id={major.id}")
         return major
 
-    def get_all_majors(self) -> Sequence[Major]:
-        return self.major_repository.list_all()
+    async def get_all_majors(self) -> Sequence[Major]:
+        return await self.major_repository.list_all()
 
-    def get_major_by_id(self, id: int) -> Major:
-        major = self.major_repository.get_by_id(id)
+    async def get_major_by_id(self, id: int) -> Major:
+        major = await self.major_repository.get_by_id(id)
         if not major:
             raise HTTPException(404, detail="major not found")
         return major
 
-    def update_major(self, id: int, body: BodyCreateMajor) -> None:
-        major = self.major_repository.get_by_id(id)
+    async def update_major(self, id: int, body: BodyCreateMajor) -> None:
+        major = await self.major_repository.get_by_id(id)
         if not major:
             raise HTTPException(404, detail="major not found")
 
@@ -46,19 +48,19 @@ class MajorService:
         major.major_name = body.major_name
 
         try:
-            self.major_repository.update(major)
+            await self.major_repository.update(major)
         except IntegrityError:
             raise HTTPException(409, detail="major already exists")
 
         logger.info(f"info_type=major_updated ; major_id={major.id}")
 
-    def delete_major(self, id: int) -> None:
-        major = self.major_repository.get_by_id(id)
+    async def delete_major(self, id: int) -> None:
+        major = await self.major_repository.get_by_id(id)
         if not major:
             raise HTTPException(404, detail="major not found")
 
         try:
-            self.major_repository.delete(major)
+            await self.major_repository.delete(major)
         except IntegrityError:
             raise HTTPException(
                 status_code=400,
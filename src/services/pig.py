@@ -308,25 +308,17 @@ class PigService:
     def get_members(self, id: int) -> Sequence[PigMemberResponse]:
         self.get_by_id(id)
 
-        members = self.pig_member_repository.get_members_by_pig_id(id)
-        res: list[PigMemberResponse] = []
-        for member in members:
-            user = self.user_repository.get_by_id(member.user_id)
-
-            user_response = None
-            if user:
-                user_response = UserResponse.model_validate(user)
-
-            member_response = PigMemberResponse(
+        rows = self.pig_member_repository.get_members_with_users_by_pig_id(id)
+        return [
+            PigMemberResponse(
                 id=member.id,
                 ig_id=member.ig_id,
                 user_id=member.user_id,
                 created_at=member.created_at,
-                user=user_response,
+                user=UserResponse.model_validate(user) if user else None,
             )
-            res.append(member_response)
-
-        return res
+            for member, user in rows
+        ]
 
     async def join_pig(self, id: int, current_user: User) -> None:
         pig = self.get_by_id(id)
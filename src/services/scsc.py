@@ -7,7 +7,12 @@ from sqlalchemy import case, exists, select, update
 
 from src.amqp import mq_client
 from src.core import logger
-from src.db import SessionDep, backup_db_before_status_change, get_user_role_level
+from src.db import (
+    SessionDep,
+    backup_db_before_status_change,
+    clear_user_cache,
+    get_user_role_level,
+)
 from src.dependencies import SCSCGlobalStatusDep
 from src.model import PIG, SIG, Enrollment, SCSCGlobalStatus, SCSCStatus, User
 from src.repositories import (
@@ -275,6 +280,8 @@ class SCSCService:
             f"info_type=scsc_global_status_updated ; old_status={old_status} ; new_status={new_status} ; executor={current_user_id}"
         )
         self.session.commit()
+        # bulk UPDATEs above changed is_active/role of many users at once
+        clear_user_cache()
 
 
 SCSCServiceDep = Annotated[SCSCService, Depends()]
@@ -0,0 +1,47 @@
+from typing import Annotated, Optional
+
+from fastapi import Depends
+
+from src.model import User
+from src.repositories import SearchRepositoryDep
+from src.schemas import (
+    ArticleSearchHit,
+    ArticleSearchResponse,
+    CommentSearchHit,
+    CommentSearchResponse,
+)
+
+
+class SearchService:
+    def __init__(self, search_repository: SearchRepositoryDep) -> None:
+        self.search_repository = search_repository
+
+    def search_articles(
+        self, current_user: Optional[User], q: str, limit: int, offset: int
+    ) -> ArticleSearchResponse:
+        reader_role = current_user.role if current_user else 0
+        rows = self.search_repository.search_articles(q, reader_role, limit + 1, offset)
+        # listing only needs a preview; the stored excerpt avoids reading bodies
+        items = [
+            ArticleSearchHit.model_validate(
+                {**article.__dict__, "content": article.excerpt, "rank": rank}
+            )
+            for article, rank in rows[:limit]
+        ]
+        next_offset = offset + limit if len(rows) > limit else None
+        return ArticleSearchResponse(items=items, next_offset=next_offset)
+
+    def search_comments(
+        self, current_user: Optional[User], q: str, limit: int, offset: int
+    ) -> CommentSearchResponse:
+        reader_role = current_user.role if current_user else 0
+        rows = self.search_repository.search_comments(q, reader_role, limit + 1, offset)
+        items = [
+            CommentSearchHit.model_validate({**comment.__dict__, "rank": rank})
+            for comment, rank in rows[:limit]
+        ]
+        next_offset = offset + limit if len(rows) > limit else None
+        return CommentSearchResponse(items=items, next_offset=next_offset)
+
+
+SearchServiceDep = Annotated[SearchService, Depends()]
@@ -286,25 +286,17 @@ class SigService:
     def get_members(self, id: int) -> Sequence[SigMemberResponse]:
         self.get_by_id(id)
 
-        members = self.sig_member_repository.get_members_by_sig_id(id)
-        res: list[SigMemberResponse] = []
-        for member in members:
-            user = self.user_repository.get_by_id(member.user_id)
-
-            user_response = None
-            if user:
-                user_response = UserResponse.model_validate(user)
-
-            member_response = SigMemberResponse(
+        rows = self.sig_member_repository.get_members_with_users_by_sig_id(id)
+        return [
+            SigMemberResponse(
                 id=member.id,
                 ig_id=member.ig_id,
                 user_id=member.user_id,
                 created_at=member.created_at,
-                user=user_response,
+                user=UserResponse.model_validate(user) if user else None,
             )
-            res.append(member_response)
-
-        return res
+            for member, user in rows
+        ]
 
     async def join_sig(self, id: int, current_user: User) -> None:
         sig = self.get_by_id(id)
@@ -1,20 +1,27 @@
-import asyncio
 import hmac
+import os
+from collections import defaultdict
+from contextlib import suppress
 from datetime import timedelta
-from typing import Annotated, Optional, Sequence
+from functools import partial
+from itertools import islice
+from typing import Annotated, Callable, Iterator, Optional, Sequence
 
-import aiofiles
 import jwt
-from aiofiles import os as aiofiles_os
 from fastapi import Depends, HTTPException, UploadFile
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
 
 from src.amqp import mq_client
 from src.core import get_settings, logger
-from src.db import get_user_role_level
+from src.db import call_after_commit, get_user_role_level
 from src.dependencies import SCSCGlobalStatusDep
-from src.model import Enrollment, OldboyApplicant, StandbyReqTbl, User
+from src.model import (
+    OldboyApplicant,
+    SCSCGlobalStatus,
+    StandbyReqTbl,
+    User,
+)
 from src.repositories import (
     EnrollmentRepositoryDep,
     OldboyApplicantRepositoryDep,
@@ -23,17 +30,20 @@ from src.repositories import (
     UserRoleRepositoryDep,
 )
 from src.schemas import PublicUserResponse, UserResponse
+from src.storage import image_variant_worker, remove_variants, stage_upload
 from src.util import (
+    STANDBY_CSV_ENCODINGS,
     DepositDTO,
+    detect_encoding,
     generate_user_hash,
     get_next_year_semester,
     is_valid_img_url,
     is_valid_phone,
     is_valid_student_id,
-    process_standby_user,
+    iter_standby_deposits,
     sha256_hash,
     utcnow,
-    validate_and_read_file,
+    validate_upload_file,
 )
 
 from .key_value import KvServiceDep
@@ -105,6 +115,15 @@ class ProcessDepositResponse(BaseModel):
     model_config = {"from_attributes": True}  # enables reading from ORM objects
 
 
+PFP_DIR = "static/image/pfps"
+
+
+def _remove_pfp(file_path: str) -> None:
+    remove_variants(file_path)
+    with suppress(FileNotFoundError):
+        os.remove(file_path)
+
+
 class UserService:
     def __init__(
         self,
@@ -123,7 +142,7 @@ class UserService:
             raise HTTPException(422, detail="invalid student_id")
 
         if body.profile_picture_is_url:
-            valid = await asyncio.to_thread(is_valid_img_url, body.profile_picture)
+            valid = await is_valid_img_url(body.profile_picture)
             if not valid:
                 raise HTTPException(400, detail="invalid image url")
 
@@ -246,7 +265,7 @@ class UserService:
 
         if body.profile_picture:
             if body.profile_picture_is_url:
-                valid = await asyncio.to_thread(is_valid_img_url, body.profile_picture)
+                valid = await is_valid_img_url(body.profile_picture)
                 if not valid:
                     raise HTTPException(400, detail="invalid image url")
             current_user.profile_picture = body.profile_picture
@@ -260,29 +279,39 @@ class UserService:
             raise HTTPException(409, detail="unique field already exists")
 
     async def update_my_pfp_file(self, current_user: User, file: UploadFile) -> None:
-        content, _, ext, _ = await validate_and_read_file(
+        _, ext, _ = validate_upload_file(
             file, valid_mime_type="image/", valid_ext=frozenset({"png", "jpg", "jpeg"})
         )
 
-        filename = f"{current_user.id}.{ext}"
-        file_path = f"static/image/pfps/{filename}"
-
-        async with aiofiles.open(file_path, "wb") as fp:
-            await fp.write(content)
+        staged = await stage_upload(file, PFP_DIR)
+        # versioned by content, so that a new picture never shares its variants'
+        # names (or an old generation job) with the previous one
+        filename = f"{current_user.id}_{staged.sha256[:16]}.{ext}"
+        file_path = f"{PFP_DIR}/{filename}"
+        old_path = (
+            None
+            if current_user.profile_picture_is_url
+            else current_user.profile_picture
+        )
 
         current_user.profile_picture = file_path
         current_user.profile_picture_is_url = False
 
         try:
             self.user_repository.update(current_user)
+            await staged.commit(file_path)
         except IntegrityError as err:
-            try:
-                await aiofiles_os.remove(file_path)
-            except OSError:
-                logger.warning(
-                    "warn_type=pfp_upload_cleanup_failed ; %s", file_path, exc_info=True
-                )
+            await staged.discard()
             raise HTTPException(409, detail="unique field already exists") from err
+        except BaseException:
+            await staged.discard()
+            raise
+        if old_path and old_path != file_path and old_path.startswith(f"{PFP_DIR}/"):
+            # the row may still fail to commit and keep pointing at the old picture
+            call_after_commit(
+                self.user_repository.session, partial(_remove_pfp, old_path)
+            )
+        image_variant_worker.schedule(file_path)
 
     async def delete_my_profile(self, current_user: User) -> None:
         if current_user.role >= get_user_role_level("executive"):
@@ -387,6 +416,9 @@ class UserService:
     async def change_discord_role(self, discord_id: int, to_role_name: str) -> None:
         """
         Change role of user by removing all possible roles and adding new one.
+
+        Each call only enqueues the message on the background publisher, which
+        publishes in order, so the bot receives every removal before the addition.
         """
         for role in self.user_role_repository.list_all():
             await mq_client.send_discord_bot_request_no_reply(
@@ -504,119 +536,105 @@ class OldboyService:
 OldboyServiceDep = Annotated[OldboyService, Depends()]
 
 
-class StandbyService:
+DEPOSIT_BATCH_SIZE = 500
+
+
+class DepositReconciler:
+    """
+    입금 기록 묶음을 입금 대기자 명단과 대조합니다. 미확인 입금 대기 요청, 후보
+    사용자, 사용자별 마지막 등록 기록을 몇 번의 집합 쿼리로 미리 읽어 두고 각 입금
+    기록은 메모리에서 대조하므로, 기록 수에 비례해 쿼리가 늘어나지 않습니다.
+    """
+
     def __init__(
         self,
         standby_repository: StandbyReqTblRepositoryDep,
         user_repository: UserRepositoryDep,
         enrollment_repository: EnrollmentRepositoryDep,
-        scsc_global_status: SCSCGlobalStatusDep,
-        kv_service: KvServiceDep,
+        scsc_global_status: SCSCGlobalStatus,
+        get_grant_until: Callable[[], tuple[int, int]],
     ):
         self.standby_repository = standby_repository
         self.user_repository = user_repository
         self.enrollment_repository = enrollment_repository
         self.scsc_global_status = scsc_global_status
-        self.kv_service = kv_service
-
-    def get_standby_list(self) -> Sequence[StandbyReqTbl]:
-        return self.standby_repository.list_all()
-
-    async def process_standby_list_manually(
-        self, current_user: User, body: ProcessStandbyListManuallyBody
+        self._get_grant_until = get_grant_until
+        self._grant_until: Optional[tuple[int, int]] = None
+        self._role_levels: dict[str, int] = {}
+        self._users: dict[str, User] = {}
+        self._users_by_name: dict[str, list[User]] = defaultdict(list)
+        self._reqs_by_deposit_name: dict[str, list[StandbyReqTbl]] = defaultdict(list)
+        self._reqs_by_user_name: dict[str, list[StandbyReqTbl]] = defaultdict(list)
+        self._indexed_standby_user_ids: set[str] = set()
+        # 사용자별 마지막 등록 학기 (year, semester)
+        self._last_enrollments: dict[str, tuple[int, int]] = {}
+        self._pending_enrollments: list[tuple[int, int, str]] = []
+
+    def preload(
+        self, deposits: Sequence[DepositDTO], users: Sequence[User] = ()
     ) -> None:
-        user = self.user_repository.get_by_id(body.id)
-        if not user:
-            raise HTTPException(404, detail="user not found")
-        if not self._is_enrollable(user):
-            raise HTTPException(
-                409, detail="the user is already enrolled until the target semester"
-            )
-
-        self._activate_and_enroll_user(user)
-
-        standbyreq = self.standby_repository.get_by_user_id(body.id)
-        if standbyreq:
-            standbyreq.is_checked = True
-            standbyreq.deposit_name = f"Manually by {current_user.name}"
-            standbyreq.deposit_time = utcnow()
-            self.standby_repository.update(standbyreq)
-        else:
-            standbyreq = StandbyReqTbl(
-                standby_user_id=user.id,
-                user_name=user.name,
-                deposit_name=f"Manually by {current_user.name}",
-                deposit_time=utcnow(),
-                is_checked=True,
-            )
-            self.standby_repository.create(standbyreq)
-
-    async def process_standby_list(
-        self, file: UploadFile
-    ) -> ProcessStandbyListResponse:
-        content, _, _, _ = await validate_and_read_file(
-            file, valid_ext=frozenset({"csv"})
-        )
-
-        try:
-            deposit_array = await process_standby_user("utf-8", content)
-        except UnicodeDecodeError:
-            try:
-                deposit_array = await process_standby_user("euc-kr", content)
-            except UnicodeDecodeError:
-                raise HTTPException(
-                    400,
-                    detail="파일 읽기 실패: utf-8, euc-kr 인코딩만 읽을 수 있습니다",
-                )
-            except Exception as e:
-                raise HTTPException(400, detail=f"파일 읽기 실패: {e}")
-        except Exception as e:
-            raise HTTPException(400, detail=f"파일 읽기 실패: {e}")
-
-        cnt_succeeded_records = 0
-        cnt_failed_records = 0
-        results: list[ProcessDepositResult] = []
-
-        for deposit in deposit_array:
-            result = await self._process_single_deposit(deposit)
-            if result.result_code == 200:
-                cnt_succeeded_records += 1
+        """
+        대조할 입금 기록에 필요한 데이터를 읽어 둡니다. 큰 입금 내역은 나누어
+        여러 번 호출할 수 있으며, 이미 읽어 둔 데이터는 다시 색인하지 않습니다.
+        """
+        known_user_ids = set(self._users)
+        deposit_names: set[str] = set()
+        user_names: set[str] = set()
+        candidate_names: set[str] = set()
+        for deposit in deposits:
+            if deposit.deposit_name[-2:].isdigit():
+                deposit_names.add(deposit.deposit_name)
+                candidate_names.add(deposit.deposit_name[:-2])
             else:
-                cnt_failed_records += 1
-            results.append(result)
+                user_names.add(deposit.deposit_name)
+                candidate_names.add(deposit.deposit_name)
 
-        return ProcessStandbyListResponse(
-            cnt_succeeded_records=cnt_succeeded_records,
-            cnt_failed_records=cnt_failed_records,
-            results=results,
+        standbyreqs = self.standby_repository.get_unchecked_by_names(
+            deposit_names, user_names
         )
-
-    async def process_deposit(self, body: DepositDTO) -> ProcessDepositResponse:
-        result = await self._process_single_deposit(body)
-        return ProcessDepositResponse(result=result)
-
-    async def _process_single_deposit(
-        self, deposit: DepositDTO
-    ) -> ProcessDepositResult:
+        for req in standbyreqs:
+            self._index_standbyreq(req)
+        for user in self.user_repository.get_by_names(candidate_names):
+            self._add_user(user)
+        for user in users:
+            self._add_user(user)
+        missing_user_ids = {req.standby_user_id for req in standbyreqs} - set(
+            self._users
+        )
+        for user in self.user_repository.get_by_ids(missing_user_ids):
+            self._add_user(user)
+        last_enrollments = self.enrollment_repository.get_last_by_user_ids(
+            set(self._users) - known_user_ids
+        )
+        for user_id, enrollment in last_enrollments.items():
+            self._last_enrollments[user_id] = (enrollment.year, enrollment.semester)
+
+    def reconcile_many(
+        self, deposits: Sequence[DepositDTO]
+    ) -> list[ProcessDepositResult]:
+        self.preload(deposits)
+        results = [self.reconcile(deposit) for deposit in deposits]
+        self.flush_enrollments()
+        return results
+
+    def reconcile(self, deposit: DepositDTO) -> ProcessDepositResult:
         try:
             if deposit.deposit_name[-2:].isdigit():
-                matching_standbyreqs = (
-                    self.standby_repository.get_unchecked_by_deposit_name(
-                        deposit.deposit_name
-                    )
-                )  # search on deposit_name, which is "name+last 2 phone number" form
+                # search on deposit_name, which is "name+last 2 phone number" form
+                matching_standbyreqs = list(
+                    self._reqs_by_deposit_name.get(deposit.deposit_name, ())
+                )
             else:
-                matching_standbyreqs = (
-                    self.standby_repository.get_unchecked_by_user_name(
-                        deposit.deposit_name
-                    )
-                )  # search on user_name, which is "name" form
+                # search on user_name, which is "name" form
+                matching_standbyreqs = list(
+                    self._reqs_by_user_name.get(deposit.deposit_name, ())
+                )
 
-            matching_users = []
-            for req in matching_standbyreqs:
-                u = self.user_repository.get_by_id(req.standby_user_id)
-                if u:
-                    matching_users.append(UserResponse.model_validate(u))
+            matching_users = [
+                UserResponse.model_validate(self._users[req.standby_user_id])
+                for req in matching_standbyreqs
+                if req.standby_user_id in self._users
+            ]
 
             if len(matching_standbyreqs) > 1:  # multiple standby request found
                 logger.error(
@@ -633,14 +651,14 @@ class StandbyService:
                 if deposit.deposit_name[-2:].isdigit():
                     name = deposit.deposit_name[:-2]
                     phone_tail = deposit.deposit_name[-2:]
-                    matching_users_error = (
-                        self.user_repository.get_by_name_and_phone_tail(
-                            name, phone_tail
-                        )
-                    )
+                    matching_users_error = [
+                        u
+                        for u in self._users_by_name.get(name, ())
+                        if u.phone[-2:] == phone_tail
+                    ]
                 else:
-                    matching_users_error = self.user_repository.get_by_name(
-                        deposit.deposit_name
+                    matching_users_error = list(
+                        self._users_by_name.get(deposit.deposit_name, ())
                     )
 
                 matching_users = [
@@ -670,7 +688,7 @@ class StandbyService:
                     )
 
                 user = matching_users_error[0]
-                if not self._is_enrollable(user):
+                if not self.is_enrollable(user):
                     logger.error(
                         f"err_type=deposit ; err_code=412 ; msg=user is not enrollable ; deposit={deposit} ; users={matching_users}"
                     )
@@ -688,6 +706,7 @@ class StandbyService:
                     is_checked=False,
                 )
                 self.standby_repository.create(new_req)
+                self._index_standbyreq(new_req)
                 matching_standbyreqs = [new_req]
 
             # len(matching_standbyreqs) == 1:
@@ -713,7 +732,7 @@ class StandbyService:
                 )
 
             stby_user = matching_standbyreqs[0]
-            user = self.user_repository.get_by_id(stby_user.standby_user_id)
+            user = self._users.get(stby_user.standby_user_id)
             if not user:
                 logger.error(
                     f"err_type=deposit ; err_code=500 ; msg=unexpected error: user not found in user table ; deposit={deposit} ; users={matching_users}"
@@ -724,7 +743,7 @@ class StandbyService:
                     record=deposit,
                     users=matching_users,
                 )
-            if not self._is_enrollable(user):
+            if not self.is_enrollable(user):
                 logger.error(
                     f"err_type=deposit ; err_code=412 ; msg=user is not enrollable ; deposit={deposit} ; users={matching_users}"
                 )
@@ -734,7 +753,8 @@ class StandbyService:
                     record=deposit,
                     users=matching_users,
                 )
-            self._activate_and_enroll_user(user)
+            self.activate_and_enroll(user)
+            self._unindex_standbyreq(stby_user)
             stby_user.deposit_time = deposit.deposit_time
             stby_user.deposit_name = deposit.deposit_name
             stby_user.is_checked = True
@@ -756,31 +776,183 @@ class StandbyService:
                 users=[],
             )
 
-    def _activate_and_enroll_user(self, user: User):
+    def is_enrollable(self, user: User) -> bool:
+        if user.is_banned:
+            return False
+        last_enrollment = self._last_enrollments.get(user.id)
+        if last_enrollment is None:
+            return True
+        return last_enrollment < self.grant_until()
+
+    def activate_and_enroll(self, user: User) -> None:
+        last_enrollment = self._last_enrollments.get(user.id)
         user.is_active = True
         user.is_banned = False
-        if user.role < get_user_role_level("member"):
-            if user.role == get_user_role_level(
-                "dormant"
-            ) or self.enrollment_repository.exists_by_user_id(user.id):
-                user.role = get_user_role_level("member")
+        if user.role < self._role_level("member"):
+            if user.role == self._role_level("dormant") or last_enrollment is not None:
+                user.role = self._role_level("member")
             else:
-                user.role = get_user_role_level("newcomer")
-        last_enrollment = self.enrollment_repository.get_last_by_user_id(user.id)
+                user.role = self._role_level("newcomer")
+        semesters = self._semesters_to_enroll(last_enrollment)
+        # 등록 기록은 모아 두었다가 flush_enrollments()에서 한 번에 추가합니다
+        self._pending_enrollments.extend(
+            (year, semester, user.id) for year, semester in semesters
+        )
+        if semesters:
+            self._last_enrollments[user.id] = semesters[-1]
+        self.user_repository.update(user)
+
+    def flush_enrollments(self) -> None:
+        self.enrollment_repository.create_many(self._pending_enrollments)
+        self._pending_enrollments.clear()
+
+    def _semesters_to_enroll(
+        self, last_enrollment: Optional[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
         if last_enrollment is not None:
-            year, semester = get_next_year_semester(
-                last_enrollment.year, last_enrollment.semester
-            )
+            year, semester = get_next_year_semester(*last_enrollment)
         else:
             year = self.scsc_global_status.year
             semester = self.scsc_global_status.semester
-        until_year, until_semester = self._get_enrollment_grant_until()
-        while (year, semester) <= (until_year, until_semester):
-            self.enrollment_repository.create(
-                Enrollment(year=year, semester=semester, user_id=user.id)
-            )
+        until = self.grant_until()
+        semesters = []
+        while (year, semester) <= until:
+            semesters.append((year, semester))
             year, semester = get_next_year_semester(year, semester)
-        self.user_repository.update(user)
+        return semesters
+
+    def grant_until(self) -> tuple[int, int]:
+        # enrollment_grant_until 값은 묶음 처리 동안 한 번만 읽습니다
+        if self._grant_until is None:
+            self._grant_until = self._get_grant_until()
+        return self._grant_until
+
+    def _role_level(self, role_name: str) -> int:
+        if role_name not in self._role_levels:
+            self._role_levels[role_name] = get_user_role_level(role_name)
+        return self._role_levels[role_name]
+
+    def _add_user(self, user: User) -> None:
+        if user.id in self._users:
+            return
+        self._users[user.id] = user
+        self._users_by_name[user.name].append(user)
+
+    def _index_standbyreq(self, req: StandbyReqTbl) -> None:
+        if req.standby_user_id in self._indexed_standby_user_ids:
+            return
+        self._indexed_standby_user_ids.add(req.standby_user_id)
+        self._reqs_by_deposit_name[req.deposit_name].append(req)
+        self._reqs_by_user_name[req.user_name].append(req)
+
+    def _unindex_standbyreq(self, req: StandbyReqTbl) -> None:
+        self._indexed_standby_user_ids.discard(req.standby_user_id)
+        self._reqs_by_deposit_name[req.deposit_name].remove(req)
+        self._reqs_by_user_name[req.user_name].remove(req)
+
+
+class StandbyService:
+    def __init__(
+        self,
+        standby_repository: StandbyReqTblRepositoryDep,
+        user_repository: UserRepositoryDep,
+        enrollment_repository: EnrollmentRepositoryDep,
+        scsc_global_status: SCSCGlobalStatusDep,
+        kv_service: KvServiceDep,
+    ):
+        self.standby_repository = standby_repository
+        self.user_repository = user_repository
+        self.enrollment_repository = enrollment_repository
+        self.scsc_global_status = scsc_global_status
+        self.kv_service = kv_service
+
+    def get_standby_list(self) -> Sequence[StandbyReqTbl]:
+        return self.standby_repository.list_all()
+
+    async def process_standby_list_manually(
+        self, current_user: User, body: ProcessStandbyListManuallyBody
+    ) -> None:
+        user = self.user_repository.get_by_id(body.id)
+        if not user:
+            raise HTTPException(404, detail="user not found")
+        reconciler = self._make_reconciler()
+        reconciler.preload([], [user])
+        if not reconciler.is_enrollable(user):
+            raise HTTPException(
+                409, detail="the user is already enrolled until the target semester"
+            )
+
+        reconciler.activate_and_enroll(user)
+        reconciler.flush_enrollments()
+
+        standbyreq = self.standby_repository.get_by_user_id(body.id)
+        if standbyreq:
+            standbyreq.is_checked = True
+            standbyreq.deposit_name = f"Manually by {current_user.name}"
+            standbyreq.deposit_time = utcnow()
+            self.standby_repository.update(standbyreq)
+        else:
+            standbyreq = StandbyReqTbl(
+                standby_user_id=user.id,
+                user_name=user.name,
+                deposit_name=f"Manually by {current_user.name}",
+                deposit_time=utcnow(),
+                is_checked=True,
+            )
+            self.standby_repository.create(standbyreq)
+
+    async def process_standby_list(
+        self, file: UploadFile
+    ) -> ProcessStandbyListResponse:
+        validate_upload_file(file, valid_ext=frozenset({"csv"}))
+        encoding = detect_encoding(file.file, STANDBY_CSV_ENCODINGS)
+        if encoding is None:
+            raise HTTPException(
+                400,
+                detail="파일 읽기 실패: utf-8, euc-kr 인코딩만 읽을 수 있습니다",
+            )
+
+        cnt_succeeded_records = 0
+        cnt_failed_records = 0
+        results: list[ProcessDepositResult] = []
+
+        # 입금 내역 전체를 메모리에 올리지 않도록 DEPOSIT_BATCH_SIZE건씩 읽어 대조합니다
+        deposits = iter_standby_deposits(file.file, encoding)
+        reconciler = self._make_reconciler()
+        while batch := self._read_deposit_batch(deposits):
+            for result in reconciler.reconcile_many(batch):
+                if result.result_code == 200:
+                    cnt_succeeded_records += 1
+                else:
+                    cnt_failed_records += 1
+                results.append(result)
+
+        return ProcessStandbyListResponse(
+            cnt_succeeded_records=cnt_succeeded_records,
+            cnt_failed_records=cnt_failed_records,
+            results=results,
+        )
+
+    async def process_deposit(self, body: DepositDTO) -> ProcessDepositResponse:
+        reconciler = self._make_reconciler()
+        (result,) = reconciler.reconcile_many([body])
+        return ProcessDepositResponse(result=result)
+
+    @staticmethod
+    def _read_deposit_batch(deposits: Iterator[DepositDTO]) -> list[DepositDTO]:
+        try:
+            return list(islice(deposits, DEPOSIT_BATCH_SIZE))
+        except Exception as e:
+            raise HTTPException(400, detail=f"파일 읽기 실패: {e}")
+
+    def _make_reconciler(self) -> DepositReconciler:
+        return DepositReconciler(
+            self.standby_repository,
+            self.user_repository,
+            self.enrollment_repository,
+            self.scsc_global_status,
+            self._get_enrollment_grant_until,
+        )
 
     def _get_enrollment_grant_until(self):
         year = self.scsc_global_status.year
@@ -802,16 +974,5 @@ class StandbyService:
             )
         return until_year, until_semester
 
-    def _is_enrollable(self, user: User) -> bool:
-        if user.is_banned:
-            return False
-        last_enrollment = self.enrollment_repository.get_last_by_user_id(user.id)
-        if last_enrollment is None:
-            return True
-        return (
-            last_enrollment.year,
-            last_enrollment.semester,
-        ) < self._get_enrollment_grant_until()
-
 
 StandbyServiceDep = Annotated[StandbyService, Depends()]
@@ -1,18 +1,31 @@
+import asyncio
 import re
 from os import path
 from typing import Annotated, Sequence
 
-import aiofiles
 from aiofiles import os as aiofiles_os
-from fastapi import Depends, HTTPException, UploadFile
+from fastapi import Depends, HTTPException, Response, UploadFile
 from fastapi.responses import FileResponse
 from sqlalchemy.exc import IntegrityError
+from starlette.datastructures import Headers
 
 from src.core import get_settings, logger
 from src.model import User, WHTMLMetadata
 from src.repositories import WRepositoryDep
 from src.schemas import WHTMLMetadataWithCreatorResponse
-from src.util import validate_and_read_file
+from src.storage import (
+    find_precompressed,
+    remove_precompressed,
+    stage_upload,
+    write_precompressed,
+)
+from src.util import (
+    REVALIDATE,
+    is_not_modified,
+    make_etag,
+    validate_upload_file,
+    validator_headers,
+)
 
 
 class WService:
@@ -20,7 +33,7 @@ class WService:
         self.w_repository = w_repository
 
     async def upload_file(self, current_user: User, file: UploadFile) -> WHTMLMetadata:
-        content, basename, _, _ = await validate_and_read_file(
+        basename, _, _ = validate_upload_file(
             file, valid_mime_type="text/html", valid_ext=frozenset({"html"})
         )
         if not re.fullmatch(r"^[a-zA-Z0-9_-]+$", basename):
@@ -29,43 +42,49 @@ class WService:
                 detail="filename should consist of alphabets, numbers, underscores, and hyphens",
             )
 
-        async with aiofiles.open(
-            path.join(get_settings().w_html_dir, f"{basename}.html"), "wb"
-        ) as fp:
-            await fp.write(content)
-
-        w_meta = WHTMLMetadata(
-            name=basename, size=len(content), creator=current_user.id
-        )
+        staged = await stage_upload(file, get_settings().w_html_dir)
+        w_meta = WHTMLMetadata(name=basename, size=staged.size, creator=current_user.id)
 
+        # the page is only moved into place once its row exists, so a duplicate
+        # name never overwrites the existing page
         try:
             w_meta = self.w_repository.create(w_meta)
+            await staged.commit(
+                path.join(get_settings().w_html_dir, f"{basename}.html")
+            )
         except IntegrityError as err:
-            try:
-                await aiofiles_os.remove(
-                    path.join(get_settings().w_html_dir, f"{basename}.html")
-                )
-            except OSError:
-                logger.warning(
-                    "warn_type=w_html_create_cleanup_failed ; %s",
-                    f"{basename}.html",
-                    exc_info=True,
-                )
+            await staged.discard()
             raise HTTPException(409, detail="unique field exists") from err
+        except BaseException:
+            await staged.discard()
+            raise
+        await self._precompress(basename)
 
         logger.info(
-            f"info_type=w_html_created ; {basename=} ; file_size={len(content)} ; executer_id={current_user.id}"
+            f"info_type=w_html_created ; {basename=} ; file_size={staged.size} ; executer_id={current_user.id}"
         )
         return w_meta
 
-    def get_w_by_name(self, name: str) -> FileResponse:
+    def get_w_by_name(
+        self, name: str, request_headers: Headers
+    ) -> FileResponse | Response:
         w_meta = self.w_repository.get_by_id(name)
         if not w_meta:
             raise HTTPException(404, detail="file not found")
-        return FileResponse(
+        file_path, encoding = find_precompressed(
             path.join(get_settings().w_html_dir, f"{name}.html"),
-            media_type="text/html",
+            request_headers.get("accept-encoding"),
         )
+        etag = make_etag(w_meta.name, w_meta.updated_at, w_meta.size, encoding)
+        headers = {
+            **validator_headers(etag, w_meta.updated_at, REVALIDATE),
+            "Vary": "Accept-Encoding",
+        }
+        if is_not_modified(request_headers, etag, w_meta.updated_at):
+            return Response(status_code=304, headers=headers)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return FileResponse(file_path, media_type="text/html", headers=headers)
 
     def get_all_metadata(self) -> Sequence[tuple[WHTMLMetadata, str]]:
         results = self.w_repository.get_all_with_creator_name()
@@ -81,22 +100,30 @@ class WService:
         if not w_meta:
             raise HTTPException(404, detail="file not found")
 
-        content, _, _, _ = await validate_and_read_file(
+        validate_upload_file(
             file, valid_mime_type="text/html", valid_ext=frozenset({"html"})
         )
+        staged = await stage_upload(file, get_settings().w_html_dir)
 
-        w_meta.size = len(content)
+        w_meta.size = staged.size
         w_meta.creator = current_user.id
 
-        w_meta = self.w_repository.update(w_meta)
-
-        async with aiofiles.open(
-            path.join(get_settings().w_html_dir, f"{name}.html"), "wb"
-        ) as fp:
-            await fp.write(content)
+        try:
+            w_meta = self.w_repository.update(w_meta)
+            # drop the old compressed copies first so that they are never served
+            # for the new page
+            await asyncio.to_thread(
+                remove_precompressed,
+                path.join(get_settings().w_html_dir, f"{name}.html"),
+            )
+            await staged.commit(path.join(get_settings().w_html_dir, f"{name}.html"))
+        except BaseException:
+            await staged.discard()
+            raise
+        await self._precompress(name)
 
         logger.info(
-            f"info_type=w_html_updated ; {name=} ; file_size={len(content)} ; executer_id={current_user.id}"
+            f"info_type=w_html_updated ; {name=} ; file_size={staged.size} ; executer_id={current_user.id}"
         )
         return w_meta
 
@@ -117,6 +144,10 @@ class WService:
             await aiofiles_os.remove(
                 path.join(get_settings().w_html_dir, f"{name}.html")
             )
+            await asyncio.to_thread(
+                remove_precompressed,
+                path.join(get_settings().w_html_dir, f"{name}.html"),
+            )
         except OSError:
             logger.error(
                 f"err_type=delete_w_by_name ; {name=} ; executer_id={current_user.id} ; msg=failed to remove file from disk"
@@ -126,5 +157,16 @@ class WService:
             f"info_type=w_html_deleted ; {name=} ; executer_id={current_user.id}"
         )
 
+    @staticmethod
+    async def _precompress(name: str) -> None:
+        """Writes the .br/.gz copies served by `get_w_by_name`; the page works without them."""
+        html_path = path.join(get_settings().w_html_dir, f"{name}.html")
+        try:
+            await asyncio.to_thread(write_precompressed, html_path, html_path)
+        except OSError:
+            logger.warning(
+                f"warn_type=w_html_precompress_failed ; {name=}", exc_info=True
+            )
+
 
 WServiceDep = Annotated[WService, Depends()]
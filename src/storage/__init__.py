@@ -0,0 +1,27 @@
+from .article_content import (
+    CONTENT_READ_ERROR,
+    CONTENT_UNAVAILABLE,
+    ArticleContentStore,
+    article_content_store,
+)
+from .blob_store import BlobStore
+from .image_variants import (
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    ImageVariantWorker,
+    image_variant_worker,
+    remove_variants,
+)
+from .precompressed import (
+    find_precompressed,
+    remove_precompressed,
+    write_precompressed,
+)
+from .upload import (
+    UPLOAD_CHUNK_SIZE,
+    StagedUpload,
+    collect_unreferenced_uploads,
+    hash_file,
+    remove_stale_temp_files,
+    stage_upload,
+)
@@ -0,0 +1,124 @@
+import asyncio
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from os import path
+from typing import Iterable, Optional, cast
+
+from src.core import get_settings, logger
+from src.model import Article
+
+from .blob_store import BlobStore
+
+CONTENT_UNAVAILABLE = "Content currently unavailable."
+CONTENT_READ_ERROR = "Error reading content."
+
+CacheKey = str | tuple[int, datetime]
+
+
+class ArticleContentStore:
+    """
+    Reads and writes article bodies.
+
+    Bodies are stored in a content-addressed `BlobStore` and referenced by
+    `Article.content_hash`. Articles written before the blob store (no hash) are
+    read from the legacy `{article_dir}/{id}.md` file.
+
+    Contents are cached in an LRU bounded by the memory the cached strings take
+    (`sys.getsizeof`, two bytes per Korean character), keyed by the content hash
+    (or `(article id, updated_at)` for legacy files), so an edited article never
+    returns a stale body. Cache misses are read in worker
+    threads, never on the event loop. Missing or unreadable files are not cached.
+    """
+
+    def __init__(self, blob_store: BlobStore, article_dir: str, max_bytes: int) -> None:
+        self.blob_store = blob_store
+        self.article_dir = article_dir
+        self.max_bytes = max_bytes
+        self._cache: OrderedDict[CacheKey, str] = OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def _key(article: Article) -> CacheKey:
+        return article.content_hash or (article.id, article.updated_at)
+
+    def _get(self, key: CacheKey) -> Optional[str]:
+        content = self._cache.get(key)
+        if content is not None:
+            self._cache.move_to_end(key)
+        return content
+
+    def _put(self, key: CacheKey, content: str) -> None:
+        size = sys.getsizeof(content)
+        if size > self.max_bytes:
+            return
+        self._pop(key)
+        self._cache[key] = content
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._size -= sys.getsizeof(evicted)
+
+    def _pop(self, key: CacheKey) -> None:
+        content = self._cache.pop(key, None)
+        if content is not None:
+            self._size -= sys.getsizeof(content)
+
+    def _legacy_file_path(self, article_id: int) -> str:
+        return path.join(self.article_dir, f"{article_id}.md")
+
+    def _read(self, key: CacheKey) -> str:
+        if isinstance(key, str):
+            return self.blob_store.get(key).decode("utf-8")
+        with open(self._legacy_file_path(key[0]), "r", encoding="utf-8") as fp:
+            return fp.read()
+
+    async def read(self, article: Article) -> str:
+        return (await self.read_many([article]))[0]
+
+    async def read_many(self, articles: Iterable[Article]) -> list[str]:
+        """Returns the bodies in the order of `articles`, reading all misses concurrently."""
+        keys = [self._key(article) for article in articles]
+        results: list[Optional[str]] = [self._get(key) for key in keys]
+        misses = list(dict.fromkeys(key for key, r in zip(keys, results) if r is None))
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self._read, key) for key in misses),
+            return_exceptions=True,
+        )
+        loaded: dict[CacheKey, str] = {}
+        for key, content in zip(misses, contents):
+            if isinstance(content, FileNotFoundError):
+                logger.warning(f"Article content missing: {key=}")
+                loaded[key] = CONTENT_UNAVAILABLE
+            elif isinstance(content, BaseException):
+                logger.error(
+                    f"err_type=read_article_content ; error occurred during reading a file ; {key=}",
+                    exc_info=content,
+                )
+                loaded[key] = CONTENT_READ_ERROR
+            else:
+                self._put(key, content)
+                loaded[key] = content
+        for i, key in enumerate(keys):
+            if results[i] is None:
+                results[i] = loaded[key]
+        return cast(list[str], results)
+
+    async def write(self, content: str) -> str:
+        """Stores `content` and returns its hash, to be saved as `Article.content_hash`."""
+        content_hash = await asyncio.to_thread(
+            self.blob_store.put, content.encode("utf-8")
+        )
+        self._put(content_hash, content)
+        return content_hash
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._size = 0
+
+
+article_content_store = ArticleContentStore(
+    BlobStore(get_settings().article_blob_dir),
+    get_settings().article_dir,
+    get_settings().article_cache_max_bytes,
+)
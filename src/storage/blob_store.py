@@ -0,0 +1,82 @@
+import hashlib
+import os
+import tempfile
+import time
+from os import path
+from typing import Iterator
+
+
+class BlobStore:
+    """
+    Content-addressed storage on the local filesystem.
+
+    A blob is stored once under `{root}/{hash[:2]}/{hash[2:4]}/{hash}`, where `hash`
+    is the SHA-256 hex digest of its bytes. Writes go to a temporary file in the same
+    filesystem and are renamed into place, so readers never see a partial blob.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    @staticmethod
+    def hash_of(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def path_of(self, blob_hash: str) -> str:
+        return path.join(self.root, blob_hash[:2], blob_hash[2:4], blob_hash)
+
+    def put(self, data: bytes) -> str:
+        blob_hash = self.hash_of(data)
+        blob_path = self.path_of(blob_hash)
+        if path.exists(blob_path):
+            # refresh mtime so a concurrent garbage collection keeps the blob
+            os.utime(blob_path)
+            return blob_hash
+
+        os.makedirs(path.dirname(blob_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.dirname(blob_path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(tmp_path, blob_path)
+        except BaseException:
+            if path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return blob_hash
+
+    def get(self, blob_hash: str) -> bytes:
+        with open(self.path_of(blob_hash), "rb") as fp:
+            return fp.read()
+
+    def iter_blobs(self) -> Iterator[tuple[str, float]]:
+        """Yields `(hash, mtime)` of every stored blob."""
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.startswith(".tmp-"):
+                    continue
+                try:
+                    mtime = os.stat(path.join(dirpath, filename)).st_mtime
+                except FileNotFoundError:
+                    continue
+                yield filename, mtime
+
+    def collect_garbage(self, referenced: set[str], grace_seconds: float) -> int:
+        """
+        Removes blobs that are not in `referenced` and were last written more than
+        `grace_seconds` ago. The grace period protects blobs whose referencing row
+        has not been committed yet. Returns the number of removed blobs.
+        """
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for blob_hash, mtime in list(self.iter_blobs()):
+            if blob_hash in referenced or mtime > cutoff:
+                continue
+            try:
+                os.remove(self.path_of(blob_hash))
+            except FileNotFoundError:
+                continue
+            removed += 1
+        return removed
@@ -0,0 +1,173 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from os import path
+from typing import Optional
+
+from PIL import Image, ImageOps, features
+
+from src.core import get_settings, logger
+
+IMAGE_VARIANT_WIDTHS = (160, 320, 640, 1280)
+IMAGE_VARIANT_FORMATS = {"webp": "image/webp", "avif": "image/avif"}
+IMAGE_VARIANT_DEFAULT_FORMAT = "webp"
+_SAVE_OPTIONS = {"webp": {"quality": 80, "method": 4}, "avif": {"quality": 60}}
+# vector and animated images are always served as uploaded
+_SKIPPED_EXTS = frozenset({"svg", "gif"})
+
+
+def variant_path(original_path: str, width: int, fmt: str) -> str:
+    """`static/image/photo/{id}.png` -> `static/image/photo/{id}_w320.webp`"""
+    root, _ = path.splitext(original_path)
+    return f"{root}_w{width}.{fmt}"
+
+
+def remove_variants(original_path: str) -> None:
+    """Removes every generated variant of the image. Blocking."""
+    for width in IMAGE_VARIANT_WIDTHS:
+        for fmt in IMAGE_VARIANT_FORMATS:
+            with suppress(FileNotFoundError):
+                os.remove(variant_path(original_path, width, fmt))
+
+
+def generate_variants(original_path: str) -> list[str]:
+    """
+    Writes a resized copy of the image for every width bucket and format, and
+    returns their paths. Runs in a worker process.
+
+    The image is never upscaled: buckets are generated up to the first one that
+    is at least as wide as the original, which holds the image at full size.
+    Each file is written to a temporary file and renamed into place. If the
+    original is removed meanwhile, e.g. replaced by a new profile picture, the
+    variants written so far are removed again.
+    """
+    if not path.exists(original_path):
+        return []
+    formats = [fmt for fmt in IMAGE_VARIANT_FORMATS if features.check(fmt)]
+    written: list[str] = []
+    with Image.open(original_path) as source:
+        if getattr(source, "is_animated", False):
+            return written
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.mode or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+        for width in IMAGE_VARIANT_WIDTHS:
+            if width < image.width:
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            else:
+                resized = image
+            for fmt in formats:
+                dest = variant_path(original_path, width, fmt)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=path.dirname(dest) or ".", prefix=".tmp-variant-"
+                )
+                try:
+                    with os.fdopen(fd, "wb") as fp:
+                        resized.save(fp, format=fmt.upper(), **_SAVE_OPTIONS[fmt])
+                    os.replace(tmp_path, dest)
+                except BaseException:
+                    if path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+                written.append(dest)
+            if width >= image.width:
+                break
+    if not path.exists(original_path):
+        remove_variants(original_path)
+        return []
+    return written
+
+
+class ImageVariantWorker:
+    """
+    Generates image variants (see `generate_variants`) in a process pool, so that
+    neither the event loop nor the request that uploaded the image waits on the
+    CPU-heavy resizing and encoding. The pool is started on first use.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: set[Future] = set()
+
+    def schedule(self, original_path: str) -> None:
+        _, ext = path.splitext(original_path)
+        if ext.lstrip(".").lower() in _SKIPPED_EXTS:
+            return
+        if self._executor is None:
+            self._executor = self._create_executor()
+        try:
+            future = self._executor.submit(generate_variants, original_path)
+        except BrokenProcessPool:
+            # a worker died (e.g. killed for memory); start a fresh pool
+            self._executor = self._create_executor()
+            future = self._executor.submit(generate_variants, original_path)
+        self._pending.add(future)
+        future.add_done_callback(self._on_done(original_path))
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # forking a process that runs threads (the event loop's to_thread pool)
+        # is unsafe, so workers are started from a clean server process
+        return ProcessPoolExecutor(
+            self.max_workers, mp_context=multiprocessing.get_context("forkserver")
+        )
+
+    def _on_done(self, original_path: str):
+        def callback(future: Future) -> None:
+            self._pending.discard(future)
+            if future.cancelled():
+                return
+            if (error := future.exception()) is not None:
+                logger.error(
+                    f"err_type=image_variants ; {original_path=} ; msg={error!r}"
+                )
+
+        return callback
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def shutdown(self) -> None:
+        """Drops queued jobs and waits for the running ones."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+    @staticmethod
+    def find(
+        original_path: str, width: Optional[int], fmt: Optional[str]
+    ) -> tuple[Optional[str], bool]:
+        """
+        Returns the path of the variant closest to the requested width (the smallest
+        bucket that is at least `width` wide, or the largest one generated for small
+        images) in `fmt`, defaulting to WebP, or None if there is none.
+
+        The second value is true when the returned file is not the requested
+        bucket: either the original, because no variant exists yet, or a smaller
+        bucket. A better match may still be generated, so the response must not be
+        cached for long; for an image narrower than the bucket this also holds for
+        the final variant, which a revalidation then confirms cheaply.
+        """
+        fmt = fmt or IMAGE_VARIANT_DEFAULT_FORMAT
+        _, ext = path.splitext(original_path)
+        if ext.lstrip(".").lower() in _SKIPPED_EXTS:
+            return None, False
+        bucket = next(
+            (i for i, w in enumerate(IMAGE_VARIANT_WIDTHS) if width and w >= width),
+            len(IMAGE_VARIANT_WIDTHS) - 1,
+        )
+        for i in reversed(range(bucket + 1)):
+            candidate = variant_path(original_path, IMAGE_VARIANT_WIDTHS[i], fmt)
+            if path.exists(candidate):
+                return candidate, i != bucket
+        return None, True
+
+
+image_variant_worker = ImageVariantWorker(get_settings().image_variant_workers)
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from contextlib import suppress
+from os import path
+from typing import Optional
+
+from src.util import (
+    CONTENT_ENCODINGS,
+    ENCODING_SUFFIXES,
+    choose_encoding,
+    compress,
+)
+
+
+def write_precompressed(source_path: str, dest_path: str) -> None:
+    """
+    Writes `{dest_path}.br` and `{dest_path}.gz` from the contents of `source_path`,
+    each through a temporary file renamed into place. Blocking.
+    """
+    with open(source_path, "rb") as fp:
+        data = fp.read()
+    for encoding in CONTENT_ENCODINGS:
+        target = dest_path + ENCODING_SUFFIXES[encoding]
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.dirname(target) or ".", prefix=".tmp-precompressed-"
+        )
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(compress(data, encoding, precompress=True))
+            os.replace(tmp_path, target)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+
+def remove_precompressed(dest_path: str) -> None:
+    for suffix in ENCODING_SUFFIXES.values():
+        with suppress(FileNotFoundError):
+            os.remove(dest_path + suffix)
+
+
+def find_precompressed(
+    file_path: str, accept_encoding: Optional[str]
+) -> tuple[str, Optional[str]]:
+    """
+    Returns the path of the best precompressed copy of `file_path` that the client
+    accepts and its Content-Encoding, or `(file_path, None)` if there is none.
+    """
+    available = [
+        encoding
+        for encoding in CONTENT_ENCODINGS
+        if path.exists(file_path + ENCODING_SUFFIXES[encoding])
+    ]
+    encoding = choose_encoding(accept_encoding, available)
+    if encoding is None:
+        return file_path, None
+    return file_path + ENCODING_SUFFIXES[encoding], encoding
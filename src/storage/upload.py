@@ -0,0 +1,156 @@
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+import time
+from contextlib import suppress
+from typing import BinaryIO, Optional
+
+from aiofiles import os as aiofiles_os
+from fastapi import HTTPException, UploadFile
+
+from src.core import get_settings
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# every temporary file written next to its destination (uploads, image variants,
+# precompressed copies) starts with this prefix
+TEMP_FILE_PREFIX = ".tmp-"
+
+
+class StagedUpload:
+    """
+    An upload written to a temporary file in its destination directory.
+
+    `commit` renames it into place, which is atomic on one filesystem, so readers
+    never see a partially written file; `discard` removes it.
+    """
+
+    def __init__(self, tmp_path: str, size: int, sha256: str) -> None:
+        self.tmp_path = tmp_path
+        self.size = size
+        self.sha256 = sha256
+
+    async def commit(self, dest_path: str) -> None:
+        await aiofiles_os.replace(self.tmp_path, dest_path)
+
+    async def discard(self) -> None:
+        with suppress(FileNotFoundError):
+            await aiofiles_os.remove(self.tmp_path)
+
+
+def _write_chunk(fp: BinaryIO, hasher: "hashlib._Hash", chunk: bytes) -> None:
+    hasher.update(chunk)
+    fp.write(chunk)
+
+
+def _sync(fp: BinaryIO) -> None:
+    fp.flush()
+    os.fsync(fp.fileno())
+
+
+async def stage_upload(
+    file: UploadFile, directory: str, max_size: Optional[int] = None
+) -> StagedUpload:
+    """
+    Copies `file` to a temporary file in `directory` in chunks of
+    `UPLOAD_CHUNK_SIZE`, computing its SHA-256 on the way. Writing and hashing run
+    in worker threads, and at most one chunk is held in memory.
+
+    Raises:
+        HTTPException: 413 (Payload Too Large) as soon as more than `max_size`
+            (default: `file_max_size`) bytes have been read. Nothing is left on disk.
+    """
+    if max_size is None:
+        max_size = get_settings().file_max_size
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(
+            413, detail=f"cannot upload file larger than {max_size} bytes"
+        )
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{TEMP_FILE_PREFIX}upload-")
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise HTTPException(
+                        413, detail=f"cannot upload file larger than {max_size} bytes"
+                    )
+                await asyncio.to_thread(_write_chunk, fp, hasher, chunk)
+            await asyncio.to_thread(_sync, fp)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    return StagedUpload(tmp_path, size, hasher.hexdigest())
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 hex digest of a file, read in chunks. Blocking."""
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as fp:
+        while chunk := fp.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+# `{uuid}.{ext}` as written by the upload services, and its `_w{width}` image variants
+_UPLOAD_NAME = re.compile(
+    r"^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})(?:_w\d+)?\.\w+$"
+)
+
+
+def collect_unreferenced_uploads(
+    directory: str, referenced: set[str], grace_seconds: float
+) -> int:
+    """
+    Removes uploads in `directory` whose `{uuid}` stem is not in `referenced`,
+    together with their image variants, once they were last modified more than
+    `grace_seconds` ago. The grace period protects files whose row has not been
+    committed yet. Files not named like an upload are never touched. Blocking;
+    returns the number of removed files.
+    """
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for entry in os.scandir(directory):
+        match = _UPLOAD_NAME.match(entry.name)
+        if not match or match.group(1) in referenced or not entry.is_file():
+            continue
+        try:
+            if entry.stat().st_mtime > cutoff:
+                continue
+            os.remove(entry.path)
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
+
+
+def remove_stale_temp_files(directory: str, max_age_seconds: float) -> int:
+    """
+    Removes temporary files in `directory` last modified more than
+    `max_age_seconds` ago. They are left behind when the process dies while an
+    upload is being staged, since the cleanup in `stage_upload` never runs.
+    Younger files may belong to an upload in progress and are kept. Blocking;
+    returns the number of removed files.
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        if not entry.name.startswith(TEMP_FILE_PREFIX) or not entry.is_file():
+            continue
+        try:
+            if entry.stat().st_mtime > cutoff:
+                continue
+            os.remove(entry.path)
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
@@ -1,23 +1,43 @@
 from typing import Final
 
+from .cache import TTLCache
+from .compression import (
+    CONTENT_ENCODINGS,
+    ENCODING_SUFFIXES,
+    choose_encoding,
+    compress,
+)
+from .conditional import (
+    REVALIDATE,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    validator_headers,
+)
 from .helper import (
+    STANDBY_CSV_ENCODINGS,
     DepositDTO,
+    detect_encoding,
     generate_user_hash,
     get_next_year_semester,
+    iter_standby_deposits,
     map_semester_name,
-    process_standby_user,
     split_filename,
     utcnow,
 )
 from .logger_config import LOGGING_CONFIG, request_id_var
+from .markdown import make_excerpt, strip_markdown, summarize_markdown
+from .pagination import decode_cursor, encode_cursor
+from .path_matcher import LikePatternMatcher
 from .singleton import SingletonMeta
 from .validator import (
+    close_img_url_client,
     create_uuid,
     is_valid_img_url,
     is_valid_phone,
     is_valid_student_id,
     sha256_hash,
-    validate_and_read_file,
+    validate_upload_file,
 )
 
 DELETED: Final[str] = (
@@ -0,0 +1,54 @@
+import gzip
+from typing import Optional, Sequence
+
+import brotli
+
+# preferred first: brotli is ~15-25% smaller than gzip for HTML and JSON
+CONTENT_ENCODINGS = ("br", "gzip")
+# file suffix of a precompressed copy per Content-Encoding
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def choose_encoding(
+    accept_encoding: Optional[str], available: Sequence[str] = CONTENT_ENCODINGS
+) -> Optional[str]:
+    """
+    Picks the Content-Encoding to use from an Accept-Encoding header: the acceptable
+    coding with the highest q-value, ties broken by the order of `available`. None
+    means the response should be sent as is.
+    """
+    if not accept_encoding:
+        return None
+    qvalues: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.lower()] = q
+    wildcard = qvalues.get("*", 0.0)
+    best: Optional[str] = None
+    best_q = 0.0
+    for coding in available:
+        q = qvalues.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, *, precompress: bool = False) -> bytes:
+    """
+    Compresses `data` for a Content-Encoding. `precompress` selects the highest
+    ratio, for copies written once and served many times; otherwise a level that
+    is cheap enough to run per response is used.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if precompress else 4)
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9 if precompress else 6, mtime=0)
+    raise ValueError(f"unsupported content encoding: {encoding}")
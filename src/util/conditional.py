@@ -0,0 +1,74 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Response
+from starlette.datastructures import Headers
+
+# clients may keep a copy but must revalidate it (cheap with a 304) before reuse
+REVALIDATE = "no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Builds a strong ETag from values that change whenever the representation does."""
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def http_date(dt: datetime) -> str:
+    """Formats a naive UTC (or aware) datetime as an HTTP-date."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function (RFC 9110 13.1.2)
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(
+    request_headers: Headers, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluates If-None-Match, or If-Modified-Since when no If-None-Match is sent,
+    against the current validators of a GET/HEAD response.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP-dates have second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[datetime], cache_control: str
+) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified_response(
+    etag: str, last_modified: Optional[datetime], cache_control: str
+) -> Response:
+    return Response(
+        status_code=304, headers=validator_headers(etag, last_modified, cache_control)
+    )
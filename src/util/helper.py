@@ -1,8 +1,12 @@
+import codecs
 import csv
 import hashlib
 import hmac
 import io
+from collections import deque
 from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, Optional, Sequence
 
 from pydantic import BaseModel, field_validator
 
@@ -89,21 +93,81 @@ class DepositDTO(BaseModel):
         return v
 
 
-async def process_standby_user(encoding: str, content: bytes) -> list[DepositDTO]:
-    decoded = content.decode(encoding)
-    f = io.StringIO(decoded)
-    lines = f.readlines()
-    trimmed_lines = lines[4:-1]
-    trimmed_csv = io.StringIO("".join(trimmed_lines))
-    reader = csv.DictReader(trimmed_csv)
-    result = [
-        DepositDTO(
-            amount=int(str(line["입금액"]).replace(",", "")),
-            deposit_time=kst2utc(
-                datetime.strptime(line["거래일시"], "%Y.%m.%d %H:%M:%S")
-            ),
-            deposit_name=line["보낸분/받는분"],
-        )
-        for line in reader
-    ]
-    return result
+STANDBY_CSV_ENCODINGS = ("utf-8", "euc-kr")
+STANDBY_CSV_HEADER_LINES = 4  # bank export title rows above the column names
+STANDBY_CSV_FOOTER_LINES = 1  # bank export summary row
+
+
+def detect_encoding(
+    stream: BinaryIO, encodings: Sequence[str], chunk_size: int = 64 * 1024
+) -> Optional[str]:
+    """
+    Detects the encoding of a binary stream by decoding all of it.
+
+    A sample is not enough: a euc-kr statement may start with pages of ASCII rows
+    that also decode as utf-8. The stream is read in chunks of `chunk_size` bytes,
+    so only one chunk is held in memory, and its position is restored afterwards,
+    so the caller can read the stream from the start with the returned encoding.
+
+    Args:
+        stream: A seekable binary stream.
+        encodings: Candidate encodings, tried in order.
+        chunk_size: Number of bytes to read at a time.
+
+    Returns:
+        The first encoding that decodes the whole stream, or None if none does.
+    """
+    start = stream.tell()
+    try:
+        for encoding in encodings:
+            stream.seek(start)
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                # a multibyte character may be cut at the end of a chunk
+                while chunk := stream.read(chunk_size):
+                    decoder.decode(chunk)
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                continue
+            return encoding
+        return None
+    finally:
+        stream.seek(start)
+
+
+def _trim_lines(lines: Iterable[str], head: int, tail: int) -> Iterator[str]:
+    """Yields `lines` without the first `head` and the last `tail` lines."""
+    buffer: deque[str] = deque()
+    for line in islice(lines, head, None):
+        buffer.append(line)
+        if len(buffer) > tail:
+            yield buffer.popleft()
+
+
+def iter_standby_deposits(stream: BinaryIO, encoding: str) -> Iterator[DepositDTO]:
+    """
+    Parses a bank statement CSV into deposits, one row at a time.
+
+    The header and footer rows of the export are skipped while reading, so only
+    one line (plus the footer look-ahead) is held in memory at a time.
+
+    Args:
+        stream: The binary CSV stream (e.g. `UploadFile.file`). It is not closed.
+        encoding: The encoding of the stream, see `detect_encoding`.
+
+    Yields:
+        A `DepositDTO` for each transaction row.
+    """
+    text = io.TextIOWrapper(stream, encoding=encoding)
+    try:
+        lines = _trim_lines(text, STANDBY_CSV_HEADER_LINES, STANDBY_CSV_FOOTER_LINES)
+        for line in csv.DictReader(lines):
+            yield DepositDTO(
+                amount=int(str(line["입금액"]).replace(",", "")),
+                deposit_time=kst2utc(
+                    datetime.strptime(line["거래일시"], "%Y.%m.%d %H:%M:%S")
+                ),
+                deposit_name=line["보낸분/받는분"],
+            )
+    finally:
+        text.detach()
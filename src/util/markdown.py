@@ -0,0 +1,36 @@
+import re
+
+_FENCE = re.compile(r"^\s*(```|~~~).*$", re.MULTILINE)
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_LINE_PREFIX = re.compile(
+    r"^\s{0,3}(?:#{1,6}\s+|>\s?|[-*+]\s+|\d+[.)]\s+)", re.MULTILINE
+)
+_HORIZONTAL_RULE = re.compile(r"^\s*([-*_])(?:\s*\1){2,}\s*$", re.MULTILINE)
+_EMPHASIS = re.compile(r"\*{1,3}|~~|`+|(?<!\w)_{1,3}|_{1,3}(?!\w)")
+
+
+def strip_markdown(content: str) -> str:
+    """Reduces markdown to its plain text, keeping link and image labels."""
+    text = _FENCE.sub("", content)
+    text = _IMAGE.sub(r"\1", text)
+    text = _LINK.sub(r"\1", text)
+    text = _HTML_TAG.sub("", text)
+    text = _HORIZONTAL_RULE.sub("", text)
+    text = _LINE_PREFIX.sub("", text)
+    return _EMPHASIS.sub("", text)
+
+
+def make_excerpt(content: str, length: int) -> str:
+    """Returns the first `length` characters of `content` with whitespace collapsed."""
+    text = " ".join(content.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rstrip() + "…"
+
+
+def summarize_markdown(content: str, length: int) -> tuple[str, int]:
+    """Returns the plain-text excerpt of `content` and its word count."""
+    text = strip_markdown(content)
+    return make_excerpt(text, length), len(text.split())
@@ -0,0 +1,19 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Encodes a `(created_at, id)` keyset position as an opaque url-safe string."""
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of `encode_cursor`. Raises ValueError on a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
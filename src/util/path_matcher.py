@@ -0,0 +1,57 @@
+import re
+from collections import defaultdict
+from typing import Iterable
+
+
+def like_to_regex(pattern: str) -> str:
+    """
+    Translates a PostgreSQL LIKE pattern into an equivalent regular expression.
+    `%` matches any sequence, `_` matches a single character and a backslash
+    escapes the following character.
+    """
+    parts: list[str] = []
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            parts.append(re.escape(ch))
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == "%":
+            parts.append(".*")
+        elif ch == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(ch))
+    if escaped:
+        parts.append(re.escape("\\"))
+    return "".join(parts)
+
+
+class LikePatternMatcher:
+    """
+    Matches (method, path) pairs against a set of (method, LIKE pattern) rules in
+    memory. Patterns without wildcards are looked up in a set; the remaining
+    patterns of each method are compiled into a single alternation regex.
+    """
+
+    def __init__(self, rules: Iterable[tuple[str, str]]) -> None:
+        literals: dict[str, set[str]] = defaultdict(set)
+        wildcards: dict[str, list[str]] = defaultdict(list)
+        for method, pattern in rules:
+            if any(ch in pattern for ch in "%_\\"):
+                wildcards[method].append(like_to_regex(pattern))
+            else:
+                literals[method].add(pattern)
+
+        self._literals = dict(literals)
+        self._regexes = {
+            method: re.compile("|".join(f"(?:{r})" for r in regexes), re.DOTALL)
+            for method, regexes in wildcards.items()
+        }
+
+    def matches(self, method: str, path: str) -> bool:
+        if path in self._literals.get(method, ()):
+            return True
+        regex = self._regexes.get(method)
+        return regex is not None and regex.fullmatch(path) is not None
@@ -3,11 +3,12 @@ import re
 import uuid
 from datetime import datetime
 
-import requests
+import httpx
 from fastapi import HTTPException, UploadFile
 
 from src.core import get_settings
 
+from .cache import TTLCache
 from .helper import split_filename
 
 
@@ -38,53 +39,127 @@ def is_valid_student_id(student_id: str) -> bool:
     return 1946 <= year <= _current_year
 
 
-def is_valid_img_url(url: str, timeout: int = 5) -> bool:
+IMG_SNIFF_BYTES = 32  # enough for every signature in _IMAGE_SIGNATURES
+IMG_URL_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+_img_url_verdicts: TTLCache[str, bool] = TTLCache(maxsize=1024, ttl=3600)
+_IMG_URL_INVALID_TTL = 300  # a broken link may be fixed soon; retry sooner
+# shared so that checks against the same host reuse a kept-alive connection
+_img_url_client: httpx.AsyncClient | None = None
+
+_IMAGE_SIGNATURES: tuple[tuple[int, bytes], ...] = (
+    (0, b"\x89PNG\r\n\x1a\n"),
+    (0, b"\xff\xd8\xff"),  # JPEG
+    (0, b"GIF87a"),
+    (0, b"GIF89a"),
+    (0, b"BM"),  # BMP
+    (0, b"II*\x00"),  # TIFF, little endian
+    (0, b"MM\x00*"),  # TIFF, big endian
+    (0, b"\x00\x00\x01\x00"),  # ICO
+    (8, b"WEBP"),  # RIFF....WEBP
+    (4, b"ftypavif"),
+    (4, b"ftypavis"),
+    (4, b"ftypheic"),
+    (4, b"ftypmif1"),
+)
+
+
+def sniff_image(head: bytes) -> bool:
+    """Checks the leading bytes of a file against well-known raster image signatures."""
+    return any(head.startswith(magic, offset) for offset, magic in _IMAGE_SIGNATURES)
+
+
+async def is_valid_img_url(url: str) -> bool:
     """
     Checks if the given URL string is likely an image URL by:
     1. Performing basic string and scheme validation.
-    2. Making a synchronous HTTP GET request to the URL.
-    3. Inspecting the 'Content-Type' header of the response to ensure it's an image.
+    2. Making a ranged HTTP GET request for the first `IMG_SNIFF_BYTES` bytes.
+       The rest of the body is never read, even if the server ignores `Range`.
+    3. Inspecting the 'Content-Type' header and the magic number of those bytes.
+       Text-based images (SVG) are accepted by their 'Content-Type' alone, and an
+       image served as 'application/octet-stream' is accepted by its magic number.
 
-    This provides a more robust validation than just checking file extensions.
+    Verdicts are cached per URL, invalid ones for a shorter time. Network errors
+    are not cached.
 
     Args:
         url (str): The URL string to validate.
-        timeout (int): The maximum time (in seconds) to wait for the HTTP request to complete.
 
     Returns:
-        bool: True if the URL appears to be a valid image URL (based on content type), False otherwise.
+        bool: True if the URL appears to be a valid image URL, False otherwise.
     """
     if not isinstance(url, str):
         return False
     if not (url.startswith("http://") or url.startswith("https://")):
         return False
 
+    cached = _img_url_verdicts.get(url)
+    if cached is not None:
+        return cached
+
     try:
-        response = requests.get(url, allow_redirects=True, timeout=timeout)
-        response.raise_for_status()
-        content_type = response.headers.get("Content-Type", "").lower()
-        return content_type.startswith("image/")
-    except requests.exceptions.RequestException:
-        return False
+        valid = await _fetch_and_sniff(url)
+    except httpx.TransportError:
+        return False  # timeouts and connection errors are not cached
     except Exception:
-        return False
+        valid = False
+    _img_url_verdicts.set(url, valid, None if valid else _IMG_URL_INVALID_TTL)
+    return valid
+
+
+def _get_img_url_client() -> httpx.AsyncClient:
+    global _img_url_client
+    if _img_url_client is None or _img_url_client.is_closed:
+        _img_url_client = httpx.AsyncClient(
+            timeout=IMG_URL_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, keepalive_expiry=30),
+        )
+    return _img_url_client
 
 
-async def validate_and_read_file(
+async def close_img_url_client() -> None:
+    """Closes the client shared by `is_valid_img_url`; called by the app lifespan."""
+    global _img_url_client
+    if _img_url_client is not None:
+        await _img_url_client.aclose()
+        _img_url_client = None
+
+
+async def _fetch_and_sniff(url: str) -> bool:
+    headers = {
+        "Range": f"bytes=0-{IMG_SNIFF_BYTES - 1}",
+        "Accept": "image/*",
+        "Accept-Encoding": "identity",
+    }
+    client = _get_img_url_client()
+    async with client.stream("GET", url, headers=headers) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").lower()
+        if content_type.startswith("image/svg"):
+            return True
+        head = b""
+        async for chunk in response.aiter_bytes():
+            head += chunk
+            if len(head) >= IMG_SNIFF_BYTES:
+                break
+    # some servers label every download as octet-stream or send no type at all
+    return sniff_image(head[:IMG_SNIFF_BYTES]) and (
+        content_type.startswith(("image/", "application/octet-stream"))
+        or not content_type
+    )
+
+
+def validate_upload_file(
     file: UploadFile,
     *,
     valid_mime_type: str = "",
     valid_ext: frozenset[str] = frozenset(),
-) -> tuple[bytes, str, str, str]:
+) -> tuple[str, str, str]:
     """
     Validates an uploaded file against specified MIME type, extension, and size
-    limits, then asynchronously reads its content.
-
-    This function performs the following checks:
-    1. Ensures the file's MIME type is provided and starts with `valid_mime_type`.
-    2. Ensures the file has a filename.
-    3. Ensures the file's extension is one of the extensions in `valid_ext`.
-    4. Ensures the file size does not exceed the limit set by `get_settings().file_max_size`.
+    limits without reading it, so that the caller can stream it to disk (see
+    `src.storage.stage_upload`). The size limit is checked against `file.size`,
+    which Starlette records while spooling the upload.
 
     Args:
         file: The uploaded file object (e.g., from FastAPI's `File` dependency).
@@ -102,11 +177,7 @@ async def validate_and_read_file(
             - 413 (Payload Too Large): If the file size exceeds the configured maximum.
 
     Returns:
-        A tuple containing:
-        - content (bytes): The binary content of the file.
-        - basename (str): The base name of the file (without the extension).
-        - ext (str): The file extension (without the leading dot).
-        - file.content_type (str): The MIME type of the file.
+        A tuple containing the base name, the extension and the MIME type of the file.
     """
     if file.content_type is None or not file.content_type.startswith(valid_mime_type):
         raise HTTPException(
@@ -119,10 +190,9 @@ async def validate_and_read_file(
         raise HTTPException(
             400, detail=f"cannot upload if the extension is not {valid_ext}"
         )
-    content = await file.read()
-    if len(content) > get_settings().file_max_size:
+    if file.size is not None and file.size > get_settings().file_max_size:
         raise HTTPException(
             413,
             detail=f"cannot upload file larger than {get_settings().file_max_size} bytes",
         )
-    return content, basename, ext, file.content_type
+    return basename, ext, file.content_type
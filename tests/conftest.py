@@ -27,9 +27,11 @@ def run_script(script_path: Path, *args: str) -> None:
 
 from main import app
 from src.core import get_settings
-from src.db import DBSessionFactory, get_user_role_level
+from src.db import DBSessionFactory, clear_user_cache, get_user_role_level
 from src.db.engine import engine
 from src.model import Base, CheckUserStatusRule, HTTPMethod, Major, User, UserRole
+from src.repositories import invalidate_blacklist_rule_cache
+from src.storage import article_content_store
 
 ROLE_DATA = [
     (0, "lowest", "lowest_kor"),
@@ -71,6 +73,9 @@ def reset_db_schema():
     finally:
         session.close()
     get_user_role_level.cache_clear()
+    clear_user_cache()
+    invalidate_blacklist_rule_cache()
+    article_content_store.clear()
 
 
 @pytest.fixture
@@ -143,6 +148,7 @@ def create_status_rule(db_session) -> Callable[..., CheckUserStatusRule]:
         db_session.add(rule)
         db_session.commit()
         db_session.refresh(rule)
+        invalidate_blacklist_rule_cache()
         return rule
 
     return _create_rule
@@ -0,0 +1,212 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from src.model import Article, Board
+from src.storage import article_content_store
+
+
+def test_article_page_walks_board_with_cursor(
+    api_client, build_headers, create_user, db_session
+):
+    """게시글 페이지 API가 최신순으로 cursor를 따라 모든 글을 한 번씩 반환하는지 확인한다."""
+    user, _ = create_user()
+    board = Board(name="free", description="free board")
+    db_session.add(board)
+    db_session.commit()
+    base = datetime(2025, 1, 1)
+    for i in range(5):
+        db_session.add(
+            Article(
+                title=f"article-{i}",
+                author_id=user.id,
+                board_id=board.id,
+                created_at=base + timedelta(minutes=i // 2),
+            )
+        )
+    db_session.commit()
+
+    titles: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "content": "none"}
+        if cursor:
+            params["cursor"] = cursor
+        response = api_client.get(
+            f"/api/articles/{board.id}/page", params=params, headers=build_headers()
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert all(item["content"] is None for item in body["items"])
+        titles.extend(item["title"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert titles == [f"article-{i}" for i in (4, 3, 2, 1, 0)]
+
+    invalid = api_client.get(
+        f"/api/articles/{board.id}/page",
+        params={"cursor": "not-a-cursor"},
+        headers=build_headers(),
+    )
+    assert invalid.status_code == 400
+
+
+def test_article_page_excerpt_is_precomputed_on_write(
+    api_client, build_headers, create_user, db_session
+):
+    """게시글 작성 시 마크다운을 제거한 미리보기와 단어 수가 저장되어 excerpt 모드로 반환되는지 확인한다."""
+    _, token = create_user(role_level=500)
+    board = Board(name="free", description="free board")
+    db_session.add(board)
+    db_session.commit()
+
+    created = api_client.post(
+        "/api/article/create",
+        json={
+            "title": "hello",
+            "content": "# 제목\n\n**굵은** 글씨와 [링크](https://example.com)",
+            "board_id": board.id,
+        },
+        headers=build_headers(token),
+    )
+    assert created.status_code == 201
+
+    response = api_client.get(
+        f"/api/articles/{board.id}/page",
+        params={"content": "excerpt"},
+        headers=build_headers(),
+    )
+
+    assert response.status_code == 200
+    [item] = response.json()["items"]
+    assert item["content"] == "제목 굵은 글씨와 링크"
+    assert item["word_count"] == 4
+
+
+def test_updated_article_content_is_served_from_new_blob(
+    api_client, build_headers, create_user, db_session
+):
+    """게시글 수정 후 조회 시 새 content가 반환되고, 동일한 content는 같은 blob을 공유하는지 확인한다."""
+    user, token = create_user(role_level=500)
+    board = Board(name="free", description="free board")
+    db_session.add(board)
+    db_session.commit()
+
+    ids = []
+    for _ in range(2):
+        created = api_client.post(
+            "/api/article/create",
+            json={"title": "same", "content": "same body", "board_id": board.id},
+            headers=build_headers(token),
+        )
+        assert created.status_code == 201
+        ids.append(created.json()["id"])
+    first, second = (db_session.get(Article, id) for id in ids)
+    assert first.content_hash is not None
+    assert first.content_hash == second.content_hash
+
+    updated = api_client.post(
+        f"/api/article/update/{ids[0]}",
+        json={"title": "same", "content": "new body", "board_id": board.id},
+        headers=build_headers(token),
+    )
+    assert updated.status_code == 204
+
+    response = api_client.get(f"/api/article/{ids[0]}", headers=build_headers())
+    assert response.status_code == 200
+    assert response.json()["content"] == "new body"
+    other = api_client.get(f"/api/article/{ids[1]}", headers=build_headers())
+    assert other.json()["content"] == "same body"
+
+
+def test_article_and_board_list_answer_conditional_get_with_304(
+    api_client, build_headers, create_user, db_session
+):
+    """ETag을 If-None-Match로 다시 보내면 304를 반환하고, 수정 후에는 새 본문을 반환하는지 확인한다."""
+    _, token = create_user(role_level=500)
+    board = Board(name="free", description="free board")
+    db_session.add(board)
+    db_session.commit()
+    created = api_client.post(
+        "/api/article/create",
+        json={"title": "t", "content": "v1", "board_id": board.id},
+        headers=build_headers(token),
+    )
+    article_id = created.json()["id"]
+
+    first = api_client.get(f"/api/article/{article_id}", headers=build_headers())
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+    etag = first.headers["etag"]
+    cached = api_client.get(
+        f"/api/article/{article_id}",
+        headers={**build_headers(), "if-none-match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    api_client.post(
+        f"/api/article/update/{article_id}",
+        json={"title": "t", "content": "v2", "board_id": board.id},
+        headers=build_headers(token),
+    )
+    changed = api_client.get(
+        f"/api/article/{article_id}",
+        headers={**build_headers(), "if-none-match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.json()["content"] == "v2"
+
+    boards = api_client.get("/api/boards", headers=build_headers())
+    assert boards.status_code == 200
+    boards_cached = api_client.get(
+        "/api/boards",
+        headers={**build_headers(), "if-none-match": boards.headers["etag"]},
+    )
+    assert boards_cached.status_code == 304
+
+
+def test_failed_content_write_leaves_article_unchanged(
+    api_client, build_headers, create_user, db_session, monkeypatch
+):
+    """본문 저장에 실패하면 게시글을 만들거나 고치지 않고 오류를 내는지 확인한다."""
+    _, token = create_user(role_level=500)
+    headers = build_headers(token)
+    board = Board(name="free", description="free board")
+    db_session.add(board)
+    db_session.commit()
+    created = api_client.post(
+        "/api/article/create",
+        json={"title": "old", "content": "old body", "board_id": board.id},
+        headers=headers,
+    )
+    article_id = created.json()["id"]
+    old_hash = db_session.get(Article, article_id).content_hash
+
+    async def failing_write(content: str) -> str:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(article_content_store, "write", failing_write)
+    with pytest.raises(OSError):
+        api_client.post(
+            "/api/article/create",
+            json={"title": "new", "content": "new body", "board_id": board.id},
+            headers=headers,
+        )
+    with pytest.raises(OSError):
+        api_client.post(
+            f"/api/article/update/{article_id}",
+            json={"title": "new", "content": "new body", "board_id": board.id},
+            headers=headers,
+        )
+
+    db_session.expire_all()
+    assert db_session.scalars(select(Article)).all() == [
+        db_session.get(Article, article_id)
+    ]
+    article = db_session.get(Article, article_id)
+    assert (article.title, article.content_hash) == ("old", old_hash)
@@ -1,3 +1,13 @@
+import io
+import time
+
+from PIL import Image
+
+from src.db import DBSessionFactory, cache_user, call_after_commit, get_cached_user
+from src.db.engine import Transaction
+from src.model import CheckUserStatusRule, User
+from src.repositories.check_user_status_rule import CheckUserStatusRuleRepository
+from src.repositories.user import UserRepository
 from tests.types import HTTPMethod
 
 
@@ -50,3 +60,108 @@ def test_user_status_rule_allows_other_statuses(
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
+
+
+def test_user_status_change_applies_to_next_request(
+    api_client, build_headers, create_status_rule, create_user
+):
+    """상태가 변경된 사용자의 다음 요청에 변경된 상태가 바로 반영되는지 확인한다."""
+    create_status_rule(method=HTTPMethod.GET, path="/api/majors")
+    user, token = create_user(is_active=True)
+    _, executive_token = create_user(role_level=500)
+
+    first = api_client.get("/api/majors", headers=build_headers(token))
+    assert first.status_code == 200
+
+    response = api_client.post(
+        f"/api/executive/user/{user.id}",
+        json={"is_active": False, "is_banned": True},
+        headers=build_headers(executive_token),
+    )
+    assert response.status_code == 204
+
+    second = api_client.get("/api/majors", headers=build_headers(token))
+    assert second.status_code == 403
+
+
+def test_user_cache_is_invalidated_after_commit(create_user, make_jwt_token):
+    """사용자 변경은 커밋된 뒤에 캐시에서 지워져, 커밋 전에 다시 캐시된 옛 값이 남지 않는지 확인한다."""
+    user, _ = create_user()
+    token = make_jwt_token(user.id)
+    exp = time.time() + 60
+    session = DBSessionFactory().make_session()
+    try:
+        repository = UserRepository(session, Transaction(session))
+        changed = session.get(User, user.id)
+        changed.is_active = False
+        repository.update(changed)
+        # 커밋 전에 다른 요청이 옛 값을 읽어 캐시한 상황
+        cache_user(token, user, exp)
+        assert get_cached_user(token) is not None
+
+        session.rollback()
+        assert get_cached_user(token) is not None
+
+        repository.update(changed)
+        session.commit()
+        assert get_cached_user(token) is None
+    finally:
+        session.close()
+
+
+def test_callbacks_run_only_after_commit(db_session):
+    """커밋 뒤에 실행할 작업이 롤백되면 버려지고, 커밋되면 한 번만 실행되는지 확인한다."""
+    calls: list[str] = []
+
+    db_session.get(User, "none")  # begins the transaction
+    call_after_commit(db_session, lambda: calls.append("rolled back"))
+    db_session.rollback()
+    call_after_commit(db_session, lambda: calls.append("committed"))
+    assert calls == []
+    db_session.commit()
+    db_session.commit()
+
+    assert calls == ["committed"]
+
+
+def test_replaced_profile_picture_is_removed_after_commit(
+    api_client, build_headers, create_user, tmp_path, monkeypatch
+):
+    """프로필 사진 파일을 바꾸면 변경이 커밋된 뒤 이전 파일을 지우는지 확인한다."""
+    monkeypatch.setattr("src.services.user.PFP_DIR", str(tmp_path))
+    _, token = create_user()
+    headers = build_headers(token)
+
+    def upload(color: str) -> None:
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 8), color).save(buffer, "PNG")
+        response = api_client.post(
+            "/api/user/update-pfp-file",
+            headers=headers,
+            files={"file": ("pfp.png", buffer.getvalue(), "image/png")},
+        )
+        assert response.status_code < 300
+
+    upload("red")
+    [first] = [p for p in tmp_path.iterdir() if p.suffix == ".png"]
+    upload("blue")
+
+    pictures = [p for p in tmp_path.iterdir() if p.suffix == ".png"]
+    assert len(pictures) == 1 and pictures[0] != first
+
+
+def test_status_rule_cache_is_invalidated_after_commit(db_session):
+    """규칙 변경은 커밋된 뒤에 매처 캐시를 비워, 커밋 전에 옛 규칙으로 다시 만든 매처가 남지 않는지 확인한다."""
+    session = DBSessionFactory().make_session()
+    try:
+        repository = CheckUserStatusRuleRepository(session, Transaction(session))
+        repository.create(CheckUserStatusRule(method=HTTPMethod.GET, path="/api/x"))
+        # 커밋 전에 다른 요청이 옛 규칙으로 매처를 만든 상황
+        reader = CheckUserStatusRuleRepository(db_session, Transaction(db_session))
+        assert not reader.is_blacklisted("GET", "/api/x")
+
+        session.commit()
+        db_session.rollback()  # 다음 요청처럼 새 트랜잭션에서 읽는다
+        assert reader.is_blacklisted("GET", "/api/x")
+    finally:
+        session.close()
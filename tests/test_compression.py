@@ -0,0 +1,151 @@
+import gzip
+import json
+
+import brotli
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+
+from src.core import get_settings
+from src.middleware import JSONCompressionMiddleware
+
+MINIMUM_SIZE = 1024
+LARGE = {"items": [{"id": i, "title": f"article-{i}"} for i in range(100)]}
+LARGE_BODY = json.dumps(LARGE).encode()
+ETAG = '"large-v1"'
+
+
+def _make_app() -> Starlette:
+    async def small(request):
+        return JSONResponse({"ok": True})
+
+    async def large(request):
+        return Response(
+            LARGE_BODY, media_type="application/json", headers={"ETag": ETAG}
+        )
+
+    async def encoded(request):
+        return Response(
+            gzip.compress(LARGE_BODY),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    async def text(request):
+        return PlainTextResponse("x" * MINIMUM_SIZE * 4)
+
+    app = Starlette(
+        routes=[
+            Route("/small", small),
+            Route("/large", large),
+            Route("/encoded", encoded),
+            Route("/text", text),
+        ]
+    )
+    app.add_middleware(JSONCompressionMiddleware, minimum_size=MINIMUM_SIZE)
+    return app
+
+
+@pytest.fixture
+def client():
+    with TestClient(_make_app()) as test_client:
+        yield test_client
+
+
+def _raw(
+    client: TestClient,
+    url: str,
+    accept_encoding: str | None,
+    headers: dict[str, str] | None = None,
+):
+    """httpx의 자동 해제 없이 압축된 본문 그대로 받는다."""
+    headers = {**(headers or {}), "Accept-Encoding": accept_encoding or ""}
+    with client.stream("GET", url, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("*", "br"),
+        ("identity", None),
+        ("br;q=0, gzip;q=0", None),
+        (None, None),
+    ],
+)
+def test_json_compression_negotiates_encoding(client, accept_encoding, expected):
+    """Accept-Encoding의 q 값에 따라 br, gzip 또는 압축 없음을 고르는지 확인한다."""
+    response, body = _raw(client, "/large", accept_encoding)
+
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(body)
+    decoded = {"br": brotli.decompress, "gzip": gzip.decompress}.get(
+        expected, lambda data: data
+    )(body)
+    assert decoded == LARGE_BODY
+    if expected is not None:
+        assert len(body) < len(LARGE_BODY)
+    # 압축한 표현은 원본과 바이트가 달라 강한 ETag를 함께 쓸 수 없다
+    assert response.headers["etag"] == (ETAG if expected is None else f"W/{ETAG}")
+
+
+def test_json_compression_skips_small_and_non_json_bodies(client):
+    """기준 크기보다 작은 JSON과 JSON이 아닌 응답은 압축하지 않는지 확인한다."""
+    small, body = _raw(client, "/small", "br, gzip")
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+    assert json.loads(body) == {"ok": True}
+
+    text, body = _raw(client, "/text", "br, gzip")
+    assert "content-encoding" not in text.headers
+    assert "vary" not in text.headers
+    assert len(body) == MINIMUM_SIZE * 4
+
+
+def test_json_compression_passes_encoded_responses_through(client):
+    """이미 Content-Encoding이 있는 응답은 다시 압축하지 않고 그대로 보내는지 확인한다."""
+    response, body = _raw(client, "/encoded", "br")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == LARGE_BODY
+
+
+def test_w_page_falls_back_without_precompressed_copy(
+    api_client, build_headers, create_user, tmp_path, monkeypatch
+):
+    """W 페이지는 미리 압축한 사본을 보내고, .br/.gz 사본이 없으면 원본을 그대로 보내는지 확인한다."""
+    settings = get_settings().model_copy(update={"w_html_dir": str(tmp_path)})
+    monkeypatch.setattr("src.services.w.get_settings", lambda: settings)
+    _, token = create_user(role_level=500)
+    headers = build_headers(token)
+    html = ("<html><body>" + "<p>hello</p>" * 200 + "</body></html>").encode()
+    created = api_client.post(
+        "/api/executive/w/create",
+        headers=headers,
+        files={"file": ("page.html", html, "text/html")},
+    )
+    assert created.status_code == 201
+    assert (tmp_path / "page.html.br").exists()
+    assert (tmp_path / "page.html.gz").exists()
+
+    response, body = _raw(api_client, "/api/w/page", "gzip, br", headers)
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert brotli.decompress(body) == html
+    response, body = _raw(api_client, "/api/w/page", "gzip", headers)
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == html
+
+    (tmp_path / "page.html.br").unlink()
+    (tmp_path / "page.html.gz").unlink()
+    response, body = _raw(api_client, "/api/w/page", "gzip, br", headers)
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert body == html
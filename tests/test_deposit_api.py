@@ -0,0 +1,172 @@
+import pytest
+from sqlalchemy import select
+
+from src.core import get_settings
+from src.model import (
+    Enrollment,
+    KeyValue,
+    SCSCGlobalStatus,
+    SCSCStatus,
+    StandbyReqTbl,
+)
+
+DEPOSIT_URL = "/api/executive/user/standby/process/deposit"
+STANDBY_CSV_URL = "/api/executive/user/standby/process"
+
+
+@pytest.fixture(autouse=True)
+def enrollment_policy(db_session):
+    db_session.add(
+        SCSCGlobalStatus(id=1, status=SCSCStatus.active, year=2025, semester=2)
+    )
+    db_session.add(KeyValue(key="enrollment_grant_until", value="2025-2"))
+    db_session.commit()
+
+
+@pytest.fixture
+def create_member(create_user, db_session):
+    def _create_member(name: str, phone_tail: str = "00", **kwargs):
+        user, _ = create_user(**kwargs)
+        user.name = name
+        user.phone = user.phone[:-2] + phone_tail
+        db_session.commit()
+        return user
+
+    return _create_member
+
+
+def _deposit(name: str, amount: int | None = None) -> dict:
+    return {
+        "amount": get_settings().enrollment_fee if amount is None else amount,
+        "deposit_time": "2025-09-01T03:00:00Z",
+        "deposit_name": name,
+    }
+
+
+def _enrollments(db_session, user_id: str) -> list[tuple[int, int]]:
+    db_session.expire_all()
+    return sorted(
+        (row.year, row.semester)
+        for row in db_session.scalars(
+            select(Enrollment).where(Enrollment.user_id == user_id)
+        )
+    )
+
+
+def test_process_deposit_result_codes(
+    api_client, build_headers, create_user, create_member, db_session
+):
+    """입금 기록 하나를 처리할 때 상황별 결과 코드(200/402/404/409/412/413)를 반환하는지 확인한다."""
+    _, token = create_user(role_level=500)
+    headers = build_headers(token)
+    fee = get_settings().enrollment_fee
+
+    waiting = create_member("김대기", "12", role_level=200, is_active=False)
+    db_session.add(
+        StandbyReqTbl(
+            standby_user_id=waiting.id, user_name="김대기", deposit_name="김대기12"
+        )
+    )
+    db_session.commit()
+    create_member("이부족")
+    create_member("박초과")
+    create_member("최동명", "11")
+    create_member("최동명", "22")
+    enrolled = create_member("정등록")
+    db_session.add(Enrollment(year=2025, semester=2, user_id=enrolled.id))
+    db_session.commit()
+
+    def process(name: str, amount: int = fee) -> dict:
+        response = api_client.post(
+            DEPOSIT_URL, headers=headers, json=_deposit(name, amount)
+        )
+        assert response.status_code == 200
+        return response.json()["result"]
+
+    result = process("김대기12")
+    assert result["result_code"] == 200
+    assert [user["id"] for user in result["users"]] == [waiting.id]
+    assert _enrollments(db_session, waiting.id) == [(2025, 2)]
+    db_session.refresh(waiting)
+    assert waiting.is_active
+    assert db_session.get(StandbyReqTbl, waiting.id).is_checked
+
+    assert process("이부족", fee - 1)["result_code"] == 402
+    assert process("박초과", fee + 1)["result_code"] == 413
+    assert process("없는사람")["result_code"] == 404
+    duplicated = process("최동명")
+    assert duplicated["result_code"] == 409
+    assert len(duplicated["users"]) == 2
+    assert process("정등록")["result_code"] == 412
+    # 이미 처리된 입금 대기 요청은 다시 매칭되지 않고, 등록된 사용자는 412가 된다
+    assert process("김대기12")["result_code"] == 412
+
+
+def _standby_csv(rows: list[tuple[str, str, int]]) -> bytes:
+    lines = ["거래내역 조회", "계좌번호,000-000000-00-000", "조회기간,2025.09.01", ""]
+    lines.append("거래일시,적요,보낸분/받는분,입금액,출금액,잔액")
+    for time, name, amount in rows:
+        lines.append(f'{time},입금,{name},"{amount:,}",0,0')
+    lines.append(f"합계,,,{len(rows)},0,0")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def test_process_standby_list_spans_batches(
+    api_client, build_headers, create_user, create_member, db_session, monkeypatch
+):
+    """입금 내역 CSV가 여러 묶음에 걸쳐도 앞 묶음의 처리 결과를 이어서 대조하는지 확인한다."""
+    monkeypatch.setattr("src.services.user.DEPOSIT_BATCH_SIZE", 2)
+    _, token = create_user(role_level=500)
+    fee = get_settings().enrollment_fee
+
+    first = create_member("한첫째", "34", role_level=200)
+    db_session.add(
+        StandbyReqTbl(
+            standby_user_id=first.id, user_name="한첫째", deposit_name="한첫째34"
+        )
+    )
+    second = create_member("한둘째", role_level=100)
+    # 최신 등록 학기(2025-2)를 기준으로 더 등록할 수 없는 사용자
+    latest = create_member("한최신")
+    db_session.add_all(
+        [
+            Enrollment(year=2024, semester=1, user_id=latest.id),
+            Enrollment(year=2025, semester=2, user_id=latest.id),
+        ]
+    )
+    db_session.commit()
+
+    rows = [
+        ("2025.09.01 10:00:00", "한첫째34", fee),
+        ("2025.09.01 11:00:00", "한둘째", fee),
+        ("2025.09.01 12:00:00", "한최신", fee),
+        ("2025.09.01 13:00:00", "한둘째", fee),
+        ("2025.09.01 14:00:00", "없는사람", fee),
+    ]
+    response = api_client.post(
+        STANDBY_CSV_URL,
+        headers=build_headers(token),
+        files={"file": ("deposits.csv", _standby_csv(rows), "text/csv")},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [result["result_code"] for result in body["results"]] == [
+        200,
+        200,
+        412,
+        412,
+        404,
+    ]
+    assert body["cnt_succeeded_records"] == 2
+    assert body["cnt_failed_records"] == 3
+    # 거래일시는 KST로 읽어 UTC로 변환한다
+    assert body["results"][0]["record"]["deposit_time"].startswith(
+        "2025-09-01T01:00:00"
+    )
+
+    assert _enrollments(db_session, first.id) == [(2025, 2)]
+    assert _enrollments(db_session, second.id) == [(2025, 2)]
+    db_session.refresh(second)
+    assert second.role == 300  # 휴회원은 정회원으로 복귀한다
+    # 입금 대기 요청이 없던 사용자는 처리하면서 확인된 요청이 만들어진다
+    assert db_session.get(StandbyReqTbl, second.id).is_checked
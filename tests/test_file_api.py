@@ -0,0 +1,257 @@
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core import get_settings
+from src.model import FileMetadata
+
+PDF_BYTES = b"%PDF-1.4\n" + bytes(range(256)) * 64
+
+
+@pytest.fixture
+def file_settings(tmp_path, monkeypatch):
+    """파일 서비스가 임시 디렉터리에 저장하도록 설정을 바꾼다."""
+    (tmp_path / "download").mkdir()
+    (tmp_path / "photo").mkdir()
+    overrides = {
+        "file_dir": str(tmp_path / "download"),
+        "image_dir": str(tmp_path / "photo"),
+    }
+
+    def _override(**changes):
+        overrides.update(changes)
+        settings = get_settings().model_copy(update=overrides)
+        monkeypatch.setattr("src.services.file.get_settings", lambda: settings)
+
+    _override()
+    return _override
+
+
+@pytest.fixture
+def storage_dirs(tmp_path, file_settings):
+    return tmp_path / "download", tmp_path / "photo"
+
+
+def _upload_docs(api_client, headers, filename: str, content: bytes) -> dict:
+    response = api_client.post(
+        "/api/file/docs/upload",
+        headers=headers,
+        files={"file": (filename, content, "application/pdf")},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def _age(file_path, seconds: float) -> None:
+    past = time.time() - seconds
+    os.utime(file_path, (past, past))
+
+
+def test_identical_uploads_share_one_blob(
+    api_client, build_headers, create_user, storage_dirs, db_session
+):
+    """같은 내용의 문서를 두 번 올리면 파일은 하나만 저장하고 두 id가 함께 쓰는지 확인한다."""
+    file_dir, _ = storage_dirs
+    _, token = create_user()
+    headers = build_headers(token)
+
+    first = _upload_docs(api_client, headers, "first.pdf", PDF_BYTES)
+    second = _upload_docs(api_client, headers, "second.pdf", PDF_BYTES)
+    other = _upload_docs(api_client, headers, "other.pdf", PDF_BYTES + b"x")
+
+    assert len({first["id"], second["id"], other["id"]}) == 3
+    assert sorted(os.listdir(file_dir)) == sorted(
+        [f"{first['id']}.pdf", f"{other['id']}.pdf"]
+    )
+    assert db_session.get(FileMetadata, second["id"]).storage_name == (
+        f"{first['id']}.pdf"
+    )
+    for meta, filename in ((first, "first.pdf"), (second, "second.pdf")):
+        response = api_client.get(
+            f"/api/file/docs/download/{meta['id']}", headers=headers
+        )
+        assert response.status_code == 200
+        assert response.content == PDF_BYTES
+        assert filename in response.headers["content-disposition"]
+
+
+def test_compact_removes_only_orphans_past_grace_period(
+    api_client, build_headers, create_user, storage_dirs
+):
+    """정리 작업이 참조되는 파일과 유예 기간 안의 파일은 두고 오래된 고아 파일만 지우는지 확인한다."""
+    file_dir, image_dir = storage_dirs
+    _, token = create_user(role_level=500)
+    headers = build_headers(token)
+    kept = _upload_docs(api_client, headers, "kept.pdf", PDF_BYTES)
+    grace = get_settings().file_gc_grace_seconds
+
+    referenced = file_dir / f"{kept['id']}.pdf"
+    _age(referenced, grace * 2)
+    orphan_id = str(uuid.uuid4())
+    orphans = [image_dir / f"{orphan_id}.png", image_dir / f"{orphan_id}_w320.webp"]
+    recent = file_dir / f"{uuid.uuid4()}.pdf"
+    unrelated = file_dir / "README.txt"
+    for file_path in (*orphans, recent, unrelated):
+        file_path.write_bytes(b"data")
+    for file_path in (*orphans, unrelated):
+        _age(file_path, grace * 2)
+
+    response = api_client.post("/api/executive/file/compact", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"removed": 2, "hashed": 0, "repointed": 0}
+    assert not any(file_path.exists() for file_path in orphans)
+    assert referenced.exists() and recent.exists() and unrelated.exists()
+
+
+def test_compact_removes_stale_temp_files(
+    api_client, build_headers, create_user, storage_dirs, file_settings, tmp_path
+):
+    """중단된 업로드가 남긴 오래된 임시 파일만 지우고, 진행 중일 수 있는 최근 임시 파일은 두는지 확인한다."""
+    file_dir, image_dir = storage_dirs
+    w_dir = tmp_path / "w"
+    w_dir.mkdir()
+    file_settings(w_html_dir=str(w_dir))
+    _, token = create_user(role_level=500)
+    grace = get_settings().file_gc_grace_seconds
+
+    stale = [
+        file_dir / ".tmp-upload-a",
+        image_dir / ".tmp-variant-b",
+        w_dir / ".tmp-upload-c",
+    ]
+    recent = file_dir / ".tmp-upload-d"
+    for file_path in (*stale, recent):
+        file_path.write_bytes(b"partial")
+    for file_path in stale:
+        _age(file_path, grace * 2)
+
+    response = api_client.post(
+        "/api/executive/file/compact", headers=build_headers(token)
+    )
+
+    assert response.json() == {"removed": 3, "hashed": 0, "repointed": 0}
+    assert not any(file_path.exists() for file_path in stale)
+    assert recent.exists()
+
+
+def test_compact_deduplicates_files_uploaded_before_hashing(
+    api_client, build_headers, create_user, storage_dirs, file_settings, db_session
+):
+    """해시 없이 저장된 같은 내용의 파일을 가장 오래된 파일로 모으고, 다음 실행에서 남은 사본을 지우는지 확인한다."""
+    file_dir, _ = storage_dirs
+    user, token = create_user(role_level=500)
+    headers = build_headers(token)
+    created_at = datetime(2025, 1, 1)
+    rows = [
+        FileMetadata(
+            id=str(uuid.uuid4()),
+            original_filename=f"legacy-{i}.pdf",
+            size=len(PDF_BYTES),
+            mime_type="application/pdf",
+            owner=user.id,
+            created_at=created_at + timedelta(days=i),
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    for row in rows:
+        (file_dir / f"{row.id}.pdf").write_bytes(PDF_BYTES)
+
+    response = api_client.post("/api/executive/file/compact", headers=headers)
+    assert response.json() == {"removed": 0, "hashed": 2, "repointed": 1}
+    db_session.expire_all()
+    assert {db_session.get(FileMetadata, row.id).storage_name for row in rows} == {
+        f"{rows[0].id}.pdf"
+    }
+
+    # 풀려난 사본은 커밋된 뒤의 다음 실행에서 유예 기간이 지나야 지운다
+    file_settings(file_gc_grace_seconds=0)
+    response = api_client.post("/api/executive/file/compact", headers=headers)
+    assert response.json() == {"removed": 1, "hashed": 0, "repointed": 0}
+    assert os.listdir(file_dir) == [f"{rows[0].id}.pdf"]
+    download = api_client.get(f"/api/file/docs/download/{rows[1].id}", headers=headers)
+    assert download.content == PDF_BYTES
+
+
+def test_docs_download_serves_byte_ranges(
+    api_client, build_headers, create_user, storage_dirs
+):
+    """문서 다운로드가 Range 요청에 206으로 일부만 보내고, 만족할 수 없는 범위에는 416을 반환하는지 확인한다."""
+    _, token = create_user()
+    headers = build_headers(token)
+    meta = _upload_docs(api_client, headers, "slides.pdf", PDF_BYTES)
+    url = f"/api/file/docs/download/{meta['id']}"
+    size = len(PDF_BYTES)
+
+    response = api_client.get(url, headers={**headers, "Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.content == PDF_BYTES[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{size}"
+    assert response.headers["accept-ranges"] == "bytes"
+
+    # 끊긴 다운로드를 If-Range로 이어 받는다
+    etag = response.headers["etag"]
+    rest = api_client.get(
+        url, headers={**headers, "Range": "bytes=200-", "If-Range": etag}
+    )
+    assert rest.status_code == 206
+    assert rest.content == PDF_BYTES[200:]
+    # 검증자가 다르면 파일 전체를 보낸다
+    stale = api_client.get(
+        url, headers={**headers, "Range": "bytes=200-", "If-Range": '"stale"'}
+    )
+    assert stale.status_code == 200
+    assert stale.content == PDF_BYTES
+
+    unsatisfiable = api_client.get(
+        url, headers={**headers, "Range": f"bytes={size}-{size + 10}"}
+    )
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{size}"
+
+
+def test_docs_download_keeps_non_ascii_filename(
+    api_client, build_headers, create_user, storage_dirs
+):
+    """한글 파일명을 Content-Disposition의 filename*로 그대로 돌려주는지 확인한다."""
+    _, token = create_user()
+    headers = build_headers(token)
+    meta = _upload_docs(api_client, headers, "발표 자료.pdf", PDF_BYTES)
+
+    response = api_client.get(f"/api/file/docs/download/{meta['id']}", headers=headers)
+
+    assert response.status_code == 200
+    disposition = response.headers["content-disposition"]
+    assert disposition.startswith("attachment;")
+    assert "filename*=utf-8''%EB%B0%9C%ED%91%9C%20%EC%9E%90%EB%A3%8C.pdf" in disposition
+
+
+def test_docs_download_revalidates_with_etag(
+    api_client, build_headers, create_user, storage_dirs
+):
+    """ETag와 Last-Modified로 조건부 요청하면 본문 없이 304를 반환하는지 확인한다."""
+    _, token = create_user()
+    headers = build_headers(token)
+    meta = _upload_docs(api_client, headers, "notes.pdf", PDF_BYTES)
+    url = f"/api/file/docs/download/{meta['id']}"
+
+    first = api_client.get(url, headers=headers)
+    assert first.headers["cache-control"] == "no-cache"
+    etag = first.headers["etag"]
+
+    cached = api_client.get(url, headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    since = api_client.get(
+        url, headers={**headers, "If-Modified-Since": first.headers["last-modified"]}
+    )
+    assert since.status_code == 304
+    changed = api_client.get(url, headers={**headers, "If-None-Match": '"other"'})
+    assert changed.status_code == 200
+    assert changed.content == PDF_BYTES
@@ -0,0 +1,103 @@
+from src.model import Board
+
+
+def _create_board(db_session, *, reading_permission_level: int = 0) -> Board:
+    board = Board(
+        name=f"board-{reading_permission_level}",
+        description="board",
+        reading_permission_level=reading_permission_level,
+    )
+    db_session.add(board)
+    db_session.commit()
+    return board
+
+
+def _create_article(api_client, build_headers, token, board, title, content) -> int:
+    response = api_client.post(
+        "/api/article/create",
+        json={"title": title, "content": content, "board_id": board.id},
+        headers=build_headers(token),
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_search_articles_ranks_and_respects_board_permission(
+    api_client, build_headers, create_user, db_session
+):
+    """게시글 검색이 제목 일치를 우선하고, 읽기 권한이 없는 게시판의 글은 제외하는지 확인한다."""
+    _, executive_token = create_user(role_level=500)
+    public = _create_board(db_session)
+    restricted = _create_board(db_session, reading_permission_level=500)
+    title_hit = _create_article(
+        api_client, build_headers, executive_token, public, "정기총회 안내", "일정"
+    )
+    body_hit = _create_article(
+        api_client,
+        build_headers,
+        executive_token,
+        public,
+        "공지",
+        "다음 주에 정기총회가 열립니다",
+    )
+    hidden = _create_article(
+        api_client,
+        build_headers,
+        executive_token,
+        restricted,
+        "정기총회 회의록",
+        "비공개",
+    )
+    _create_article(
+        api_client, build_headers, executive_token, public, "무관한 글", "내용"
+    )
+
+    anonymous = api_client.get(
+        "/api/search/articles", params={"q": "정기총회"}, headers=build_headers()
+    )
+    assert anonymous.status_code == 200
+    assert [item["id"] for item in anonymous.json()["items"]] == [title_hit, body_hit]
+
+    executive = api_client.get(
+        "/api/search/articles",
+        params={"q": "정기총회", "limit": 2},
+        headers=build_headers(executive_token),
+    )
+    body = executive.json()
+    assert {item["id"] for item in body["items"]} <= {title_hit, body_hit, hidden}
+    assert len(body["items"]) == 2
+    assert body["next_offset"] == 2
+
+
+def test_search_comments_finds_comment_content(
+    api_client, build_headers, create_user, db_session
+):
+    """댓글 검색이 댓글 내용을 찾고 삭제된 글의 댓글은 제외하는지 확인한다."""
+    _, token = create_user(role_level=500)
+    board = _create_board(db_session)
+    article_id = _create_article(
+        api_client, build_headers, token, board, "제목", "본문"
+    )
+    created = api_client.post(
+        "/api/comment/create",
+        json={
+            "content": "동아리방 열쇠는 어디에",
+            "article_id": article_id,
+            "parent_id": None,
+        },
+        headers=build_headers(token),
+    )
+    assert created.status_code == 201
+
+    response = api_client.get(
+        "/api/search/comments", params={"q": "열쇠"}, headers=build_headers()
+    )
+    assert [item["id"] for item in response.json()["items"]] == [created.json()["id"]]
+
+    api_client.post(
+        f"/api/executive/article/delete/{article_id}", headers=build_headers(token)
+    )
+    response = api_client.get(
+        "/api/search/comments", params={"q": "열쇠"}, headers=build_headers()
+    )
+    assert response.json()["items"] == []
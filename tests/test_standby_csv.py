@@ -0,0 +1,97 @@
+import io
+
+from src.util import STANDBY_CSV_ENCODINGS, detect_encoding, iter_standby_deposits
+from src.util.helper import _trim_lines
+
+HEADER_LINES = [
+    "거래내역 조회",
+    "계좌번호,000-000000-00-000",
+    "조회기간,2025.09.01",
+    "",
+]
+COLUMNS = "거래일시,적요,보낸분/받는분,입금액,출금액,잔액"
+FOOTER = "합계,,,0,0,0\n"
+CHUNK_SIZE = 8192  # io.TextIOWrapper reads the stream in chunks of this size
+
+
+def _csv(names: list[str]) -> str:
+    rows = [
+        f'2025.09.01 10:00:{i % 60:02d},입금,{name},"25,000",0,0'
+        for i, name in enumerate(names)
+    ]
+    return "\n".join([*HEADER_LINES, COLUMNS, *rows]) + "\n" + FOOTER
+
+
+def test_detect_encoding_reads_euc_kr_and_restores_position():
+    """euc-kr로 저장된 입금 내역을 euc-kr로 판별하고 스트림 위치를 되돌리는지 확인한다."""
+    stream = io.BytesIO(_csv(["홍길동12"]).encode("euc-kr"))
+
+    assert detect_encoding(stream, STANDBY_CSV_ENCODINGS) == "euc-kr"
+    assert stream.tell() == 0
+    assert detect_encoding(io.BytesIO("홍길동".encode()), STANDBY_CSV_ENCODINGS) == (
+        "utf-8"
+    )
+    assert detect_encoding(io.BytesIO(b"\xff\xfe\xff"), STANDBY_CSV_ENCODINGS) is None
+
+
+def test_detect_encoding_allows_character_cut_by_chunk():
+    """읽기 단위 경계에서 잘린 멀티바이트 문자 때문에 utf-8 판별이 실패하지 않는지 확인한다."""
+    data = "가나다".encode()  # 3 bytes per character
+    assert detect_encoding(io.BytesIO(data), STANDBY_CSV_ENCODINGS, 4) == "utf-8"
+    # 파일 끝에서 잘린 문자는 오류로 본다
+    assert detect_encoding(io.BytesIO(data[:4]), ("utf-8",), 64) is None
+
+
+def test_detect_encoding_reads_past_ascii_prefix():
+    """앞부분 64 KiB가 모두 ASCII여도 그 뒤의 euc-kr 행을 보고 euc-kr로 판별하는지 확인한다."""
+    ascii_rows = "".join(
+        f"2025.09.01 10:00:00,,user{i:05d},0,0,0\n" for i in range(2000)
+    )
+    data = ascii_rows.encode() + "홍길동,입금\n".encode("euc-kr")
+    assert len(ascii_rows) > 64 * 1024
+
+    stream = io.BytesIO(data)
+
+    assert detect_encoding(stream, STANDBY_CSV_ENCODINGS) == "euc-kr"
+    assert stream.tell() == 0
+
+
+def test_iter_standby_deposits_parses_euc_kr_without_closing_stream():
+    """euc-kr 입금 내역에서 머리말과 합계 행을 빼고 입금 기록만 읽는지 확인한다."""
+    stream = io.BytesIO(_csv(["홍길동12", "김철수"]).encode("euc-kr"))
+
+    deposits = list(iter_standby_deposits(stream, "euc-kr"))
+
+    assert [deposit.deposit_name for deposit in deposits] == ["홍길동12", "김철수"]
+    assert all(deposit.amount == 25000 for deposit in deposits)
+    # 거래일시는 KST로 읽어 UTC로 변환한다
+    assert deposits[0].deposit_time.hour == 1
+    assert not stream.closed
+
+
+def test_iter_standby_deposits_drops_footer_across_chunk_boundary():
+    """합계 행이 읽기 단위(8 KiB) 경계에 걸쳐도 입금 기록으로 읽지 않는지 확인한다."""
+    footer = FOOTER.encode("euc-kr")
+
+    def crosses_chunk(data: bytes) -> bool:
+        start = data.rindex(footer)
+        return start // CHUNK_SIZE != (len(data) - 1) // CHUNK_SIZE
+
+    # 합계 행이 경계에 걸칠 때까지 마지막 입금자명을 늘린다
+    names = [f"사용자{i:04d}" for i in range(164)]
+    while not crosses_chunk(_csv(names).encode("euc-kr")):
+        names[-1] += "가"
+
+    data = _csv(names).encode("euc-kr")
+    deposits = list(iter_standby_deposits(io.BytesIO(data), "euc-kr"))
+
+    assert [deposit.deposit_name for deposit in deposits] == names
+
+
+def test_trim_lines_keeps_only_body_lines():
+    """_trim_lines가 앞뒤 줄만 빼고 나머지를 순서대로 내보내는지 확인한다."""
+    lines = [f"line{i}" for i in range(6)]
+
+    assert list(_trim_lines(iter(lines), 2, 1)) == ["line2", "line3", "line4"]
+    assert list(_trim_lines(iter(lines), 0, 0)) == lines
+    assert list(_trim_lines(iter(lines[:3]), 2, 2)) == []